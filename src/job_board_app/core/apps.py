@@ -10,3 +10,8 @@ class CoreConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self) -> None:
+        """Connects signal receivers of the app."""
+
+        from core import signals  # noqa: F401  # pylint: disable=unused-import
@@ -5,7 +5,16 @@ DTO package attributes, classes, and functions.
 from .company import AddAddressDTO, AddCompanyDTO, AddCompanyProfileDTO
 from .login import LoginDTO
 from .registration import RegistrationDTO
-from .vacancy import AddVacancyDTO, ApplyVacancyDTO, SearchVacancyDTO, VacancyDataDTO
+from .vacancy import (
+    AddVacancyDTO,
+    ApplyVacancyDTO,
+    SearchVacancyDTO,
+    VacancyDataDTO,
+    VacancyFacetDTO,
+    VacancyImportErrorDTO,
+    VacancyImportResultDTO,
+    VacancyImportRowDTO,
+)
 
 __all__ = [
     "SearchVacancyDTO",
@@ -17,4 +26,8 @@ __all__ = [
     "LoginDTO",
     "ApplyVacancyDTO",
     "VacancyDataDTO",
+    "VacancyFacetDTO",
+    "VacancyImportRowDTO",
+    "VacancyImportErrorDTO",
+    "VacancyImportResultDTO",
 ]
@@ -8,7 +8,7 @@ core.presentation.forms.company module.
 
 from dataclasses import dataclass
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.uploadedfile import UploadedFile
 
 
 @dataclass
@@ -24,7 +24,7 @@ class AddCompanyDTO:
 class AddCompanyProfileDTO:
     """DTO for storing and transferring data from AddCompanyProfileForm."""
 
-    logo: InMemoryUploadedFile | None
+    logo: UploadedFile | None
     email: str
     founding_year: int
     description: str
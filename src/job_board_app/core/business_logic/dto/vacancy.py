@@ -5,11 +5,41 @@ DTOs are designed to move data between processes to reduce the number of method
 AddVacancyForm, SearchVacancyFrom forms are described in the core.presentation.web.forms.vacancy module.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from core.models import City, EmploymentFormat, Tag, Vacancy, WorkFormat
 from django.contrib.auth.models import AbstractBaseUser
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.uploadedfile import UploadedFile
+
+ICONTAINS_SEARCH_MODE = "icontains"
+FULLTEXT_SEARCH_MODE = "fulltext"
+FUZZY_SEARCH_MODE = "fuzzy"
+SEARCH_MODES = (
+    (ICONTAINS_SEARCH_MODE, "Substring match"),
+    (FULLTEXT_SEARCH_MODE, "Full-text (ranked)"),
+    (FUZZY_SEARCH_MODE, "Fuzzy name and company match"),
+)
+
+SALARY_RANGE_OVERLAPS = "overlaps"
+SALARY_RANGE_CONTAINS = "contains"
+SALARY_RANGE_WITHIN = "within"
+SALARY_RANGE_MODES = (
+    (SALARY_RANGE_OVERLAPS, "Salary range overlaps entered range"),
+    (SALARY_RANGE_CONTAINS, "Salary range contains entered range"),
+    (SALARY_RANGE_WITHIN, "Salary range is within entered range"),
+)
+
+CSV_IMPORT_FORMAT = "csv"
+NDJSON_IMPORT_FORMAT = "ndjson"
+IMPORT_FORMATS = (
+    (CSV_IMPORT_FORMAT, "CSV with a header row"),
+    (NDJSON_IMPORT_FORMAT, "Newline delimited JSON objects"),
+)
+
+LIST_SHAPE = "list"
+DETAIL_SHAPE = "detail"
+EXPORT_SHAPE = "export"
+VACANCY_SHAPES = (LIST_SHAPE, DETAIL_SHAPE, EXPORT_SHAPE)
 
 
 @dataclass
@@ -28,6 +58,17 @@ class SearchVacancyDTO:
     country: str
     city: str
     tag: str
+    query: str = ""
+    search_mode: str = ICONTAINS_SEARCH_MODE
+    salary_range_mode: str = ""
+
+
+@dataclass
+class VacancyFacetDTO:
+    """DTO for storing and transferring the number of found vacancies with a specific filter option."""
+
+    name: str
+    count: int
 
 
 @dataclass
@@ -46,7 +87,33 @@ class AddVacancyDTO:
     country: str
     city: str
     tags: str
-    attachment: InMemoryUploadedFile | None
+    attachment: UploadedFile | None
+
+
+@dataclass
+class VacancyImportRowDTO:
+    """DTO for storing and transferring a row of imported vacancies: validated vacancy data or validation errors."""
+
+    row: int
+    vacancy: AddVacancyDTO | None
+    errors: dict = field(default_factory=dict)
+
+
+@dataclass
+class VacancyImportErrorDTO:
+    """DTO for storing and transferring errors of a row that has not been imported."""
+
+    row: int
+    errors: dict
+
+
+@dataclass
+class VacancyImportResultDTO:
+    """DTO for storing and transferring the result of vacancies import."""
+
+    created: int = 0
+    failed: int = 0
+    errors: list[VacancyImportErrorDTO] = field(default_factory=list)
 
 
 @dataclass
@@ -67,4 +134,4 @@ class ApplyVacancyDTO:
     user: AbstractBaseUser | None
     vacancy: Vacancy | None
     cover_note: str
-    cv: InMemoryUploadedFile | None
+    cv: UploadedFile | None
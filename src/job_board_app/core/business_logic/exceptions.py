@@ -47,5 +47,13 @@ class WorkFormatNotExistError(Exception):
     """Exception that raises when Work format with passed name does not exist in the database."""
 
 
-class QRCodeServiceUnavailable(Exception):
+class ExternalServiceUnavailable(Exception):
+    """Exception that raises when an external service does not respond or its circuit breaker is open."""
+
+
+class QRCodeServiceUnavailable(ExternalServiceUnavailable):
     """Exception that raises when QR Code Service is unavailable."""
+
+
+class ImageVariantNotExistError(Exception):
+    """Exception that raises when image variant with passed name or format is not configured."""
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Any, Protocol
 
 from django.core.files.uploadedfile import InMemoryUploadedFile
 
@@ -6,3 +6,8 @@ from django.core.files.uploadedfile import InMemoryUploadedFile
 class QRApiAdapterProtocol(Protocol):
     def get_qr(self, data: str) -> InMemoryUploadedFile:
         raise NotImplementedError
+
+
+class VacancyDataValidatorProtocol(Protocol):
+    def __call__(self, data: dict[str, Any]) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        raise NotImplementedError
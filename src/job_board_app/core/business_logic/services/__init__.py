@@ -1,5 +1,6 @@
 """All methods and functions of services package."""
 
+from .background_jobs import enqueue_job, requeue_dead_jobs, run_pending_jobs
 from .common import change_file_size, replace_file_name_to_uuid
 from .company import (
     create_company,
@@ -8,18 +9,31 @@ from .company import (
     get_company_profile_by_id,
     get_vacancies_by_company_id,
 )
+from .company_logo import enqueue_company_logo_processing, get_company_logo_source, get_company_logo_variant
 from .country import get_countries
 from .employment_formats import get_employment_formats
+from .facets import get_vacancy_facets
 from .groups import get_groups
 from .levels import get_levels
 from .login import authenticate_user
+from .metrics import get_metrics
+from .qr_code import enqueue_vacancy_qr_codes, get_qr_adapter
 from .registration import confirm_user_registration, create_user
 from .response import get_response_status_by_name
+from .search_cache import invalidate_search_cache, search_vacancies_cached
+from .search_vector import update_vacancies_search_vector
+from .storage_usage import get_company_storage_usage
 from .vacancy import apply_to_vacancy, create_vacancy, get_vacancy_by_id, search_vacancies
+from .vacancy_import import import_vacancies
+from .vacancy_import_files import get_import_format, get_vacancy_import_rows
+from .vacancy_listing import refresh_vacancy_listings, search_vacancies_for_list, search_vacancy_listings
 from .work_formats import get_work_formats
 
 __all__ = [
     "create_company",
+    "enqueue_company_logo_processing",
+    "get_company_logo_source",
+    "get_company_logo_variant",
     "get_companies",
     "get_company_by_id",
     "get_company_profile_by_id",
@@ -39,4 +53,21 @@ __all__ = [
     "get_work_formats",
     "apply_to_vacancy",
     "get_response_status_by_name",
+    "update_vacancies_search_vector",
+    "get_vacancy_facets",
+    "search_vacancies_cached",
+    "invalidate_search_cache",
+    "get_metrics",
+    "refresh_vacancy_listings",
+    "search_vacancy_listings",
+    "search_vacancies_for_list",
+    "import_vacancies",
+    "get_import_format",
+    "get_vacancy_import_rows",
+    "enqueue_job",
+    "run_pending_jobs",
+    "requeue_dead_jobs",
+    "enqueue_vacancy_qr_codes",
+    "get_qr_adapter",
+    "get_company_storage_usage",
 ]
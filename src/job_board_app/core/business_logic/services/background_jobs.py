@@ -0,0 +1,172 @@
+"""
+Database backed queue of background jobs executed by the `run_background_jobs` worker.
+
+A job is enqueued in the transaction of the change that needs it, so it becomes visible to workers only after
+the commit. Workers claim jobs with `SELECT ... FOR UPDATE SKIP LOCKED` in short transactions and run tasks
+outside of them. Failed jobs are retried with exponential backoff, jobs that have failed all attempts are
+kept with the "dead" status.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from core.models import BackgroundJob
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .metrics import Counter
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable
+
+
+logger = logging.getLogger(__name__)
+
+TASKS: dict[str, Callable[[dict[str, Any]], None]] = {}
+
+background_jobs_succeeded = Counter('background_jobs_succeeded', 'Background jobs completed successfully.')
+background_jobs_retried = Counter('background_jobs_retried', 'Failed background jobs scheduled for a retry.')
+background_jobs_dead = Counter('background_jobs_dead', 'Background jobs moved to the dead-letter list.')
+
+ABANDONED_JOB_ERROR = 'The worker has not finished the last attempt within the lock timeout.'
+
+
+def register_task(name: str) -> Callable[[Callable[[dict[str, Any]], None]], Callable[[dict[str, Any]], None]]:
+    """Registers the decorated function as a background task with the passed name, it receives the job payload."""
+
+    def decorator(function: Callable[[dict[str, Any]], None]) -> Callable[[dict[str, Any]], None]:
+        TASKS[name] = function
+        return function
+
+    return decorator
+
+
+def enqueue_job(task: str, payload: dict[str, Any]) -> BackgroundJob:
+    """Adds a job of the task to the queue."""
+
+    return BackgroundJob.objects.create(task=task, payload=payload, max_attempts=settings.BACKGROUND_JOBS_MAX_ATTEMPTS)
+
+
+def enqueue_jobs(task: str, payloads: Iterable[dict[str, Any]]) -> list[BackgroundJob]:
+    """Adds jobs of the task with passed payloads to the queue by one query."""
+
+    return BackgroundJob.objects.bulk_create(
+        [
+            BackgroundJob(task=task, payload=payload, max_attempts=settings.BACKGROUND_JOBS_MAX_ATTEMPTS)
+            for payload in payloads
+        ]
+    )
+
+
+def run_pending_jobs(limit: int | None = None) -> int:
+    """Runs due jobs one by one until the queue has no due jobs or `limit` jobs are run, returns their number."""
+
+    processed = 0
+    while limit is None or processed < limit:
+        job = claim_job()
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
+
+
+def claim_job() -> BackgroundJob | None:
+    """Locks the next due job for the current worker.
+
+    Jobs locked by workers that have not finished them within BACKGROUND_JOBS_LOCK_TIMEOUT seconds
+    are considered abandoned and are claimed again. Abandoned jobs that have used all attempts (e.g. a task
+    that crashes the worker) are moved to the dead-letter list instead.
+    """
+
+    now = timezone.now()
+    abandoned = Q(
+        status=BackgroundJob.RUNNING, locked_at__lt=now - timedelta(seconds=settings.BACKGROUND_JOBS_LOCK_TIMEOUT)
+    )
+    exhausted = Q(attempts__gte=F('max_attempts'))
+    dead_jobs_count = BackgroundJob.objects.filter(abandoned & exhausted).update(
+        status=BackgroundJob.DEAD, locked_at=None, last_error=ABANDONED_JOB_ERROR, updated_at=now
+    )
+    if dead_jobs_count:
+        background_jobs_dead.increment(dead_jobs_count)
+        logger.error('Abandoned background jobs moved to the dead-letter list.', extra={'jobs': dead_jobs_count})
+
+    with transaction.atomic():
+        job = (
+            BackgroundJob.objects.select_for_update(skip_locked=True)
+            .filter(Q(status=BackgroundJob.PENDING, run_after__lte=now) | (abandoned & ~exhausted))
+            .order_by('run_after', 'pk')
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = BackgroundJob.RUNNING
+        job.locked_at = now
+        job.attempts += 1
+        job.save(update_fields=['status', 'locked_at', 'attempts', 'updated_at'])
+    return job
+
+
+def run_job(job: BackgroundJob) -> None:
+    """Runs the task of the claimed job, deletes the job on success and schedules a retry on failure."""
+
+    task = TASKS.get(job.task)
+    try:
+        if task is None:
+            raise LookupError(f'Unknown background task: {job.task}.')
+        task(job.payload)
+    except Exception as error:  # pylint: disable=broad-except
+        fail_job(job, error=error, retry=task is not None)
+        return
+    job_id = job.pk
+    job.delete()
+    background_jobs_succeeded.increment()
+    logger.info('Successfully completed background job.', extra={'task': job.task, 'job_id': job_id})
+
+
+def fail_job(job: BackgroundJob, error: Exception, retry: bool = True) -> None:
+    """Schedules the failed job for a retry with exponential backoff or moves it to the dead-letter list."""
+
+    job.last_error = f'{type(error).__name__}: {error}'
+    job.locked_at = None
+    if retry and job.attempts < job.max_attempts:
+        job.status = BackgroundJob.PENDING
+        job.run_after = timezone.now() + get_retry_delay(job.attempts)
+        background_jobs_retried.increment()
+        logger.warning(
+            'Background job failed and will be retried.',
+            extra={'task': job.task, 'job_id': job.pk, 'attempts': job.attempts, 'run_after': str(job.run_after)},
+            exc_info=error,
+        )
+    else:
+        job.status = BackgroundJob.DEAD
+        background_jobs_dead.increment()
+        logger.error(
+            'Background job failed and moved to the dead-letter list.',
+            extra={'task': job.task, 'job_id': job.pk, 'attempts': job.attempts},
+            exc_info=error,
+        )
+    job.save(update_fields=['status', 'run_after', 'locked_at', 'last_error', 'updated_at'])
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """Gets delay before the next attempt: BACKGROUND_JOBS_RETRY_BACKOFF seconds doubled after every failed attempt,
+    but not more than BACKGROUND_JOBS_MAX_RETRY_BACKOFF seconds."""
+
+    delay = settings.BACKGROUND_JOBS_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.BACKGROUND_JOBS_MAX_RETRY_BACKOFF))
+
+
+def requeue_dead_jobs(task: str | None = None) -> int:
+    """Moves jobs from the dead-letter list back to the queue with reset attempts, returns their number."""
+
+    dead_jobs = BackgroundJob.objects.filter(status=BackgroundJob.DEAD)
+    if task is not None:
+        dead_jobs = dead_jobs.filter(task=task)
+    now = timezone.now()
+    return dead_jobs.update(status=BackgroundJob.PENDING, attempts=0, run_after=now, updated_at=now)
@@ -1,23 +1,58 @@
 """
 Functions that transform data for further use by other parts of the app.
+
+Pillow, the QR code encoder and the HTTP client are imported on first use, so importing the module
+does not slow down the startup of app processes.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import mimetypes
 from io import BytesIO
-from sys import getsizeof
 from uuid import uuid4
 
-import requests  # type: ignore
 from core.business_logic.exceptions import QRCodeServiceUnavailable
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from PIL import Image
+from django.core.files.uploadedfile import InMemoryUploadedFile, UploadedFile
 
 logger = logging.getLogger(__name__)
 
 
-def replace_file_name_to_uuid(file: InMemoryUploadedFile) -> InMemoryUploadedFile:
+class GeneratedFile(InMemoryUploadedFile):
+    """In-memory file with generated content, its exact size and SHA-256 hash are computed in one pass.
+
+    The buffer of `output` is read through a memoryview, so the content is not copied, and `output` is rewound.
+    The content type is guessed by the name if it is not passed.
+    """
+
+    def __init__(
+        self,
+        output: BytesIO,
+        name: str,
+        content_type: str | None = None,
+        field_name: str | None = None,
+        charset: str | None = None,
+    ) -> None:
+        with output.getbuffer() as buffer:
+            size = buffer.nbytes
+            self.sha256 = hashlib.sha256(buffer).hexdigest()
+        output.seek(0)
+        super().__init__(
+            file=output,
+            field_name=field_name,
+            name=name,
+            content_type=content_type or mimetypes.guess_type(name)[0],
+            size=size,
+            charset=charset,
+        )
+
+    @classmethod
+    def from_bytes(cls, content: bytes, name: str, content_type: str | None = None) -> GeneratedFile:
+        return cls(BytesIO(content), name=name, content_type=content_type)
+
+
+def replace_file_name_to_uuid(file: UploadedFile) -> UploadedFile:
     """Replaces the user's filename with the uuid4 standard name."""
 
     old_name = file.name
@@ -31,9 +66,11 @@ def replace_file_name_to_uuid(file: InMemoryUploadedFile) -> InMemoryUploadedFil
     return file
 
 
-def change_file_size(file: InMemoryUploadedFile) -> InMemoryUploadedFile:
+def change_file_size(file: UploadedFile) -> GeneratedFile:
     """Changes the size of uploaded images."""
 
+    from PIL import Image
+
     content_type = file.content_type
     if content_type is not None:
         file_format = content_type.split('/')[-1].upper()
@@ -44,50 +81,86 @@ def change_file_size(file: InMemoryUploadedFile) -> InMemoryUploadedFile:
         image.thumbnail(size=(200, 150))
         image.save(output, format=file_format, quality=100)
     old_size = file.size
-    new_size = getsizeof(output)
-    file = InMemoryUploadedFile(
-        file=output,
-        field_name=file.field_name,
-        name=file.name,
-        content_type=file.content_type,
-        size=getsizeof(output),
-        charset=file.charset,
+    file = GeneratedFile(
+        output, name=file.name, content_type=file.content_type, field_name=file.field_name, charset=file.charset
+    )
+    logger.info(
+        'Successfully changed file size',
+        extra={"old_size": str(old_size), 'new_size': str(file.size), 'sha256': file.sha256},
     )
-    logger.info('Successfully changed file size', extra={"old_size": str(old_size), 'new_size': str(new_size)})
     return file
 
 
+def resize_image(content: bytes, size: tuple[int, int], file_format: str | None = None, quality: int = 100) -> bytes:
+    """Fits the encoded image into `size` keeping proportions and encodes it in `file_format`.
+
+    The format of the source image is kept if `file_format` is not passed. Works with bytes only,
+    so it can be run in a process pool.
+    """
+
+    from PIL import Image
+
+    output = BytesIO()
+    with Image.open(BytesIO(content)) as image:
+        file_format = file_format or image.format
+        image.thumbnail(size=size)
+        image.save(output, format=file_format, quality=quality)
+    return output.getvalue()
+
+
 def get_qr_code(data: str) -> InMemoryUploadedFile:
-    response = requests.get(f"https://api.qrserver.com/v1/create-qr-code/?size=150x150&data={data}")
-    if response.status_code == 200:
-        output = BytesIO(response.content)
-        return InMemoryUploadedFile(
-            file=output,
-            field_name=None,
-            name=str(uuid4()) + ".png",
-            content_type="image/png",
-            size=getsizeof(output),
-            charset=None,
-        )
-    else:
-        raise QRCodeServiceUnavailable
+    return QRApiAdapter(base_url="https://api.qrserver.com/v1").get_qr(data)
 
 
 class QRApiAdapter:
-    def __init__(self, base_url: str) -> None:
-        self._base_url = base_url
+    """Gets QR codes from the external QR API through the shared HTTP client of its base URL."""
+
+    def __init__(self, base_url: str, size: int = 150) -> None:
+        from .http_client import get_http_client
+
+        self._client = get_http_client(base_url, name='qr_api', unavailable_error=QRCodeServiceUnavailable)
+        self._size = size
+
+    def get_qr(self, data: str) -> InMemoryUploadedFile:
+        response = self._client.get('create-qr-code/', params={'size': f'{self._size}x{self._size}', 'data': data})
+        return GeneratedFile.from_bytes(response.content, name=str(uuid4()) + ".png", content_type="image/png")
+
+
+class QRLocalAdapter:
+    """Renders QR codes in the app process, equal data gives byte-identical PNG images."""
+
+    def __init__(self, size: int = 150, border: int = 4, error_correction: str = 'M') -> None:
+        self._size = size
+        self._border = border
+        self._error_correction = error_correction
 
     def get_qr(self, data: str) -> InMemoryUploadedFile:
-        response = requests.get(f"{self._base_url}/create-qr-code/?size=150x150&data={data}")
-        if response.status_code == 200:
-            output = BytesIO(response.content)
-            return InMemoryUploadedFile(
-                file=output,
-                field_name=None,
-                name=str(uuid4()) + ".png",
-                content_type="image/png",
-                size=getsizeof(output),
-                charset=None,
-            )
-        else:
-            raise QRCodeServiceUnavailable
+        return GeneratedFile.from_bytes(self.render(data), name=str(uuid4()) + ".png", content_type="image/png")
+
+    def render(self, data: str) -> bytes:
+        """Renders the QR code of data as a black and white PNG image of `size` x `size` pixels.
+
+        Modules are scaled by a whole number of pixels and the code is centered, so module edges stay sharp.
+        """
+
+        from PIL import Image
+
+        from .qr_encoder import encode_qr
+
+        matrix = encode_qr(data.encode(), error_correction=self._error_correction)
+        modules_count = len(matrix) + self._border * 2
+        light_row = [255] * modules_count
+        light_border = [255] * self._border
+        pixels = light_row * self._border
+        for row in matrix:
+            pixels += light_border + [0 if is_dark else 255 for is_dark in row] + light_border
+        pixels += light_row * self._border
+        code = Image.new('L', (modules_count, modules_count))
+        code.putdata(pixels)
+        scale = max(self._size // modules_count, 1)
+        code = code.resize((modules_count * scale, modules_count * scale), resample=Image.Resampling.NEAREST)
+        image = Image.new('L', (max(self._size, code.width), max(self._size, code.height)), 255)
+        image.paste(code, ((image.width - code.width) // 2, (image.height - code.height) // 2))
+        output = BytesIO()
+        image.convert('1', dither=Image.Dither.NONE).save(output, format='PNG')
+        return output.getvalue()
@@ -18,7 +18,9 @@ from core.models import Address, BusinessArea, City, Company, CompanyProfile, Co
 from django.db import IntegrityError, transaction
 from django.db.models import Count
 
-from .common import change_file_size, replace_file_name_to_uuid
+from .common import replace_file_name_to_uuid
+from .company_logo import enqueue_company_logo_processing
+from .storage_usage import add_company_storage_usage
 
 if TYPE_CHECKING:
     from core.business_logic.dto import AddAddressDTO, AddCompanyDTO, AddCompanyProfileDTO
@@ -30,7 +32,10 @@ logger = logging.getLogger(__name__)
 def create_company(  # pylint: disable=too-many-locals
     company_data: AddCompanyDTO, profile_data: AddCompanyProfileDTO, address_data: AddAddressDTO
 ) -> int:
-    """Records the added company data in the database."""
+    """Records the added company data in the database.
+
+    The logo is stored as uploaded, its resized variants are generated by a background job.
+    """
 
     with transaction.atomic():
         business_areas: list[str] = re.split("[ \r\n]+", company_data.business_area)
@@ -113,11 +118,10 @@ def create_company(  # pylint: disable=too-many-locals
             created_company.business_area.set(business_areas_list)
             if profile_data.logo is not None:
                 file = replace_file_name_to_uuid(profile_data.logo)
-                file = change_file_size(file=file)
             else:
                 file = profile_data.logo
             CompanyProfile.objects.create(
-                logo=file,
+                logo_original=file,
                 email=profile_data.email,
                 founding_year=profile_data.founding_year,
                 description=profile_data.description,
@@ -129,6 +133,9 @@ def create_company(  # pylint: disable=too-many-locals
                 address=address_from_db,
                 company=created_company,
             )
+            if file is not None:
+                add_company_storage_usage(created_company.pk, file.size)
+                enqueue_company_logo_processing(company_id=created_company.pk)
             logger.info(
                 'Successfully created Company profile in db.',
                 extra={
@@ -0,0 +1,162 @@
+"""
+Background processing of uploaded company logos.
+
+The uploaded logo is stored as is, a background job resizes it into all IMAGE_VARIANTS in both formats
+in a pool of IMAGE_PROCESSING_WORKERS processes and switches `CompanyProfile.logo` to the COMPANY_LOGO_VARIANT
+variant in one update, so the profile never references a partially processed logo. Variants are stored under
+the names the logo endpoint looks them up by, so it serves them without generating them on request.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+from core.business_logic.exceptions import CompanyProfileNotExistsError
+from core.models import CompanyProfile
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from .background_jobs import enqueue_job, register_task
+from .common import resize_image
+from .image_variants import (
+    IMAGE_VARIANT_FORMATS,
+    ORIGINAL_FORMAT,
+    get_image_variant_name,
+    get_image_variant_resize_options,
+    get_or_create_image_variant,
+    save_image_variant,
+)
+from .storage_usage import delete_company_file
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+COMPANY_LOGO_TASK = 'process_company_logo'
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_image_processing_pool() -> ProcessPoolExecutor | None:
+    """Gets the process pool of image processing, it is created on the first call.
+
+    None is returned when IMAGE_PROCESSING_WORKERS is 0: images are processed in the current process.
+    """
+
+    global _process_pool  # pylint: disable=global-statement
+    if not settings.IMAGE_PROCESSING_WORKERS:
+        return None
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=settings.IMAGE_PROCESSING_WORKERS)
+    return _process_pool
+
+
+def enqueue_company_logo_processing(company_id: int) -> None:
+    """Marks the uploaded logo of the company profile as pending and adds the job processing it to the queue."""
+
+    CompanyProfile.objects.filter(pk=company_id).update(
+        logo_status=CompanyProfile.LOGO_PENDING, logo_progress=0, logo_error=''
+    )
+    enqueue_job(COMPANY_LOGO_TASK, {'company_id': company_id})
+
+
+def get_company_logo_source(company_id: int) -> str:
+    """Gets the storage name of the logo used as the source of its variants: the original or the legacy resized logo."""
+
+    profile = CompanyProfile.objects.only('pk', 'logo', 'logo_original').filter(pk=company_id).first()
+    if profile is None or not (profile.logo_original or profile.logo):
+        raise CompanyProfileNotExistsError
+    return str(profile.logo_original.name or profile.logo.name)
+
+
+def get_company_logo_variant(company_id: int, variant: str, file_format: str) -> str:
+    """Gets the storage name of the company logo variant, it is generated if the logo job has not stored it yet.
+
+    The source name of the logo is read from the profile, the variant is found in the storage by its derived name.
+    """
+
+    return get_or_create_image_variant(
+        get_company_logo_source(company_id), variant=variant, file_format=file_format, company_id=company_id
+    )
+
+
+@register_task(COMPANY_LOGO_TASK)
+def process_company_logo(payload: dict[str, Any]) -> None:
+    """Generates variants of the original logo and switches the profile to them.
+
+    `logo_variants` of the profile maps "<variant>.<format>" to storage names of the variants. Progress is saved
+    after every variant. A failure is saved to the profile and re-raised, so the job is retried by the queue.
+    """
+
+    company_id = payload['company_id']
+    profile = CompanyProfile.objects.only('pk', 'logo_original').filter(pk=company_id).first()
+    if profile is None or not profile.logo_original:
+        logger.info('Company logo of the job does not exist.', extra={'company_id': company_id})
+        return
+    original_name = profile.logo_original.name
+    CompanyProfile.objects.filter(pk=company_id).update(
+        logo_status=CompanyProfile.LOGO_PROCESSING, logo_progress=0, logo_error=''
+    )
+    try:
+        variants = _create_logo_variants(company_id, original_name)
+    except Exception as error:
+        CompanyProfile.objects.filter(pk=company_id).update(
+            logo_status=CompanyProfile.LOGO_FAILED, logo_error=f'{type(error).__name__}: {error}'
+        )
+        logger.error('Failed to process company logo.', extra={'company_id': company_id}, exc_info=error)
+        raise
+
+    with transaction.atomic():
+        profile = CompanyProfile.objects.select_for_update().only('pk', 'logo_original').get(pk=company_id)
+        if profile.logo_original.name != original_name:
+            # A new logo has been uploaded while the job was running, its own job will switch the profile.
+            for name in variants.values():
+                delete_company_file(company_id, name)
+            logger.info('Company logo has been replaced during processing.', extra={'company_id': company_id})
+            return
+        CompanyProfile.objects.filter(pk=company_id).update(
+            logo=variants[f'{settings.COMPANY_LOGO_VARIANT}.{ORIGINAL_FORMAT}'],
+            logo_variants=variants,
+            logo_status=CompanyProfile.LOGO_READY,
+        )
+    logger.info('Successfully processed company logo.', extra={'company_id': company_id, 'variants': variants})
+
+
+def _create_logo_variants(company_id: int, original_name: str) -> dict[str, str]:
+    """Resizes the original logo into IMAGE_VARIANTS in both formats and stores them, returns their storage names.
+
+    Variants already generated by requests for them are kept.
+    """
+
+    with default_storage.open(original_name) as file:
+        content = file.read()
+
+    pool = get_image_processing_pool()
+    variants = {}
+    futures: dict[Future[bytes], tuple[str, str]] = {}
+    for variant in settings.IMAGE_VARIANTS:
+        for file_format in IMAGE_VARIANT_FORMATS:
+            key, name = f'{variant}.{file_format}', get_image_variant_name(original_name, variant, file_format)
+            if default_storage.exists(name):
+                variants[key] = name
+                continue
+            resize_options = get_image_variant_resize_options(variant, file_format)
+            future: Future[bytes]
+            if pool is None:
+                future = Future()
+                future.set_result(resize_image(content, **resize_options))
+            else:
+                future = pool.submit(resize_image, content, **resize_options)
+            futures[future] = (key, name)
+
+    for progress, future in enumerate(as_completed(futures), start=len(variants) + 1):
+        key, name = futures[future]
+        save_image_variant(name, future.result(), company_id=company_id)
+        variants[key] = name
+        CompanyProfile.objects.filter(pk=company_id).update(logo_progress=progress)
+    return variants
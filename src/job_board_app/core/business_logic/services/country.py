@@ -2,13 +2,13 @@
 Services and business logic for working with data associated with Country entity in the database.
 """
 
-from core.models import Country
+from . import reference_data
 
 
 def get_countries() -> list[tuple[str, str]]:
-    """Gets countries info from DB to EditProfileForm."""
+    """Gets countries info from the reference data registry to EditProfileForm."""
 
     countries = [
         ("", ""),
-    ] + [(value.name, value.name) for value in Country.objects.all()]
+    ] + [(value.name, value.name) for value in reference_data.countries.all()]
     return countries
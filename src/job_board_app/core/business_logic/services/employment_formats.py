@@ -2,11 +2,11 @@
 Services and business logic for working with data associated with EmploymentFormat entity in the database.
 """
 
-from core.models import EmploymentFormat
+from . import reference_data
 
 
 def get_employment_formats() -> list[tuple[str, str]]:
-    """Gets employment formats info from DB to EditProfileForm."""
+    """Gets employment formats info from the reference data registry to EditProfileForm."""
 
-    formats = [(value.name, value.name) for value in EmploymentFormat.objects.all()]
+    formats = [(value.name, value.name) for value in reference_data.employment_formats.all()]
     return formats
@@ -0,0 +1,74 @@
+"""
+Services for counting found vacancies per option of every search filter (faceted search).
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from core.business_logic.dto import VacancyFacetDTO
+from core.models import City, Country, EmploymentFormat, Level, Tag, WorkFormat
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from .search_filters import get_search_filters_digest
+from .vacancy import search_vacancies
+
+if TYPE_CHECKING:
+    from core.business_logic.dto import SearchVacancyDTO
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+# Search filter name -> (model of the filter options, lookup from the model to vacancies, value of unset filter).
+FACET_GROUPS: dict[str, tuple[type[Model], str, str | list]] = {
+    'level': (Level, 'vacancy', ''),
+    'employment_format': (EmploymentFormat, 'vacancies', []),
+    'work_format': (WorkFormat, 'vacancies', []),
+    'country': (Country, 'city__vacancies', ''),
+    'city': (City, 'vacancies', ''),
+    'tag': (Tag, 'vacancies', ''),
+}
+FACETS_CACHE_KEY_PREFIX = 'vacancy_facets'
+
+
+def get_vacancy_facets(search_filters: SearchVacancyDTO, use_cache: bool = True) -> dict[str, list[VacancyFacetDTO]]:
+    """Gets the number of vacancies found by the entered filters for every option of every facet group.
+
+    Counts of a group are computed with the filters of the other groups applied, so they show how many
+    vacancies would be found if the option were selected instead of the current one. Every group is
+    counted with a single aggregate query and contains at most VACANCY_FACET_SIZE most frequent options.
+    Results are cached for VACANCY_FACETS_CACHE_TIMEOUT seconds by the normalized filter set.
+    """
+
+    cache_timeout = settings.VACANCY_FACETS_CACHE_TIMEOUT if use_cache else 0
+    cache_key = f'{FACETS_CACHE_KEY_PREFIX}:{get_search_filters_digest(search_filters)}'
+    if cache_timeout:
+        facets: dict[str, list[VacancyFacetDTO]] | None = cache.get(cache_key)
+        if facets is not None:
+            logger.debug('Got vacancy facets from cache.', extra={'cache_key': cache_key})
+            return facets
+
+    facets = {group: count_vacancies_by_facet(search_filters, group=group) for group in FACET_GROUPS}
+    if cache_timeout:
+        cache.set(cache_key, facets, timeout=cache_timeout)
+    logger.info('Successfully counted vacancy facets.', extra={'cache_key': cache_key})
+    return facets
+
+
+def count_vacancies_by_facet(search_filters: SearchVacancyDTO, group: str) -> list[VacancyFacetDTO]:
+    """Counts vacancies found by the entered filters (except the filter of passed group) per option of the group."""
+
+    model, vacancies_lookup, unset_value = FACET_GROUPS[group]
+    group_filters = replace(search_filters, **{group: unset_value})
+    vacancies_ids = search_vacancies(search_filters=group_filters).order_by().values('pk')
+    options = (
+        model.objects.filter(**{f'{vacancies_lookup}__in': vacancies_ids})
+        .values('name')
+        .annotate(count=Count(vacancies_lookup, distinct=True))
+        .order_by('-count', 'name')[: settings.VACANCY_FACET_SIZE]
+    )
+    return [VacancyFacetDTO(name=option['name'], count=option['count']) for option in options]
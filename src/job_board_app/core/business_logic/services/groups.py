@@ -2,13 +2,13 @@
 Services and business logic for working with data associated with Auth_group entity in the database.
 """
 
-from django.contrib.auth.models import Group
+from . import reference_data
 
 
 def get_groups() -> list[tuple[str, str]]:
-    """Gets groups info from DB to EditProfileForm."""
+    """Gets groups info from the reference data registry to EditProfileForm."""
 
     groups = [
         ("", ""),
-    ] + [(value.name, value.name) for value in Group.objects.all()]
+    ] + [(value.name, value.name) for value in reference_data.groups.all()]
     return groups
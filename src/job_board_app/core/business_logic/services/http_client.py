@@ -0,0 +1,217 @@
+"""
+Outbound HTTP client shared by adapters of external services.
+
+Every base URL gets one client with a pooled keep-alive session, connect and read timeouts,
+bounded retries with jittered exponential backoff and a circuit breaker that fails fast
+while the upstream is unhealthy.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import requests  # type: ignore
+from core.business_logic.exceptions import ExternalServiceUnavailable
+from django.conf import settings
+from requests.adapters import HTTPAdapter  # type: ignore
+
+from .metrics import Counter
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+RETRIED_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+_clients: dict[str, HTTPClient] = {}
+_clients_lock = threading.Lock()
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures and rejects calls for `reset_timeout` seconds.
+
+    After the timeout one trial call is let through (half-open state): its success closes the breaker,
+    its failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_started = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self._reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Checks whether a call may be made now, only one trial call is allowed in the half-open state."""
+
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_started:
+                self._trial_started = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_started = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_started or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+                self._trial_started = False
+
+
+class HTTPClient:
+    """Client of one external service, requests are sent to paths relative to `base_url`.
+
+    Failed requests (connection errors, timeouts and responses with RETRIED_STATUS_CODES) are retried up to
+    HTTP_CLIENT_MAX_RETRIES times. When retries are exhausted or the circuit breaker is open,
+    `unavailable_error` is raised.
+    """
+
+    def __init__(
+        self, base_url: str, name: str, unavailable_error: type[Exception] = ExternalServiceUnavailable
+    ) -> None:
+        self.base_url = base_url.rstrip('/')
+        self.name = name
+        self._unavailable_error = unavailable_error
+        self._timeout = (settings.HTTP_CLIENT_CONNECT_TIMEOUT, settings.HTTP_CLIENT_READ_TIMEOUT)
+        self._max_retries = settings.HTTP_CLIENT_MAX_RETRIES
+        self._retry_backoff = settings.HTTP_CLIENT_RETRY_BACKOFF
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.HTTP_CLIENT_CIRCUIT_BREAKER_FAILURES,
+            reset_timeout=settings.HTTP_CLIENT_CIRCUIT_BREAKER_RESET_TIMEOUT,
+        )
+        self.session = requests.Session()
+        self.session.mount(self.base_url, HTTPAdapter(pool_connections=1, pool_maxsize=settings.HTTP_CLIENT_POOL_SIZE))
+
+        self.requests_counter = Counter(f'http_{name}_requests', f'Requests sent to {name}, including retries.')
+        self.errors_counter = Counter(f'http_{name}_errors', f'Failed requests to {name}, including retried ones.')
+        self.retries_counter = Counter(f'http_{name}_retries', f'Retried requests to {name}.')
+        self.rejected_counter = Counter(f'http_{name}_rejected', f'Calls to {name} rejected by the circuit breaker.')
+        self.latency_counter = Counter(f'http_{name}_latency_ms', f'Total time of requests to {name} in milliseconds.')
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request('GET', path, **kwargs)
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """Sends the request with retries, returns the first response that is not retried.
+
+        Responses with error statuses that are not retried raise `unavailable_error` without retries.
+        Server errors are recorded as failures of the circuit breaker, client errors are not.
+        """
+
+        if not self.circuit_breaker.allow_request():
+            self.rejected_counter.increment()
+            raise self._unavailable_error(f'Circuit breaker of {self.name} is open.')
+
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        kwargs.setdefault('timeout', self._timeout)
+        try:
+            response, failure = self._send_with_retries(method, url, **kwargs)
+        except BaseException:
+            # Other errors are failures too, otherwise a failed trial call would leave the breaker half-open.
+            self.circuit_breaker.record_failure()
+            raise
+
+        if response is not None:
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                # Client errors are answered by a healthy service.
+                self.circuit_breaker.record_success()
+            if not response.ok:
+                self.errors_counter.increment()
+                raise self._unavailable_error(f'{self.name} responded with HTTP {response.status_code}.')
+            return response
+
+        self.circuit_breaker.record_failure()
+        logger.error(
+            'External service is unavailable.',
+            extra={'service': self.name, 'url': url, 'circuit_breaker_state': self.circuit_breaker.state},
+        )
+        raise self._unavailable_error(f'{self.name} is unavailable: {failure}.')
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """Gets the delay before the retry: a random part of HTTP_CLIENT_RETRY_BACKOFF doubled after every attempt."""
+
+        return random.uniform(0, self._retry_backoff * 2 ** (attempt - 1))
+
+    def _send_with_retries(self, method: str, url: str, **kwargs: Any) -> tuple[requests.Response | None, str]:
+        """Returns the first response that is not retried, or None and the error of the last attempt."""
+
+        failure = ''
+        for attempt in range(self._max_retries + 1):
+            if attempt:
+                self.retries_counter.increment()
+                time.sleep(self.get_retry_delay(attempt))
+            try:
+                response = self._send(method, url, **kwargs)
+            except requests.RequestException as error:
+                failure = f'{type(error).__name__}: {error}'
+            else:
+                if response.status_code not in RETRIED_STATUS_CODES:
+                    return response, failure
+                failure = f'HTTP {response.status_code}'
+            self.errors_counter.increment()
+            logger.warning(
+                'Request to external service failed.', extra={'service': self.name, 'url': url, 'error': failure}
+            )
+        return None, failure
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        self.requests_counter.increment()
+        started = time.perf_counter()
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            self.latency_counter.increment(round((time.perf_counter() - started) * 1000))
+
+
+def get_http_client(
+    base_url: str, name: str, unavailable_error: type[Exception] = ExternalServiceUnavailable
+) -> HTTPClient:
+    """Gets the client of the base URL, it is created on the first call and shared by the process."""
+
+    key = base_url.rstrip('/')
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = HTTPClient(base_url, name=name, unavailable_error=unavailable_error)
+    return client
+
+
+def close_http_clients() -> None:
+    """Closes sessions of all clients and forgets them, new clients are created on the next call."""
+
+    with _clients_lock:
+        for client in _clients.values():
+            client.session.close()
+        _clients.clear()
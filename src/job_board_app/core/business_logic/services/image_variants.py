@@ -0,0 +1,93 @@
+"""
+Resized variants of stored images generated on the first request.
+
+A variant is named in IMAGE_VARIANTS and encoded either as WebP or in the format of the source image.
+Generated variants are stored in IMAGE_VARIANTS_DIRECTORY under a path derived from the source name,
+so they are found again without any database records. Variants of company logos are generated in advance
+by the job processing an uploaded logo.
+"""
+
+from __future__ import annotations
+
+import logging
+import posixpath
+from typing import TYPE_CHECKING
+
+from core.business_logic.exceptions import ImageVariantNotExistError
+from django.conf import settings
+from django.core.files.storage import default_storage
+
+from .common import GeneratedFile, resize_image
+from .metrics import Counter
+from .storage_usage import add_company_storage_usage
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+WEBP_FORMAT = 'webp'
+ORIGINAL_FORMAT = 'original'
+IMAGE_VARIANT_FORMATS = (WEBP_FORMAT, ORIGINAL_FORMAT)
+
+image_variant_hits = Counter('image_variant_hits', 'Image variants found in the storage.')
+image_variant_misses = Counter('image_variant_misses', 'Image variants generated on request.')
+
+
+def get_image_variant_name(source_name: str, variant: str, file_format: str) -> str:
+    """Gets the storage name of the variant of the source image."""
+
+    root, extension = posixpath.splitext(source_name)
+    if file_format == WEBP_FORMAT:
+        extension = '.webp'
+    return posixpath.join(settings.IMAGE_VARIANTS_DIRECTORY, root, f'{variant}{extension.lower()}')
+
+
+def get_image_variant_resize_options(variant: str, file_format: str) -> dict[str, Any]:
+    """Gets keyword arguments of `resize_image` generating the variant in the format.
+
+    Raises ImageVariantNotExistError for variants not named in IMAGE_VARIANTS and unknown formats.
+    """
+
+    if variant not in settings.IMAGE_VARIANTS or file_format not in IMAGE_VARIANT_FORMATS:
+        raise ImageVariantNotExistError
+    return {
+        'size': tuple(settings.IMAGE_VARIANTS[variant]),
+        'file_format': 'WEBP' if file_format == WEBP_FORMAT else None,
+        'quality': settings.IMAGE_VARIANTS_QUALITY,
+    }
+
+
+def get_or_create_image_variant(source_name: str, variant: str, file_format: str, company_id: int | None = None) -> str:
+    """Gets the storage name of the variant of the source image, the variant is generated if it is not stored yet.
+
+    The size of a generated variant is added to the storage usage of the company if `company_id` is passed.
+    """
+
+    resize_options = get_image_variant_resize_options(variant, file_format)
+    name = get_image_variant_name(source_name, variant, file_format)
+    if default_storage.exists(name):
+        image_variant_hits.increment()
+        return name
+
+    image_variant_misses.increment()
+    with default_storage.open(source_name) as file:
+        content = resize_image(file.read(), **resize_options)
+    save_image_variant(name, content, company_id=company_id)
+    return name
+
+
+def save_image_variant(name: str, content: bytes, company_id: int | None = None) -> None:
+    """Stores the generated variant under its name, a variant already stored by a concurrent call is kept.
+
+    The size of the stored variant is added to the storage usage of the company if `company_id` is passed.
+    """
+
+    variant_file = GeneratedFile.from_bytes(content, name=posixpath.basename(name))
+    stored_name = default_storage.save(name, variant_file)
+    if stored_name != name:
+        # The same variant has been stored by a concurrent call.
+        default_storage.delete(stored_name)
+    elif company_id is not None:
+        add_company_storage_usage(company_id, variant_file.size)
+    logger.info('Successfully generated image variant.', extra={'variant_name': name, 'sha256': variant_file.sha256})
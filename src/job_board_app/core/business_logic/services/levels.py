@@ -2,13 +2,13 @@
 Services and business logic for working with data associated with Levels entity in the database.
 """
 
-from core.models import Level
+from . import reference_data
 
 
 def get_levels() -> list[tuple[str, str]]:
-    """Gets levels info from DB to EditProfileForm."""
+    """Gets levels info from the reference data registry to EditProfileForm."""
 
     levels = [
         ("", ""),
-    ] + [(level.name, level.name) for level in Level.objects.all()]
+    ] + [(level.name, level.name) for level in reference_data.levels.all()]
     return levels
@@ -0,0 +1,60 @@
+"""
+Application counters stored in the default cache, so they are shared between all app processes.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+METRICS_CACHE_KEY_PREFIX = 'metrics'
+
+
+class Counter:
+    """Monotonic counter with a unique name. Created counters are registered in `Counter.registry`."""
+
+    registry: dict[str, Counter] = {}
+
+    def __init__(self, name: str, description: str = '') -> None:
+        self.name = name
+        self.description = description
+        self._cache_key = f'{METRICS_CACHE_KEY_PREFIX}:{name}'
+        Counter.registry[name] = self
+
+    def increment(self, value: int = 1) -> None:
+        """Increases the counter value by passed value.
+
+        Counters are updated on hot paths, so errors of the cache are logged instead of failing the caller.
+        """
+
+        try:
+            try:
+                cache.incr(self._cache_key, value)
+            except ValueError:
+                # The counter has not been created yet or has been evicted, it is created unless
+                # another process has just done it.
+                if not cache.add(self._cache_key, value, timeout=None):
+                    cache.incr(self._cache_key, value)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning('Failed to increment the counter.', extra={'counter': self.name}, exc_info=True)
+
+    def get(self) -> int:
+        """Gets current counter value."""
+
+        value: int = cache.get(self._cache_key, 0)
+        return value
+
+    def reset(self) -> None:
+        """Sets the counter value to zero."""
+
+        cache.set(self._cache_key, 0, timeout=None)
+
+
+def get_metrics() -> dict[str, int]:
+    """Gets current values of all registered counters."""
+
+    values = cache.get_many([counter._cache_key for counter in Counter.registry.values()])
+    return {name: values.get(counter._cache_key, 0) for name, counter in sorted(Counter.registry.items())}
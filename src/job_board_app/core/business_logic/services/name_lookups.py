@@ -0,0 +1,80 @@
+"""
+Lookups of rows of reference data by their names.
+
+Rows are taken from the reference data registry, so they are reloaded by every app process once the reference
+model changes. The index of rows by name is rebuilt when the reference data has been reloaded.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from .metrics import Counter
+from .reference_data import levels, response_statuses
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+    from .reference_data import ReferenceData
+
+
+logger = logging.getLogger(__name__)
+
+# Lookups are added to the shared counter in batches, so the cache is not written on every lookup.
+LOOKUPS_FLUSH_INTERVAL = 100
+
+name_lookups = Counter('name_lookups', 'Lookups of reference data rows by name, each one a query without the index.')
+name_lookup_loads = Counter('name_lookup_loads', 'Reference data loads from the database used by name lookups.')
+
+
+class NameLookup:
+    """Index of rows of the reference data by name.
+
+    Lookups are counted by the `name_lookups` counter and loads of the rows they have used by the
+    `name_lookup_loads` counter, the difference is the number of saved queries. `model.DoesNotExist`
+    is raised for missing names.
+    """
+
+    def __init__(self, reference_data: ReferenceData) -> None:
+        self.reference_data = reference_data
+        self.model = reference_data.model
+        self._indexed_rows: list[Model] | None = None
+        self._rows_by_name: dict[str, Model] = {}
+        self._unflushed_lookups = 0
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Model:
+        """Gets the row with the name."""
+
+        rows = self.reference_data.all()
+        if rows is not self._indexed_rows:
+            # Reloaded rows replace the list, so the index is rebuilt once per reload.
+            self._rows_by_name = {row.name: row for row in rows}
+            self._indexed_rows = rows
+            name_lookup_loads.increment()
+            logger.debug('Name lookup has been rebuilt.', extra={'model': self.model._meta.label})
+
+        with self._lock:
+            self._unflushed_lookups += 1
+            flush = self._unflushed_lookups >= LOOKUPS_FLUSH_INTERVAL
+        if flush:
+            self.flush()
+
+        row = self._rows_by_name.get(name)
+        if row is None:
+            raise self.model.DoesNotExist(f'{self.model._meta.object_name} with name {name!r} does not exist.')
+        return row
+
+    def flush(self) -> None:
+        """Adds lookups counted in the process to the shared counter."""
+
+        with self._lock:
+            lookups, self._unflushed_lookups = self._unflushed_lookups, 0
+        if lookups:
+            name_lookups.increment(lookups)
+
+
+level_lookup = NameLookup(levels)
+response_status_lookup = NameLookup(response_statuses)
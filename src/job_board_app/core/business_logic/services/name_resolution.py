@@ -0,0 +1,92 @@
+"""
+Batched resolution of reference data (companies, levels, tags, cities, employment and work formats) by names.
+
+Every function resolves all passed names with one query per entity type instead of a query per name.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from core.models import City
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+
+    from core.models import Country
+    from django.db.models import Model, QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_by_names(queryset: QuerySet, names: Iterable[str]) -> dict[str, Model]:
+    """Gets entities of the queryset with passed names by one query, mapped by name.
+
+    Entities with equal names (e.g. cities of different countries) are resolved to the earliest created one.
+    """
+
+    entities_by_name: dict[str, Model] = {}
+    for entity in queryset.filter(name__in=set(names)).order_by('pk'):
+        entities_by_name.setdefault(entity.name, entity)
+    return entities_by_name
+
+
+def get_or_create_by_names(queryset: QuerySet, names: Iterable[str], **create_fields: Any) -> dict[str, Model]:
+    """Gets entities of the queryset with passed names, mapped by name.
+
+    Missing entities are created with `create_fields` by a single bulk query that ignores conflicts with
+    rows inserted concurrently, then selected again, so at most three queries are executed. Conflicts are
+    detected by a unique constraint on the name (tags) or on the name within the country (cities).
+    """
+
+    names = set(names)
+    entities_by_name = get_by_names(queryset, names)
+    missing_names = names - entities_by_name.keys()
+    if not missing_names:
+        return entities_by_name
+
+    model = queryset.model
+    model.objects.bulk_create(
+        [model(name=name, **create_fields) for name in sorted(missing_names)], ignore_conflicts=True
+    )
+    entities_by_name.update(get_by_names(queryset, missing_names))
+    logger.info(
+        'Successfully created missing entities in db.',
+        extra={'model': model.__name__, 'names': sorted(missing_names)},
+    )
+    return entities_by_name
+
+
+def get_or_create_cities(names_by_country: dict[Country, set[str]]) -> dict[tuple[int, str], City]:
+    """Gets cities with passed names of several countries, mapped by country id and name.
+
+    Cities of all countries are selected by one query, missing cities are created by one bulk query that
+    ignores conflicts with cities inserted concurrently and selected again.
+    """
+
+    def get_cities() -> dict[tuple[int, str], City]:
+        cities_by_key: dict[tuple[int, str], City] = {}
+        all_names = set().union(*names_by_country.values())
+        for city in City.objects.filter(country__in=names_by_country.keys(), name__in=all_names).order_by('pk'):
+            cities_by_key.setdefault((city.country_id, city.name), city)
+        return cities_by_key
+
+    if not names_by_country:
+        return {}
+    cities_by_key = get_cities()
+    missing_cities = [
+        City(name=name, country=country)
+        for country, names in names_by_country.items()
+        for name in sorted(names)
+        if (country.pk, name) not in cities_by_key
+    ]
+    if missing_cities:
+        City.objects.bulk_create(missing_cities, ignore_conflicts=True)
+        cities_by_key = get_cities()
+        logger.info(
+            'Successfully created missing entities in db.',
+            extra={'model': City.__name__, 'names': [city.name for city in missing_cities]},
+        )
+    return cities_by_key
@@ -0,0 +1,179 @@
+"""
+Generation of vacancies QR codes by background jobs.
+
+QR code images are content-addressed: the file name is a hash of the encoded data and the image size,
+so each unique image is generated and stored once and vacancies with equal data share the file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import posixpath
+from typing import TYPE_CHECKING
+
+from core.models import StoredQRCode, Vacancy
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import Sum
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .background_jobs import enqueue_jobs, register_task
+from .metrics import Counter
+from .storage_usage import add_company_storage_usage
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+    from typing import Any, Iterable, Iterator
+
+    from core.business_logic.interfaces import QRApiAdapterProtocol
+
+
+logger = logging.getLogger(__name__)
+
+VACANCY_QR_CODE_TASK = 'generate_vacancy_qr_code'
+
+qr_code_cache_hits = Counter('qr_code_cache_hits', 'QR codes found in the content-addressed storage.')
+qr_code_cache_misses = Counter('qr_code_cache_misses', 'QR codes generated by the QR code adapter and stored.')
+
+
+def get_qr_adapter() -> QRApiAdapterProtocol:
+    """Creates the QR code adapter configured by the QR_API_ADAPTER and QR_CODE_SIZE settings."""
+
+    adapter_class = import_string(settings.QR_API_ADAPTER['BACKEND'])
+    adapter: QRApiAdapterProtocol = adapter_class(
+        size=settings.QR_CODE_SIZE, **settings.QR_API_ADAPTER.get('OPTIONS', {})
+    )
+    return adapter
+
+
+def get_qr_code_name(data: str, size: int) -> str:
+    """Gets the content-addressed storage name of the QR code image with encoded data of the passed size."""
+
+    key = hashlib.sha256(f'{size}:{data}'.encode()).hexdigest()
+    return posixpath.join(settings.QR_CODES_DIRECTORY, key[:2], f'{key}.png')
+
+
+def get_or_create_qr_code(data: str, company_id: int | None = None) -> str:
+    """Gets the storage name of the QR code image with encoded data, the image is generated and stored on a miss.
+
+    Concurrent workers may generate the same image, the first stored copy is kept and others are deleted.
+    The size of a stored image is added to the storage usage of the company if `company_id` is passed,
+    the image is recorded with the company to subtract the size when the image is collected.
+    """
+
+    name = get_qr_code_name(data, size=settings.QR_CODE_SIZE)
+    if _touch_stored_file(name):
+        qr_code_cache_hits.increment()
+        return name
+
+    qr_code_cache_misses.increment()
+    qr_code = get_qr_adapter().get_qr(data=data)
+    stored_name = default_storage.save(name, qr_code)
+    if stored_name != name:
+        default_storage.delete(stored_name)
+    else:
+        StoredQRCode.objects.update_or_create(name=name, defaults={'size': qr_code.size, 'company_id': company_id})
+        if company_id is not None:
+            add_company_storage_usage(company_id, qr_code.size)
+    logger.info('Successfully stored QR code.', extra={'qr_code_name': name, 'size': qr_code.size})
+    return name
+
+
+def get_qr_code_cache_hit_ratio() -> float | None:
+    """Gets the share of QR codes found in the storage, None if no QR codes have been requested."""
+
+    hits, misses = qr_code_cache_hits.get(), qr_code_cache_misses.get()
+    if not hits + misses:
+        return None
+    return hits / (hits + misses)
+
+
+def get_vacancy_qr_data(vacancy_id: int) -> str:
+    """Gets the data encoded in the QR code of the vacancy: the URL of the vacancy page."""
+
+    return f"{settings.SERVER_HOST}/vacancy/{vacancy_id}/"
+
+
+def enqueue_vacancy_qr_codes(vacancy_ids: Iterable[int]) -> None:
+    """Adds jobs generating QR codes of the vacancies to the background jobs queue."""
+
+    enqueue_jobs(VACANCY_QR_CODE_TASK, [{'vacancy_id': vacancy_id} for vacancy_id in vacancy_ids])
+
+
+@register_task(VACANCY_QR_CODE_TASK)
+def generate_vacancy_qr_code(payload: dict[str, Any]) -> None:
+    """Sets the shared QR code image of the vacancy, the image is generated if it is not stored yet.
+
+    Only the `qr_code` column is updated, so the vacancy search data is not refreshed.
+    """
+
+    vacancy_id = payload['vacancy_id']
+    company_id = Vacancy.objects.filter(pk=vacancy_id).values_list('company_id', flat=True).first()
+    if company_id is None:
+        logger.info('Vacancy of the QR code job has been deleted.', extra={'vacancy_id': vacancy_id})
+        return
+    qr_code_name = get_or_create_qr_code(data=get_vacancy_qr_data(vacancy_id), company_id=company_id)
+    Vacancy.objects.filter(pk=vacancy_id).update(qr_code=qr_code_name)
+    logger.info('Successfully set vacancy QR code.', extra={'vacancy_id': vacancy_id, 'qr_code_name': qr_code_name})
+
+
+def collect_unreferenced_qr_codes(min_age: timedelta, dry_run: bool = False) -> list[str]:
+    """Deletes images in QR_CODES_DIRECTORY that are not referenced by vacancies, returns their names.
+
+    Images modified less than `min_age` ago are kept: they may belong to a job that has not set them yet,
+    images found by jobs in the storage are touched for the same reason. References of every unreferenced image
+    are checked again right before it is deleted, since vacancies may have been set to it meanwhile.
+    Sizes of deleted images are subtracted from the storage usage of companies that stored them.
+    """
+
+    referenced = set(Vacancy.objects.exclude(qr_code='').exclude(qr_code=None).values_list('qr_code', flat=True))
+    modified_before = timezone.now() - min_age
+    collected = []
+    for name in _walk_storage(settings.QR_CODES_DIRECTORY):
+        if name in referenced or default_storage.get_modified_time(name) > modified_before:
+            continue
+        if Vacancy.objects.filter(qr_code=name).exists():
+            continue
+        if not dry_run:
+            default_storage.delete(name)
+        collected.append(name)
+
+    if not dry_run:
+        stored_qr_codes = StoredQRCode.objects.filter(name__in=collected)
+        for company_id, size in stored_qr_codes.exclude(company=None).values_list('company').annotate(Sum('size')):
+            add_company_storage_usage(company_id, -size)
+        stored_qr_codes.delete()
+    logger.info('Collected unreferenced QR codes.', extra={'count': len(collected), 'dry_run': dry_run})
+    return collected
+
+
+def _touch_stored_file(name: str) -> bool:
+    """Sets the modification time of the stored file to now, returns whether the file is stored.
+
+    Only the existence is checked in storages without local paths.
+    """
+
+    try:
+        path = default_storage.path(name)
+    except NotImplementedError:
+        return default_storage.exists(name)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _walk_storage(directory: str) -> Iterator[str]:
+    """Yields names of all files in the storage directory and its subdirectories."""
+
+    if not default_storage.exists(directory):
+        return
+    directories, files = default_storage.listdir(directory)
+    for file_name in files:
+        yield posixpath.join(directory, file_name)
+    for subdirectory in directories:
+        yield from _walk_storage(posixpath.join(directory, subdirectory))
@@ -0,0 +1,343 @@
+"""
+Pure-Python QR code encoder (ISO/IEC 18004, byte mode, versions 1-40) used by the local QR code adapter.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+QRMatrix = list[list[bool]]
+
+ERROR_CORRECTION_LEVELS = ('L', 'M', 'Q', 'H')
+
+_FORMAT_BITS = {'L': 1, 'M': 0, 'Q': 3, 'H': 2}
+
+# Number of error correction codewords in each block and number of blocks, indexed by version (0 is unused)
+_ECC_CODEWORDS_PER_BLOCK = {
+    'L': (0, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28, 28, 28, 30, 30, 26, 28,
+          30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    'M': (0, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26, 26, 28, 28, 28, 28, 28,
+          28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    'Q': (0, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30, 28, 30, 30, 30, 30, 28,
+          30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    'H': (0, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28, 30, 24, 30, 30, 30, 30,
+          30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+}  # fmt: skip
+_ERROR_CORRECTION_BLOCKS = {
+    'L': (0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8, 8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17,
+          18, 19, 19, 20, 21, 22, 24, 25),
+    'M': (0, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16, 17, 17, 18, 20, 21, 23, 25, 26, 28, 29,
+          31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    'Q': (0, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20, 23, 23, 25, 27, 29, 34, 34, 35, 38,
+          40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    'H': (0, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25, 25, 34, 30, 32, 35, 37, 40, 42, 45,
+          48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+}  # fmt: skip
+
+_MASKS = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+_LONG_RUN_RE = re.compile(r'0{5,}|1{5,}')
+_FINDER_LIKE_PATTERN_RE = re.compile(r'(?=10111010000|00001011101)')
+
+
+def _get_galois_field_tables() -> tuple[list[int], list[int]]:
+    """Builds exponent and logarithm tables of GF(2^8) with the 0x11D reducing polynomial."""
+
+    exponents, logarithms = [0] * 510, [0] * 256
+    value = 1
+    for power in range(255):
+        exponents[power] = exponents[power + 255] = value
+        logarithms[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= 0x11D
+    return exponents, logarithms
+
+
+_GF_EXP, _GF_LOG = _get_galois_field_tables()
+
+
+def encode_qr(data: bytes, error_correction: str = 'M') -> QRMatrix:
+    """Encodes data in byte mode into the smallest QR code version, returns rows of modules (True is dark).
+
+    The mask with the lowest penalty score is chosen, so equal data always gives an equal matrix.
+    """
+
+    if error_correction not in ERROR_CORRECTION_LEVELS:
+        raise ValueError(f'Unknown error correction level: {error_correction}.')
+    version = _get_version(len(data), error_correction)
+    codewords = _add_error_correction(_get_data_codewords(data, version, error_correction), version, error_correction)
+
+    size = version * 4 + 17
+    modules = [[False] * size for _ in range(size)]
+    is_function = [[False] * size for _ in range(size)]
+    _draw_function_patterns(modules, is_function, version)
+    _draw_codewords(modules, is_function, codewords)
+
+    best_matrix: QRMatrix = []
+    best_penalty = -1
+    for mask in range(len(_MASKS)):
+        matrix = _apply_mask(modules, _get_mask_pattern(version, mask))
+        _draw_format_bits(matrix, error_correction, mask)
+        penalty = _get_penalty_score(matrix)
+        if best_penalty < 0 or penalty < best_penalty:
+            best_matrix, best_penalty = matrix, penalty
+    return best_matrix
+
+
+def _get_version(data_length: int, error_correction: str) -> int:
+    """Gets the smallest version that fits data of the passed length."""
+
+    for version in range(1, 41):
+        count_bits = 8 if version < 10 else 16
+        if 4 + count_bits + data_length * 8 <= _get_data_codewords_count(version, error_correction) * 8:
+            return version
+    raise ValueError(f'Data of {data_length} bytes is too long for a QR code.')
+
+
+def _get_raw_modules_count(version: int) -> int:
+    """Gets the number of modules available for data and error correction codewords."""
+
+    result = (16 * version + 128) * version + 64
+    if version >= 2:
+        alignments_count = version // 7 + 2
+        result -= (25 * alignments_count - 10) * alignments_count - 55
+        if version >= 7:
+            result -= 36
+    return result
+
+
+def _get_data_codewords_count(version: int, error_correction: str) -> int:
+    ecc_codewords = _ECC_CODEWORDS_PER_BLOCK[error_correction][version]
+    return _get_raw_modules_count(version) // 8 - ecc_codewords * _ERROR_CORRECTION_BLOCKS[error_correction][version]
+
+
+def _get_data_codewords(data: bytes, version: int, error_correction: str) -> list[int]:
+    """Builds the byte mode segment with the terminator and pad codewords."""
+
+    bits: list[int] = []
+
+    def append_bits(value: int, length: int) -> None:
+        bits.extend((value >> i) & 1 for i in reversed(range(length)))
+
+    capacity = _get_data_codewords_count(version, error_correction) * 8
+    append_bits(0b0100, 4)
+    append_bits(len(data), 8 if version < 10 else 16)
+    for byte in data:
+        append_bits(byte, 8)
+    append_bits(0, min(4, capacity - len(bits)))
+    append_bits(0, -len(bits) % 8)
+    codewords = []
+    for start in range(0, len(bits), 8):
+        end = start + 8
+        codewords.append(int(''.join(map(str, bits[start:end])), 2))
+    pad_codewords = (0xEC, 0x11)
+    codewords.extend(pad_codewords[i % 2] for i in range(capacity // 8 - len(codewords)))
+    return codewords
+
+
+def _add_error_correction(data: list[int], version: int, error_correction: str) -> list[int]:
+    """Splits data codewords into blocks, adds Reed-Solomon codewords to each block and interleaves them."""
+
+    blocks_count = _ERROR_CORRECTION_BLOCKS[error_correction][version]
+    block_ecc_length = _ECC_CODEWORDS_PER_BLOCK[error_correction][version]
+    raw_codewords = _get_raw_modules_count(version) // 8
+    short_blocks_count = blocks_count - raw_codewords % blocks_count
+    short_block_length = raw_codewords // blocks_count
+    divisor = _get_reed_solomon_divisor(block_ecc_length)
+
+    blocks = []
+    start = 0
+    for i in range(blocks_count):
+        end = start + short_block_length - block_ecc_length + (0 if i < short_blocks_count else 1)
+        block = data[start:end]
+        start = end
+        ecc = _get_reed_solomon_remainder(block, divisor)
+        if i < short_blocks_count:
+            block.append(0)
+        blocks.append(block + ecc)
+
+    return [
+        block[i]
+        for i in range(len(blocks[0]))
+        for j, block in enumerate(blocks)
+        if i != short_block_length - block_ecc_length or j >= short_blocks_count
+    ]
+
+
+def _multiply(x: int, y: int) -> int:
+    """Multiplies two elements of GF(2^8)."""
+
+    if x == 0 or y == 0:
+        return 0
+    return _GF_EXP[_GF_LOG[x] + _GF_LOG[y]]
+
+
+@lru_cache(maxsize=None)
+def _get_reed_solomon_divisor(degree: int) -> tuple[int, ...]:
+    result = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = _multiply(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = _multiply(root, 0x02)
+    return tuple(result)
+
+
+def _get_reed_solomon_remainder(data: list[int], divisor: tuple[int, ...]) -> list[int]:
+    result = [0] * len(divisor)
+    for byte in data:
+        factor = byte ^ result.pop(0)
+        result.append(0)
+        for i, coefficient in enumerate(divisor):
+            result[i] ^= _multiply(coefficient, factor)
+    return result
+
+
+def _draw_function_patterns(modules: QRMatrix, is_function: QRMatrix, version: int) -> None:
+    """Draws finder, alignment and timing patterns and version bits, reserves modules of format bits."""
+
+    size = len(modules)
+
+    def set_function_module(x: int, y: int, is_dark: bool) -> None:
+        modules[y][x] = is_dark
+        is_function[y][x] = True
+
+    for i in range(size):
+        set_function_module(6, i, i % 2 == 0)
+        set_function_module(i, 6, i % 2 == 0)
+
+    for center_x, center_y in ((3, 3), (size - 4, 3), (3, size - 4)):
+        for dy in range(-4, 5):
+            for dx in range(-4, 5):
+                x, y = center_x + dx, center_y + dy
+                if 0 <= x < size and 0 <= y < size:
+                    set_function_module(x, y, max(abs(dx), abs(dy)) not in (2, 4))
+
+    positions = _get_alignment_positions(version, size)
+    last = len(positions) - 1
+    for i, center_x in enumerate(positions):
+        for j, center_y in enumerate(positions):
+            if (i, j) in ((0, 0), (0, last), (last, 0)):
+                continue
+            for dy in range(-2, 3):
+                for dx in range(-2, 3):
+                    set_function_module(center_x + dx, center_y + dy, max(abs(dx), abs(dy)) != 1)
+
+    for positions in _get_format_bits_positions(size):
+        for x, y in positions:
+            set_function_module(x, y, False)
+    set_function_module(8, size - 8, True)
+
+    if version >= 7:
+        remainder = version
+        for _ in range(12):
+            remainder = (remainder << 1) ^ ((remainder >> 11) * 0x1F25)
+        bits = version << 12 | remainder
+        for i in range(18):
+            is_dark = (bits >> i) & 1 == 1
+            a, b = size - 11 + i % 3, i // 3
+            set_function_module(a, b, is_dark)
+            set_function_module(b, a, is_dark)
+
+
+def _get_alignment_positions(version: int, size: int) -> list[int]:
+    if version == 1:
+        return []
+    alignments_count = version // 7 + 2
+    step = (version * 8 + alignments_count * 3 + 5) // (alignments_count * 4 - 4) * 2
+    return [6] + sorted(size - 7 - i * step for i in range(alignments_count - 1))
+
+
+def _get_format_bits_positions(size: int) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    """Gets positions of both copies of each of 15 format bits, from the least significant bit."""
+
+    first_copy = [(8, i) for i in range(6)] + [(8, 7), (8, 8), (7, 8)] + [(14 - i, 8) for i in range(9, 15)]
+    second_copy = [(size - 1 - i, 8) for i in range(8)] + [(8, size - 15 + i) for i in range(8, 15)]
+    return list(zip(first_copy, second_copy))
+
+
+def _draw_format_bits(matrix: QRMatrix, error_correction: str, mask: int) -> None:
+    data = _FORMAT_BITS[error_correction] << 3 | mask
+    remainder = data
+    for _ in range(10):
+        remainder = (remainder << 1) ^ ((remainder >> 9) * 0x537)
+    bits = (data << 10 | remainder) ^ 0x5412
+    for i, positions in enumerate(_get_format_bits_positions(len(matrix))):
+        for x, y in positions:
+            matrix[y][x] = (bits >> i) & 1 == 1
+
+
+def _draw_codewords(modules: QRMatrix, is_function: QRMatrix, codewords: list[int]) -> None:
+    """Places codewords in two-module wide columns zigzagging from the bottom right corner."""
+
+    size = len(modules)
+    bits_count = len(codewords) * 8
+    index = 0
+    for right in range(size - 1, 0, -2):
+        if right <= 6:
+            right -= 1
+        upward = (right + 1) & 2 == 0
+        for vertical in range(size):
+            y = size - 1 - vertical if upward else vertical
+            for x in (right, right - 1):
+                if not is_function[y][x] and index < bits_count:
+                    modules[y][x] = (codewords[index >> 3] >> (7 - (index & 7))) & 1 == 1
+                    index += 1
+
+
+@lru_cache(maxsize=None)
+def _get_mask_pattern(version: int, mask: int) -> tuple[tuple[bool, ...], ...]:
+    """Gets modules inverted by the mask: modules matching the mask condition outside of function patterns."""
+
+    size = version * 4 + 17
+    is_function = [[False] * size for _ in range(size)]
+    _draw_function_patterns([[False] * size for _ in range(size)], is_function, version)
+    condition = _MASKS[mask]
+    return tuple(tuple(not is_function[y][x] and condition(x, y) for x in range(size)) for y in range(size))
+
+
+def _apply_mask(modules: QRMatrix, pattern: tuple[tuple[bool, ...], ...]) -> QRMatrix:
+    return [
+        [is_dark != inverted for is_dark, inverted in zip(row, pattern_row)]
+        for row, pattern_row in zip(modules, pattern)
+    ]
+
+
+def _get_penalty_score(matrix: QRMatrix) -> int:
+    """Calculates the mask penalty: long runs, 2x2 blocks, finder-like patterns and dark modules balance.
+
+    Rows and columns are scored as strings and 2x2 blocks as bit masks of rows, it is the hottest part of encoding.
+    """
+
+    size = len(matrix)
+    rows = [''.join('1' if is_dark else '0' for is_dark in row) for row in matrix]
+    columns = [''.join(column) for column in zip(*rows)]
+    penalty = 0
+    for line in rows + columns:
+        penalty += sum(len(run) - 2 for run in _LONG_RUN_RE.findall(line))
+        penalty += len(_FINDER_LIKE_PATTERN_RE.findall(line)) * 40
+
+    full_mask = (1 << size) - 1
+    row_masks = [int(row, 2) for row in rows]
+    for upper, lower in zip(row_masks, row_masks[1:]):
+        vertical_equal = ~(upper ^ lower) & full_mask
+        horizontal_equal = ~(upper ^ (upper >> 1)) & (full_mask >> 1)
+        penalty += (vertical_equal & (vertical_equal >> 1) & horizontal_equal).bit_count() * 3
+
+    dark_count = sum(row.count('1') for row in rows)
+    total = size * size
+    penalty += abs(dark_count * 20 - total * 10) // total * 10
+    return penalty
@@ -0,0 +1,102 @@
+"""
+Registry of reference data: small tables that are read on most requests and rarely changed.
+
+Rows of every reference model are loaded on first use and kept in the process. A version stamp of the model
+is held in the shared cache and increased on any change of the model, so every app process reloads the rows
+on its next use instead of serving them until restart.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from core.models import Country, EmploymentFormat, Level, ResponseStatus, WorkFormat
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+
+from .metrics import Counter
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_DATA_KEY_PREFIX = 'reference_data'
+
+reference_data_loads = Counter('reference_data_loads', 'Reference data tables loaded from the database.')
+
+
+class ReferenceData:
+    """Rows of the reference model cached in the process. Created instances are registered in `ReferenceData.registry`.
+
+    Rows are reloaded when the version stamp of the model in the cache differs from the loaded one.
+    A missing stamp is recreated from the current time, so a stamp evicted from the cache never matches
+    an earlier loaded one.
+    """
+
+    registry: dict[type[Model], ReferenceData] = {}
+
+    def __init__(self, model: type[Model]) -> None:
+        self.model = model
+        self._version_key = f'{REFERENCE_DATA_KEY_PREFIX}:{model._meta.label_lower}:version'
+        self._rows: list[Model] = []
+        self._version: int | None = None
+        self._lock = threading.Lock()
+        ReferenceData.registry[model] = self
+
+    @property
+    def version(self) -> int:
+        """Gets current version stamp of the model."""
+
+        version: int = cache.get_or_set(self._version_key, time.time_ns, timeout=None)
+        return version
+
+    def all(self) -> list[Model]:
+        """Gets all rows of the model, they are loaded from the database if the version stamp has changed."""
+
+        version = self.version
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._rows = list(self.model.objects.all())
+                    self._version = version
+                    reference_data_loads.increment()
+                    logger.debug('Reference data has been loaded.', extra={'model': self.model._meta.label})
+        return self._rows
+
+    def invalidate(self) -> None:
+        """Makes rows loaded by all processes stale now and once more after the current transaction commits.
+
+        The second bump drops rows loaded by concurrent requests from data read before the commit.
+        """
+
+        self._bump_version()
+        transaction.on_commit(self._bump_version)
+
+    def _bump_version(self) -> None:
+        cache.add(self._version_key, time.time_ns(), timeout=None)
+        try:
+            cache.incr(self._version_key)
+        except ValueError:
+            cache.set(self._version_key, time.time_ns(), timeout=None)
+
+
+countries = ReferenceData(Country)
+levels = ReferenceData(Level)
+employment_formats = ReferenceData(EmploymentFormat)
+work_formats = ReferenceData(WorkFormat)
+response_statuses = ReferenceData(ResponseStatus)
+groups = ReferenceData(Group)
+
+
+def invalidate_reference_data(model: type[Model]) -> None:
+    """Makes cached rows of the reference model stale in all app processes."""
+
+    reference_data = ReferenceData.registry.get(model)
+    if reference_data is not None:
+        reference_data.invalidate()
@@ -4,9 +4,11 @@ Services and business logic for working responses.
 
 from core.models import ResponseStatus
 
+from .name_lookups import response_status_lookup
+
 
 def get_response_status_by_name(status_name: str) -> ResponseStatus:
-    """Gets response status from DB."""
+    """Gets response status by name from the reference data, so no query is executed until the statuses change."""
 
-    status: ResponseStatus = ResponseStatus.objects.get(name=status_name.capitalize())
+    status: ResponseStatus = response_status_lookup.get(status_name.capitalize())
     return status
@@ -0,0 +1,159 @@
+"""
+Cache of vacancies list search results: the number of found vacancies and ordered ids of every requested page.
+
+Cache keys contain a generation number that is increased on any change of vacancies, companies, tags,
+cities and countries, so all cached results become unreachable at once and expire by timeout.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from core.business_logic.dto.vacancy import LIST_SHAPE
+from core.models import Vacancy, VacancyListing
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .metrics import Counter
+from .search_filters import get_search_filters_digest
+from .vacancy import shape_vacancies
+from .vacancy_listing import can_search_vacancy_listings, search_vacancies_for_list
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+    from core.business_logic.dto import SearchVacancyDTO
+    from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_KEY_PREFIX = 'vacancy_search'
+SEARCH_CACHE_GENERATION_KEY = f'{SEARCH_CACHE_KEY_PREFIX}:generation'
+
+search_cache_hits = Counter('vacancy_search_cache_hits', 'Vacancies search results served from cache.')
+search_cache_misses = Counter('vacancy_search_cache_misses', 'Vacancies search results queried from the database.')
+
+
+class CachedVacancySearch:
+    """Lazy sequence of vacancies found by search filters that caches the count and ids of sliced pages.
+
+    Supports `count()`, `len()` and slicing, so it can be passed to page number paginators instead of
+    a QuerySet. The search query itself is built only on a cache miss.
+    """
+
+    def __init__(self, search_filters: SearchVacancyDTO, timeout: int) -> None:
+        self._search_filters = search_filters
+        self._timeout = timeout
+        self._key_prefix = (
+            f'{SEARCH_CACHE_KEY_PREFIX}:{get_search_generation()}:{get_search_filters_digest(search_filters)}'
+        )
+        self._queryset: QuerySet | None = None
+        self._count: int | None = None
+
+    @property
+    def queryset(self) -> QuerySet:
+        """Search query of vacancies, built on first use."""
+
+        if self._queryset is None:
+            self._queryset = search_vacancies_for_list(search_filters=self._search_filters)
+        return self._queryset
+
+    def count(self) -> int:
+        """Gets the number of found vacancies."""
+
+        if self._count is None:
+            self._count = self._get_or_set(f'{self._key_prefix}:count', lambda: self.queryset.count())
+        return self._count
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index: int | slice) -> Vacancy | VacancyListing | list[Vacancy | VacancyListing]:
+        if isinstance(index, int):
+            return self[slice(index, index + 1)][0]
+        if index.step is not None or (index.start or 0) < 0 or (index.stop is not None and index.stop < 0):
+            raise ValueError('Only non-negative slices without step are supported.')
+
+        start = index.start or 0
+        stop = index.stop if index.stop is not None else self.count()
+        vacancies_ids: list[int] = self._get_or_set(
+            f'{self._key_prefix}:{start}:{stop}', lambda: list(self.queryset[start:stop].values_list('pk', flat=True))
+        )
+        vacancies_by_id = self._get_vacancies_by_ids(vacancies_ids)
+        # Vacancies deleted after the page was cached are skipped.
+        return [vacancies_by_id[pk] for pk in vacancies_ids if pk in vacancies_by_id]
+
+    def _get_vacancies_by_ids(self, vacancies_ids: list[int]) -> dict[int, Vacancy | VacancyListing]:
+        """Gets vacancies (or their listings if the filters are supported by the listing read model) by ids."""
+
+        if can_search_vacancy_listings(self._search_filters):
+            return VacancyListing.objects.in_bulk(vacancies_ids)
+        return shape_vacancies(Vacancy.objects.all(), shape=LIST_SHAPE).in_bulk(vacancies_ids)
+
+    def _get_or_set(self, key: str, default: Callable[[], Any]) -> Any:
+        """Gets the value from cache or computes and caches it.
+
+        Errors of the cache are logged and the value is computed without caching, so search works without the cache.
+        """
+
+        try:
+            value = cache.get(key)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning('Failed to get vacancies search results from cache.', extra={'key': key}, exc_info=True)
+            return default()
+        if value is not None:
+            search_cache_hits.increment()
+            return value
+        search_cache_misses.increment()
+        value = default()
+        try:
+            cache.set(key, value, timeout=self._timeout)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning('Failed to cache vacancies search results.', extra={'key': key}, exc_info=True)
+        return value
+
+
+def search_vacancies_cached(search_filters: SearchVacancyDTO) -> CachedVacancySearch | QuerySet:
+    """Gets vacancies by entered filters, the count and pages are cached for VACANCY_SEARCH_CACHE_TIMEOUT seconds.
+
+    Returns the search QuerySet itself when the cache is disabled (the timeout is 0) or unavailable.
+    """
+
+    timeout = settings.VACANCY_SEARCH_CACHE_TIMEOUT
+    if not timeout:
+        return search_vacancies_for_list(search_filters=search_filters)
+    try:
+        return CachedVacancySearch(search_filters=search_filters, timeout=timeout)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning('Vacancies search cache is unavailable.', exc_info=True)
+        return search_vacancies_for_list(search_filters=search_filters)
+
+
+def get_search_generation() -> int:
+    """Gets current generation of the vacancies search cache."""
+
+    generation: int = cache.get_or_set(SEARCH_CACHE_GENERATION_KEY, 1, timeout=None)
+    return generation
+
+
+def invalidate_search_cache() -> None:
+    """Makes all cached search results stale now and once more after the current transaction commits.
+
+    The second bump drops results cached by concurrent requests from data read before the commit.
+    """
+
+    _bump_search_generation()
+    transaction.on_commit(_bump_search_generation)
+
+
+def _bump_search_generation() -> None:
+    """Increases generation of the vacancies search cache."""
+
+    cache.add(SEARCH_CACHE_GENERATION_KEY, 1, timeout=None)
+    try:
+        cache.incr(SEARCH_CACHE_GENERATION_KEY)
+    except ValueError:
+        cache.set(SEARCH_CACHE_GENERATION_KEY, 1, timeout=None)
+    logger.debug('Vacancies search cache has been invalidated.')
@@ -0,0 +1,33 @@
+"""
+Functions that bring vacancy search filters to a canonical form (used as a part of cache keys).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.business_logic.dto import SearchVacancyDTO
+
+
+def normalize_search_filters(search_filters: SearchVacancyDTO) -> dict[str, Any]:
+    """Gets filters that affect the search result: empty values are dropped, lists are sorted and deduplicated."""
+
+    normalized: dict[str, Any] = {}
+    for field, value in asdict(search_filters).items():
+        if isinstance(value, list):
+            value = sorted(set(value))
+        if value in ("", None, []):
+            continue
+        normalized[field] = value
+    return normalized
+
+
+def get_search_filters_digest(search_filters: SearchVacancyDTO) -> str:
+    """Gets a stable hash of the normalized search filters."""
+
+    normalized = json.dumps(normalize_search_filters(search_filters), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(normalized.encode()).hexdigest()
@@ -0,0 +1,56 @@
+"""
+Services for maintaining the full-text search document of the Vacancy entity in the database.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from core.models import City, Company, Tag, Vacancy
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db.models import OuterRef, Subquery
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from django.db.models import QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_vacancy_search_vector() -> SearchVector:
+    """Builds the weighted search document of a vacancy (name, company name, tags, cities and description)."""
+
+    company_name = Subquery(Company.objects.filter(pk=OuterRef('company_id')).values('name')[:1])
+    tags_names = Subquery(
+        Tag.objects.filter(vacancies=OuterRef('pk'))
+        .values('vacancies')
+        .annotate(names=StringAgg('name', delimiter=' '))
+        .values('names')
+    )
+    cities_names = Subquery(
+        City.objects.filter(vacancies=OuterRef('pk'))
+        .values('vacancies')
+        .annotate(names=StringAgg('name', delimiter=' '))
+        .values('names')
+    )
+    config = settings.FULL_TEXT_SEARCH_CONFIG
+    return (
+        SearchVector('name', weight='A', config=config)
+        + SearchVector(company_name, weight='B', config=config)
+        + SearchVector(tags_names, weight='B', config=config)
+        + SearchVector(cities_names, weight='C', config=config)
+        + SearchVector('description', weight='D', config=config)
+    )
+
+
+def update_vacancies_search_vector(vacancy_ids: Iterable[int] | QuerySet) -> int:
+    """Recomputes the stored search document of the vacancies with passed ids in a single UPDATE query."""
+
+    updated_rows: int = Vacancy.objects.filter(pk__in=vacancy_ids).update(search_vector=get_vacancy_search_vector())
+    logger.debug('Successfully updated vacancies search vector.', extra={'updated_rows': updated_rows})
+    return updated_rows
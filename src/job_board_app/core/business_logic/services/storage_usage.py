@@ -0,0 +1,100 @@
+"""
+Accounting of the media storage used by companies.
+
+Sizes of files stored for a company are added to `Company.storage_usage` when the files are saved
+and subtracted when they are deleted, so the usage is read by one query instead of walking MEDIA_ROOT.
+"""
+
+from __future__ import annotations
+
+import logging
+import posixpath
+from typing import TYPE_CHECKING
+
+from core.models import Company, CompanyProfile, Vacancy
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from .metrics import Counter
+
+if TYPE_CHECKING:
+    from django.core.files import File
+
+
+logger = logging.getLogger(__name__)
+
+stored_files_bytes = Counter('stored_files_bytes', 'Total size of files stored for companies in bytes.')
+
+
+def add_company_storage_usage(company_id: int, size: int) -> None:
+    """Adds the size in bytes (negative for deleted files) to the storage usage of the company."""
+
+    if not size:
+        return
+    Company.objects.filter(pk=company_id).update(storage_usage=Greatest(F('storage_usage') + size, 0))
+    if size > 0:
+        stored_files_bytes.increment(size)
+
+
+def save_company_file(company_id: int, name: str, content: File) -> str:
+    """Saves the file into the storage and adds its size to the storage usage of the company, returns its name."""
+
+    stored_name = default_storage.save(name, content)
+    add_company_storage_usage(company_id, content.size)
+    return stored_name
+
+
+def delete_company_file(company_id: int, name: str) -> None:
+    """Deletes the file from the storage if it exists and subtracts its size from the storage usage of the company."""
+
+    if not default_storage.exists(name):
+        return
+    size = default_storage.size(name)
+    default_storage.delete(name)
+    add_company_storage_usage(company_id, -size)
+
+
+def get_company_storage_usage(company_id: int) -> int:
+    """Gets the size in bytes of files stored for the company."""
+
+    usage: int | None = Company.objects.filter(pk=company_id).values_list('storage_usage', flat=True).first()
+    return usage or 0
+
+
+def calculate_company_storage_usage(company_id: int) -> int:
+    """Calculates the size in bytes of stored files referenced by the company by checking each of them in the storage.
+
+    Used to recalculate the stored usage, e.g. for files stored before the accounting was introduced.
+    """
+
+    names = set()
+    profile = CompanyProfile.objects.filter(company_id=company_id).first()
+    if profile is not None:
+        names.update(name for name in (profile.logo.name, profile.logo_original.name) if name)
+        names.update(profile.logo_variants.values())
+        source_name = profile.logo_original.name or profile.logo.name
+        if source_name:
+            variants_directory = posixpath.join(settings.IMAGE_VARIANTS_DIRECTORY, posixpath.splitext(source_name)[0])
+            if default_storage.exists(variants_directory):
+                names.update(
+                    posixpath.join(variants_directory, file_name)
+                    for file_name in default_storage.listdir(variants_directory)[1]
+                )
+    for attachment, qr_code in Vacancy.objects.filter(company_id=company_id).values_list('attachment', 'qr_code'):
+        names.update(name for name in (attachment, qr_code) if name)
+    return sum(default_storage.size(name) for name in names if default_storage.exists(name))
+
+
+def recalculate_companies_storage_usage() -> int:
+    """Sets the storage usage of every company to the calculated one, returns the number of updated companies."""
+
+    updated = 0
+    for company_id, usage in Company.objects.values_list('pk', 'storage_usage').iterator():
+        calculated = calculate_company_storage_usage(company_id)
+        if calculated != usage:
+            Company.objects.filter(pk=company_id).update(storage_usage=calculated)
+            updated += 1
+    logger.info('Recalculated storage usage of companies.', extra={'updated': updated})
+    return updated
@@ -9,6 +9,16 @@ import re
 from typing import TYPE_CHECKING
 
 from core.business_logic.dto import VacancyDataDTO
+from core.business_logic.dto.vacancy import (
+    DETAIL_SHAPE,
+    EXPORT_SHAPE,
+    FULLTEXT_SEARCH_MODE,
+    FUZZY_SEARCH_MODE,
+    LIST_SHAPE,
+    SALARY_RANGE_CONTAINS,
+    SALARY_RANGE_OVERLAPS,
+    SALARY_RANGE_WITHIN,
+)
 from core.business_logic.exceptions import (
     CompanyNotExistsError,
     CountryNotExistError,
@@ -17,33 +27,88 @@ from core.business_logic.exceptions import (
     WorkFormatNotExistError,
 )
 from core.business_logic.services.common import replace_file_name_to_uuid
-from core.models import City, Company, Country, EmploymentFormat, Level, Response, Tag, Vacancy, WorkFormat
+from core.business_logic.services.storage_usage import add_company_storage_usage
+from core.models import City, Company, Country, EmploymentFormat, Response, Tag, Vacancy, WorkFormat
 from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
 from django.db import transaction
-from django.db.models import Count, QuerySet
+from django.db.backends.postgresql.psycopg_any import NumericRange
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q, QuerySet, Value
 
+from .name_lookups import level_lookup
+from .name_resolution import get_by_names, get_or_create_by_names
+from .qr_code import enqueue_vacancy_qr_codes
 from .response import get_response_status_by_name
+from .vacancy_refresh import batch_vacancies_refresh
 
 if TYPE_CHECKING:
     from core.business_logic.dto import AddVacancyDTO, ApplyVacancyDTO, SearchVacancyDTO
-    from core.business_logic.interfaces import QRApiAdapterProtocol
 
 
 logger = logging.getLogger(__name__)
 
 
-def search_vacancies(search_filters: SearchVacancyDTO) -> QuerySet:
-    """Gets a list of vacancies from the database by entered filters."""
+LIST_SHAPE_FIELDS = (
+    'id',
+    'name',
+    'experience',
+    'min_salary',
+    'max_salary',
+    'level__id',
+    'level__name',
+    'company__id',
+    'company__name',
+)
 
-    vacancies = Vacancy.objects.select_related("level", "company").prefetch_related(
-        "tags", "employment_format", "work_format", 'city'
-    )
 
-    if search_filters.name:
-        vacancies = vacancies.filter(name__icontains=search_filters.name)
+def shape_vacancies(vacancies: QuerySet, shape: str) -> QuerySet:
+    """Joins, prefetches and defers vacancy relations and fields according to the shape of the result.
+
+    The list shape loads only columns of vacancies lists with the level and company joined, the detail
+    shape loads all vacancy fields with prefetched relations, the export shape additionally prefetches
+    countries of cities and skips files.
+    """
+
+    vacancies = vacancies.select_related("level", "company")
+    if shape == LIST_SHAPE:
+        return vacancies.only(*LIST_SHAPE_FIELDS)
+    if shape == DETAIL_SHAPE:
+        return vacancies.prefetch_related("tags", "employment_format", "work_format", 'city').defer('search_vector')
+    if shape == EXPORT_SHAPE:
+        cities = Prefetch('city', queryset=City.objects.select_related('country'))
+        return vacancies.prefetch_related("tags", "employment_format", "work_format", cities).defer(
+            'search_vector', 'attachment', 'qr_code'
+        )
+    raise ValueError(f'Unknown vacancies shape: {shape}.')
+
+
+def search_vacancies(search_filters: SearchVacancyDTO, shape: str = DETAIL_SHAPE) -> QuerySet:
+    """Gets a list of vacancies from the database by entered filters.
+
+    The free-text query is matched by substring (default) or, in the full-text search mode,
+    against the stored vacancy search vector with the results ordered by rank. In the fuzzy
+    search mode the name and company name filters are matched by trigram word similarity
+    and the results are ordered by similarity.
 
-    if search_filters.company_name:
-        vacancies = vacancies.filter(company__name__icontains=search_filters.company_name)
+    Filters by many-to-many relations are composed as EXISTS semi-joins, so every vacancy is
+    returned once without DISTINCT. Loaded relations and fields are selected by the `shape`
+    of the result (see `shape_vacancies`).
+    """
+
+    vacancies = shape_vacancies(Vacancy.objects.all(), shape=shape)
+    ordering = ['-id']
+
+    if search_filters.search_mode == FUZZY_SEARCH_MODE and (search_filters.name or search_filters.company_name):
+        vacancies = filter_vacancies_by_similarity(
+            vacancies=vacancies, name=search_filters.name, company_name=search_filters.company_name
+        )
+        ordering = ['-similarity', '-id']
+    else:
+        if search_filters.name:
+            vacancies = vacancies.filter(name__icontains=search_filters.name)
+
+        if search_filters.company_name:
+            vacancies = vacancies.filter(company__name__icontains=search_filters.company_name)
 
     if search_filters.level:
         vacancies = vacancies.filter(level__name=search_filters.level)
@@ -54,29 +119,65 @@ def search_vacancies(search_filters: SearchVacancyDTO) -> QuerySet:
     if search_filters.description:
         vacancies = vacancies.filter(description__icontains=search_filters.description)
 
-    if search_filters.min_salary:
-        vacancies = vacancies.filter(min_salary__gte=search_filters.min_salary)
-
-    if search_filters.max_salary:
-        vacancies = vacancies.filter(max_salary__lte=search_filters.max_salary)
+    vacancies = filter_vacancies_by_salary(vacancies=vacancies, search_filters=search_filters)
 
     if search_filters.employment_format:
-        vacancies = vacancies.filter(employment_format__name__in=search_filters.employment_format)
+        vacancies = vacancies.filter(
+            Exists(
+                Vacancy.employment_format.through.objects.filter(
+                    vacancy=OuterRef('pk'), employmentformat__name__in=search_filters.employment_format
+                )
+            )
+        )
 
     if search_filters.work_format:
-        vacancies = vacancies.filter(work_format__name__in=search_filters.work_format)
+        vacancies = vacancies.filter(
+            Exists(
+                Vacancy.work_format.through.objects.filter(
+                    vacancy=OuterRef('pk'), workformat__name__in=search_filters.work_format
+                )
+            )
+        )
 
     if search_filters.country:
-        inner_country_id = Country.objects.filter(name=search_filters.country)
-        vacancies = vacancies.filter(city__country__in=inner_country_id)
+        vacancies = vacancies.filter(
+            Exists(
+                Vacancy.city.through.objects.filter(vacancy=OuterRef('pk'), city__country__name=search_filters.country)
+            )
+        )
 
     if search_filters.city:
-        vacancies = vacancies.filter(city__name=search_filters.city)
+        vacancies = vacancies.filter(
+            Exists(Vacancy.city.through.objects.filter(vacancy=OuterRef('pk'), city__name=search_filters.city))
+        )
 
     if search_filters.tag:
-        vacancies = vacancies.filter(tags__name=search_filters.tag)
+        vacancies = vacancies.filter(
+            Exists(Vacancy.tags.through.objects.filter(vacancy=OuterRef('pk'), tag__name=search_filters.tag))
+        )
 
-    vacancies = vacancies.order_by('-id').distinct()
+    if search_filters.query and search_filters.search_mode == FULLTEXT_SEARCH_MODE:
+        search_query = SearchQuery(
+            search_filters.query, search_type='websearch', config=settings.FULL_TEXT_SEARCH_CONFIG
+        )
+        vacancies = vacancies.filter(search_vector=search_query).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        )
+        ordering = ['-rank', '-id']
+    elif search_filters.query:
+        vacancies = vacancies.filter(
+            Q(name__icontains=search_filters.query)
+            | Q(description__icontains=search_filters.query)
+            | Q(company__name__icontains=search_filters.query)
+            | Exists(
+                Vacancy.tags.through.objects.filter(vacancy=OuterRef('pk'), tag__name__icontains=search_filters.query)
+            )
+            | Exists(
+                Vacancy.city.through.objects.filter(vacancy=OuterRef('pk'), city__name__icontains=search_filters.query)
+            )
+        )
+
+    vacancies = vacancies.order_by(*ordering)
     position = search_filters.name
     logger.info(
         'The list of vacancies according to the transmitted filters has been successfully received.',
@@ -92,72 +193,125 @@ def search_vacancies(search_filters: SearchVacancyDTO) -> QuerySet:
             'country': search_filters.country,
             'city': search_filters.city,
             'tag': search_filters.tag,
+            'query': search_filters.query,
+            'search_mode': search_filters.search_mode,
+            'salary_range_mode': search_filters.salary_range_mode,
         },
     )
 
     return vacancies
 
 
-def create_vacancy(data: AddVacancyDTO, qr_adapter: QRApiAdapterProtocol) -> int:  # pylint: disable=too-many-locals
-    """Records the added Vacancy data in the database."""
-
-    with transaction.atomic():
-        tags: list[str] = re.split("[ \r\n]+", data.tags)
-        tags_list: list[Tag] = []
-        for tag in tags:
-            try:
-                tag_from_db = Tag.objects.get(name=tag.lower())
-            except Tag.DoesNotExist:
-                logger.warning("Tag doesn't exist.", extra={'Tag': tag})
-                tag_from_db = Tag.objects.create(name=tag.lower())
-                logger.info('Handled error and successfully created tag in db.', extra={'tag': tag})
-            tags_list.append(tag_from_db)
+def get_salary_range(min_salary: int | None, max_salary: int | None) -> NumericRange | None:
+    """Gets the inclusive salary range, a missing bound makes the range unbounded from that side."""
+
+    if min_salary is None and max_salary is None:
+        return None
+    if min_salary is not None and max_salary is not None and min_salary > max_salary:
+        min_salary, max_salary = max_salary, min_salary
+    return NumericRange(min_salary, max_salary, bounds='[]')
+
+
+def filter_vacancies_by_salary(vacancies: QuerySet, search_filters: SearchVacancyDTO) -> QuerySet:
+    """Filters vacancies or vacancy listings by the entered salary bounds.
+
+    Without a salary range mode the minimum and maximum salaries are compared with the entered bounds
+    independently. In a salary range mode the salary range of a vacancy should overlap, contain or be
+    within the entered range, these filters are served by the GiST index of the `salary_range` column.
+    """
+
+    if not search_filters.min_salary and not search_filters.max_salary:
+        return vacancies
+    if not search_filters.salary_range_mode:
+        if search_filters.min_salary:
+            vacancies = vacancies.filter(min_salary__gte=search_filters.min_salary)
+        if search_filters.max_salary:
+            vacancies = vacancies.filter(max_salary__lte=search_filters.max_salary)
+        return vacancies
+
+    salary_range = get_salary_range(search_filters.min_salary or None, search_filters.max_salary or None)
+    if search_filters.salary_range_mode == SALARY_RANGE_OVERLAPS:
+        return vacancies.filter(salary_range__overlap=salary_range)
+    if search_filters.salary_range_mode == SALARY_RANGE_CONTAINS:
+        return vacancies.filter(salary_range__contains=salary_range)
+    if search_filters.salary_range_mode == SALARY_RANGE_WITHIN:
+        return vacancies.filter(salary_range__contained_by=salary_range)
+    raise ValueError(f'Unknown salary range mode: {search_filters.salary_range_mode}.')
+
+
+def filter_vacancies_by_similarity(vacancies: QuerySet, name: str, company_name: str) -> QuerySet:
+    """Filters vacancies by trigram word similarity of the vacancy name and company name to the entered values.
+
+    Similarity of every entered value has to reach the TRIGRAM_SIMILARITY_THRESHOLD setting. The threshold is
+    compared in the query itself instead of the `pg_trgm.word_similarity_threshold` parameter of the `%>`
+    operator, which would stay set on the pooled connection for later requests.
+    """
+
+    threshold = settings.TRIGRAM_SIMILARITY_THRESHOLD
+    similarity = Value(0.0)
+    if name:
+        name_similarity = TrigramWordSimilarity(name, 'name')
+        vacancies = vacancies.alias(name_similarity=name_similarity).filter(name_similarity__gte=threshold)
+        similarity += name_similarity
+    if company_name:
+        company_name_similarity = TrigramWordSimilarity(company_name, 'company__name')
+        vacancies = vacancies.alias(company_name_similarity=company_name_similarity).filter(
+            company_name_similarity__gte=threshold
+        )
+        similarity += company_name_similarity
+    return vacancies.annotate(similarity=similarity)
+
+
+def create_vacancy(data: AddVacancyDTO) -> int:  # pylint: disable=too-many-locals
+    """Records the added Vacancy data in the database.
+
+    Related tags, cities and formats are resolved with one query per entity type, missing tags and cities
+    are created with one bulk query per entity type. The QR code of the vacancy is generated by a background
+    job enqueued in the same transaction. The search document and the listing row of the vacancy are refreshed
+    once after all relations are set.
+    """
+
+    with transaction.atomic(), batch_vacancies_refresh():
         try:
             company = Company.objects.get(name=data.company_name)
         except Company.DoesNotExist:
             logger.warning("Company doesn't exists.", extra={'company': data.company_name})
             raise CompanyNotExistsError
-
-        cities: list[str] = re.split("[ \r\n]+", data.city)
-        city_list: list[City] = []
         try:
             country_from_db = Country.objects.get(name=data.country)
         except Country.DoesNotExist:
             logger.error("Country doesn't exists.", extra={'country': data.country})
             raise CountryNotExistError
-        for city in cities:
-            try:
-                city_from_db = (
-                    City.objects.select_related('country')
-                    .filter(country__name=data.country)
-                    .get(name=city.capitalize())
-                )
-            except City.DoesNotExist:
-                logger.warning("City doesn't exists.", extra={'city': city})
-                city_from_db = City.objects.create(name=city.capitalize(), country=country_from_db)
-                logger.info('Handled error and successfully created city in db.', extra={'city': city})
-            city_list.append(city_from_db)
-        try:
-            employment_formats_list: list[EmploymentFormat] = [
-                EmploymentFormat.objects.get(name=employ_format) for employ_format in data.employment_format
-            ]
-        except EmploymentFormat.DoesNotExist:
+
+        employment_formats_by_name = get_by_names(EmploymentFormat.objects.all(), data.employment_format)
+        if set(data.employment_format) - employment_formats_by_name.keys():
             logger.error("Employment format doesn't exists.", extra={'employment_format': data.employment_format})
             raise EmploymentFormatNotExistError
-        try:
-            work_formats_list: list[WorkFormat] = [
-                WorkFormat.objects.get(name=work_form) for work_form in data.work_format
-            ]
-        except WorkFormat.DoesNotExist:
+        employment_formats_list: list[EmploymentFormat] = [
+            employment_formats_by_name[employ_format] for employ_format in data.employment_format
+        ]
+        work_formats_by_name = get_by_names(WorkFormat.objects.all(), data.work_format)
+        if set(data.work_format) - work_formats_by_name.keys():
             logger.error("Work format doesn't exists.", extra={'work_format': data.work_format})
             raise WorkFormatNotExistError
+        work_formats_list: list[WorkFormat] = [work_formats_by_name[work_form] for work_form in data.work_format]
+        level = level_lookup.get(data.level)
+
+        tags: list[str] = [tag.lower() for tag in re.split("[ \r\n]+", data.tags)]
+        tags_by_name = get_or_create_by_names(Tag.objects.all(), tags)
+        tags_list: list[Tag] = [tags_by_name[tag] for tag in tags]
+        cities: list[str] = [city.capitalize() for city in re.split("[ \r\n]+", data.city)]
+        cities_by_name = get_or_create_by_names(
+            City.objects.filter(country=country_from_db), cities, country=country_from_db
+        )
+        city_list: list[City] = [cities_by_name[city] for city in cities]
         if data.attachment is not None:
             file = replace_file_name_to_uuid(data.attachment)
         else:
             file = data.attachment
         created_vacancy = Vacancy.objects.create(
             name=data.name,
-            level=Level.objects.get(name=data.level),
+            level=level,
             company=company,
             experience=data.experience,
             min_salary=data.min_salary,
@@ -165,6 +319,8 @@ def create_vacancy(data: AddVacancyDTO, qr_adapter: QRApiAdapterProtocol) -> int
             description=data.description,
             attachment=file,
         )
+        if file is not None:
+            add_company_storage_usage(company.pk, file.size)
         logger.info(
             'Successfully created vacancy in db.',
             extra={
@@ -192,10 +348,7 @@ def create_vacancy(data: AddVacancyDTO, qr_adapter: QRApiAdapterProtocol) -> int
                 "cities": city_list,
             },
         )
-        qr_data = f"{settings.SERVER_HOST}/vacancy/{created_vacancy}/"
-        qr_code = qr_adapter.get_qr(data=qr_data)
-        created_vacancy.qr_code = qr_code
-        created_vacancy.save()
+        enqueue_vacancy_qr_codes(vacancy_ids=[created_vacancy.pk])
         vacancy_id: int = created_vacancy.pk
         return vacancy_id
 
@@ -0,0 +1,211 @@
+"""
+Bulk import of vacancies from partner feeds.
+
+Validated rows are imported in chunks: reference data of a chunk is resolved with one query per entity type,
+vacancies and their relations are inserted with one bulk query per table. Memory use depends only on the chunk
+size and the number of reported errors, not on the number of imported rows. QR codes of imported vacancies
+are generated by background jobs.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+from core.business_logic.dto import VacancyImportErrorDTO, VacancyImportResultDTO
+from core.models import Company, Country, EmploymentFormat, Level, Tag, Vacancy, WorkFormat
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from .name_resolution import get_by_names, get_or_create_by_names, get_or_create_cities
+from .qr_code import enqueue_vacancy_qr_codes
+from .search_cache import invalidate_search_cache
+from .search_vector import update_vacancies_search_vector
+from .vacancy_listing import refresh_vacancy_listings
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Iterator
+
+    from core.business_logic.dto import AddVacancyDTO, VacancyImportRowDTO
+
+
+logger = logging.getLogger(__name__)
+
+NAMES_SEPARATOR = re.compile("[ \r\n]+")
+ROW_NOT_SAVED_ERROR = {'non_field_errors': ['Vacancy could not be saved to the database.']}
+
+
+def import_vacancies(rows: Iterable[VacancyImportRowDTO], chunk_size: int | None = None) -> VacancyImportResultDTO:
+    """Imports vacancies from validated rows in chunks of VACANCY_IMPORT_CHUNK_SIZE rows.
+
+    Every chunk is saved in its own transaction. Rows with validation errors or unknown company, level,
+    country or formats are reported as failed without affecting other rows. If the database rejects
+    a chunk, its rows are saved one by one to find the failing ones.
+    """
+
+    chunk_size = chunk_size or settings.VACANCY_IMPORT_CHUNK_SIZE
+    result = VacancyImportResultDTO()
+    rows_iterator = iter(rows)
+    while chunk := list(islice(rows_iterator, chunk_size)):
+        valid_rows = []
+        for row in chunk:
+            if row.errors or row.vacancy is None:
+                _add_import_error(result, VacancyImportErrorDTO(row=row.row, errors=row.errors))
+            else:
+                valid_rows.append(row)
+        if valid_rows:
+            _import_rows(valid_rows, result)
+    logger.info(
+        'Successfully imported vacancies.', extra={'created_vacancies': result.created, 'failed_rows': result.failed}
+    )
+    return result
+
+
+def _import_rows(rows: list[VacancyImportRowDTO], result: VacancyImportResultDTO) -> None:
+    """Saves vacancies of the rows in one transaction, falls back to saving rows one by one on database errors."""
+
+    try:
+        with transaction.atomic():
+            created, errors = _create_vacancies(rows)
+    except DatabaseError:
+        if len(rows) == 1:
+            logger.warning('Vacancy import row could not be saved.', extra={'row': rows[0].row}, exc_info=True)
+            _add_import_error(result, VacancyImportErrorDTO(row=rows[0].row, errors=ROW_NOT_SAVED_ERROR))
+            return
+        for row in rows:
+            _import_rows([row], result)
+        return
+
+    result.created += created
+    for error in errors:
+        _add_import_error(result, error)
+
+
+def _create_vacancies(rows: list[VacancyImportRowDTO]) -> tuple[int, list[VacancyImportErrorDTO]]:
+    """Creates vacancies of the rows with their relations, returns the number of created vacancies
+    and errors of rows referencing unknown entities."""
+
+    vacancies: list[AddVacancyDTO] = [row.vacancy for row in rows]
+    companies = get_by_names(Company.objects.all(), {vacancy.company_name for vacancy in vacancies})
+    levels = get_by_names(Level.objects.all(), {vacancy.level for vacancy in vacancies})
+    countries = get_by_names(Country.objects.all(), {vacancy.country for vacancy in vacancies})
+    employment_formats = get_by_names(
+        EmploymentFormat.objects.all(), chain.from_iterable(vacancy.employment_format for vacancy in vacancies)
+    )
+    work_formats = get_by_names(
+        WorkFormat.objects.all(), chain.from_iterable(vacancy.work_format for vacancy in vacancies)
+    )
+
+    errors: list[VacancyImportErrorDTO] = []
+    resolved_rows: list[VacancyImportRowDTO] = []
+    for row in rows:
+        row_errors = _get_unknown_references_errors(
+            vacancy=row.vacancy,
+            companies=companies,
+            levels=levels,
+            countries=countries,
+            employment_formats=employment_formats,
+            work_formats=work_formats,
+        )
+        if row_errors:
+            errors.append(VacancyImportErrorDTO(row=row.row, errors=row_errors))
+        else:
+            resolved_rows.append(row)
+    if not resolved_rows:
+        return 0, errors
+
+    tags = get_or_create_by_names(
+        Tag.objects.all(), chain.from_iterable(_split_names(row.vacancy.tags, str.lower) for row in resolved_rows)
+    )
+    cities_names_by_country: dict[Country, set[str]] = {}
+    for row in resolved_rows:
+        country_cities = cities_names_by_country.setdefault(countries[row.vacancy.country], set())
+        country_cities.update(_split_names(row.vacancy.city, str.capitalize))
+    cities = get_or_create_cities(cities_names_by_country)
+
+    created_vacancies = Vacancy.objects.bulk_create(
+        [
+            Vacancy(
+                name=row.vacancy.name,
+                level=levels[row.vacancy.level],
+                company=companies[row.vacancy.company_name],
+                experience=row.vacancy.experience,
+                min_salary=row.vacancy.min_salary,
+                max_salary=row.vacancy.max_salary,
+                description=row.vacancy.description,
+            )
+            for row in resolved_rows
+        ]
+    )
+
+    vacancies_tags, vacancies_cities, vacancies_employment, vacancies_work = [], [], [], []
+    for vacancy, row in zip(created_vacancies, resolved_rows):
+        country = countries[row.vacancy.country]
+        vacancies_tags += [
+            Vacancy.tags.through(vacancy=vacancy, tag=tags[name])
+            for name in set(_split_names(row.vacancy.tags, str.lower))
+        ]
+        vacancies_cities += [
+            Vacancy.city.through(vacancy=vacancy, city=cities[(country.pk, name)])
+            for name in set(_split_names(row.vacancy.city, str.capitalize))
+        ]
+        vacancies_employment += [
+            Vacancy.employment_format.through(vacancy=vacancy, employmentformat=employment_formats[name])
+            for name in set(row.vacancy.employment_format)
+        ]
+        vacancies_work += [
+            Vacancy.work_format.through(vacancy=vacancy, workformat=work_formats[name])
+            for name in set(row.vacancy.work_format)
+        ]
+    Vacancy.tags.through.objects.bulk_create(vacancies_tags)
+    Vacancy.city.through.objects.bulk_create(vacancies_cities)
+    Vacancy.employment_format.through.objects.bulk_create(vacancies_employment)
+    Vacancy.work_format.through.objects.bulk_create(vacancies_work)
+
+    # Bulk queries do not send model signals, so derived data is refreshed explicitly.
+    vacancies_ids = [vacancy.pk for vacancy in created_vacancies]
+    update_vacancies_search_vector(vacancy_ids=vacancies_ids)
+    refresh_vacancy_listings(vacancy_ids=vacancies_ids)
+    enqueue_vacancy_qr_codes(vacancy_ids=vacancies_ids)
+    invalidate_search_cache()
+    return len(created_vacancies), errors
+
+
+def _get_unknown_references_errors(
+    vacancy: AddVacancyDTO,
+    companies: dict,
+    levels: dict,
+    countries: dict,
+    employment_formats: dict,
+    work_formats: dict,
+) -> dict[str, list[str]]:
+    """Gets errors of the vacancy fields referencing entities that do not exist in the database."""
+
+    errors: dict[str, list[str]] = {}
+    if vacancy.company_name not in companies:
+        errors['company_name'] = ["Company with provided name does not exist in the database."]
+    if vacancy.level not in levels:
+        errors['level'] = ["Level with provided name does not exist in the database."]
+    if vacancy.country not in countries:
+        errors['country'] = ["Country with provided name does not exist in the database."]
+    if set(vacancy.employment_format) - employment_formats.keys():
+        errors['employment_format'] = ["Employment format with provided name does not exist in the database."]
+    if set(vacancy.work_format) - work_formats.keys():
+        errors['work_format'] = ["Work format with provided name does not exist in the database."]
+    return errors
+
+
+def _split_names(value: str, normalize: Callable[[str], str]) -> Iterator[str]:
+    """Splits whitespace separated names and normalizes them, empty names are skipped."""
+
+    return (normalize(name) for name in NAMES_SEPARATOR.split(value) if name)
+
+
+def _add_import_error(result: VacancyImportResultDTO, error: VacancyImportErrorDTO) -> None:
+    """Counts the failed row, its errors are kept only up to VACANCY_IMPORT_MAX_REPORTED_ERRORS rows."""
+
+    result.failed += 1
+    if len(result.errors) < settings.VACANCY_IMPORT_MAX_REPORTED_ERRORS:
+        result.errors.append(error)
@@ -0,0 +1,89 @@
+"""
+Streaming parsing and validation of vacancies import files (CSV and NDJSON).
+
+Files are read line by line, so only one row is held in memory at a time. Every row is validated by the passed
+validator of the vacancy creation API, so the import accepts the same data and reports errors in the same format.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from typing import TYPE_CHECKING
+
+from core.business_logic.dto import AddVacancyDTO, VacancyImportRowDTO
+from core.business_logic.dto.vacancy import CSV_IMPORT_FORMAT, NDJSON_IMPORT_FORMAT
+from dacite import from_dict
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Iterator
+
+    from core.business_logic.interfaces import VacancyDataValidatorProtocol
+
+IMPORT_FORMATS_BY_EXTENSION = {
+    ".csv": CSV_IMPORT_FORMAT,
+    ".ndjson": NDJSON_IMPORT_FORMAT,
+    ".jsonl": NDJSON_IMPORT_FORMAT,
+}
+
+# List fields are passed in CSV files as a single column with values separated by semicolons.
+CSV_LIST_FIELDS = ("employment_format", "work_format")
+CSV_LIST_SEPARATOR = ";"
+
+INVALID_JSON_ERROR = "Invalid JSON object."
+
+
+def get_import_format(file_name: str) -> str | None:
+    """Gets the format of the import file by its extension."""
+
+    for extension, file_format in IMPORT_FORMATS_BY_EXTENSION.items():
+        if file_name.lower().endswith(extension):
+            return file_format
+    return None
+
+
+def get_vacancy_import_rows(
+    file: Iterable[bytes], file_format: str, validate_vacancy_data: VacancyDataValidatorProtocol
+) -> Iterator[VacancyImportRowDTO]:
+    """Lazily parses rows of the import file and validates them, rows are numbered from 1.
+
+    Unknown fields are ignored, an attachment can not be imported.
+    """
+
+    lines = (line.decode("utf-8-sig", errors="replace") for line in file)
+    rows = _read_csv_rows(lines) if file_format == CSV_IMPORT_FORMAT else _read_ndjson_rows(lines)
+    for row_number, data in rows:
+        if data is None:
+            yield VacancyImportRowDTO(row=row_number, vacancy=None, errors={"non_field_errors": [INVALID_JSON_ERROR]})
+            continue
+        data.pop("attachment", None)
+        vacancy_data, errors = validate_vacancy_data(data)
+        if vacancy_data is None:
+            yield VacancyImportRowDTO(row=row_number, vacancy=None, errors=errors)
+            continue
+        vacancy = from_dict(AddVacancyDTO, {"tags": "", "attachment": None, **vacancy_data})
+        yield VacancyImportRowDTO(row=row_number, vacancy=vacancy)
+
+
+def _read_csv_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Reads rows of the CSV file with a header, empty values are treated as missing."""
+
+    for row_number, row in enumerate(csv.DictReader(lines), start=1):
+        data: dict[str, Any] = {key: value for key, value in row.items() if key and value}
+        for field in CSV_LIST_FIELDS:
+            if field in data:
+                data[field] = [value.strip() for value in data[field].split(CSV_LIST_SEPARATOR) if value.strip()]
+        yield row_number, data
+
+
+def _read_ndjson_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """Reads JSON objects of the NDJSON file, one per line. Blank lines are skipped, invalid lines give None."""
+
+    for row_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            data = None
+        yield row_number, data if isinstance(data, dict) else None
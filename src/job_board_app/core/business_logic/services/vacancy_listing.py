@@ -0,0 +1,139 @@
+"""
+Services for maintaining and searching the flattened vacancy read model (VacancyListing) used by vacancies lists.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from core.business_logic.dto.vacancy import ICONTAINS_SEARCH_MODE, LIST_SHAPE
+from core.models import City, EmploymentFormat, Tag, Vacancy, VacancyListing, WorkFormat
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import F, OuterRef
+
+from .vacancy import filter_vacancies_by_salary, search_vacancies
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from core.business_logic.dto import SearchVacancyDTO
+    from django.db.models import QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+LISTING_FIELDS = (
+    'name',
+    'company_id',
+    'company_name',
+    'level_id',
+    'level_name',
+    'experience',
+    'min_salary',
+    'max_salary',
+    'salary_range',
+    'employment_format_ids',
+    'work_format_ids',
+    'tag_ids',
+    'city_ids',
+)
+
+
+def refresh_vacancy_listings(vacancy_ids: Iterable[int] | QuerySet) -> int:
+    """Recomputes listing rows of the vacancies with passed ids with one SELECT and one upsert query."""
+
+    rows = (
+        Vacancy.objects.filter(pk__in=vacancy_ids)
+        .values('id', 'name', 'company_id', 'level_id', 'experience', 'min_salary', 'max_salary', 'salary_range')
+        .annotate(
+            company_name=F('company__name'),
+            level_name=F('level__name'),
+            employment_format_ids=ArraySubquery(
+                Vacancy.employment_format.through.objects.filter(vacancy=OuterRef('pk')).values('employmentformat_id')
+            ),
+            work_format_ids=ArraySubquery(
+                Vacancy.work_format.through.objects.filter(vacancy=OuterRef('pk')).values('workformat_id')
+            ),
+            tag_ids=ArraySubquery(Vacancy.tags.through.objects.filter(vacancy=OuterRef('pk')).values('tag_id')),
+            city_ids=ArraySubquery(Vacancy.city.through.objects.filter(vacancy=OuterRef('pk')).values('city_id')),
+        )
+    )
+    listings = VacancyListing.objects.bulk_create(
+        [VacancyListing(**row) for row in rows],
+        update_conflicts=True,
+        unique_fields=['id'],
+        update_fields=LISTING_FIELDS,
+    )
+    logger.debug('Successfully refreshed vacancy listings.', extra={'refreshed_rows': len(listings)})
+    return len(listings)
+
+
+def delete_vacancy_listings(vacancy_ids: Iterable[int]) -> None:
+    """Deletes listing rows of the deleted vacancies."""
+
+    VacancyListing.objects.filter(pk__in=vacancy_ids).delete()
+
+
+def can_search_vacancy_listings(search_filters: SearchVacancyDTO) -> bool:
+    """Checks whether vacancies can be found by entered filters in the listing read model.
+
+    Description and keywords filters and the fuzzy search mode need the vacancies table.
+    """
+
+    return (
+        settings.VACANCY_LISTINGS_ENABLED
+        and search_filters.search_mode == ICONTAINS_SEARCH_MODE
+        and not search_filters.description
+        and not search_filters.query
+    )
+
+
+def search_vacancy_listings(search_filters: SearchVacancyDTO) -> QuerySet:
+    """Gets vacancy listings by entered filters, ordered by descending id.
+
+    Many-to-many filters are resolved to ids by subqueries and matched against the id arrays
+    of the listing rows, so the query scans only the listings table.
+    """
+
+    listings = VacancyListing.objects.all()
+    if search_filters.name:
+        listings = listings.filter(name__icontains=search_filters.name)
+    if search_filters.company_name:
+        listings = listings.filter(company_name__icontains=search_filters.company_name)
+    if search_filters.level:
+        listings = listings.filter(level_name=search_filters.level)
+    if search_filters.experience:
+        listings = listings.filter(experience__icontains=search_filters.experience)
+    listings = filter_vacancies_by_salary(vacancies=listings, search_filters=search_filters)
+    if search_filters.employment_format:
+        employment_format_ids = EmploymentFormat.objects.filter(name__in=search_filters.employment_format)
+        listings = listings.filter(employment_format_ids__overlap=ArraySubquery(employment_format_ids.values('pk')))
+    if search_filters.work_format:
+        work_format_ids = WorkFormat.objects.filter(name__in=search_filters.work_format)
+        listings = listings.filter(work_format_ids__overlap=ArraySubquery(work_format_ids.values('pk')))
+    if search_filters.country:
+        country_cities_ids = City.objects.filter(country__name=search_filters.country)
+        listings = listings.filter(city_ids__overlap=ArraySubquery(country_cities_ids.values('pk')))
+    if search_filters.city:
+        cities_ids = City.objects.filter(name=search_filters.city)
+        listings = listings.filter(city_ids__overlap=ArraySubquery(cities_ids.values('pk')))
+    if search_filters.tag:
+        tags_ids = Tag.objects.filter(name=search_filters.tag)
+        listings = listings.filter(tag_ids__overlap=ArraySubquery(tags_ids.values('pk')))
+
+    logger.info(
+        'The list of vacancy listings according to the transmitted filters has been successfully received.',
+        extra={'position': search_filters.name, 'company_name': search_filters.company_name},
+    )
+    return listings.order_by('-id')
+
+
+def search_vacancies_for_list(search_filters: SearchVacancyDTO) -> QuerySet:
+    """Gets vacancies for lists by entered filters: from the listing read model if it supports the filters,
+    otherwise from the vacancies table."""
+
+    if can_search_vacancy_listings(search_filters):
+        return search_vacancy_listings(search_filters=search_filters)
+    return search_vacancies(search_filters=search_filters, shape=LIST_SHAPE)
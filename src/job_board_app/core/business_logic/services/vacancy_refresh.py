@@ -0,0 +1,77 @@
+"""
+Refreshing of data derived from vacancies: search documents, listing rows and cached search results.
+
+Signal receivers refresh them on every change of a vacancy or its relations. Services changing a vacancy
+with several queries (save and then set of every relation) run them in `batch_vacancies_refresh`, so the
+changed vacancies are refreshed once at the end of the block instead of after every query.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from .search_vector import update_vacancies_search_vector
+
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator
+
+
+logger = logging.getLogger(__name__)
+
+_batch = threading.local()
+
+
+@contextmanager
+def batch_vacancies_refresh() -> Iterator[None]:
+    """Collects vacancies changed in the block, refreshes them and invalidates the search cache once at its end.
+
+    Nothing is refreshed if the block raises an exception, its transaction is expected to be rolled back.
+    Nested blocks are a part of the outermost one.
+    """
+
+    if getattr(_batch, 'vacancy_ids', None) is not None:
+        yield
+        return
+
+    _batch.vacancy_ids = set()
+    _batch.invalidate_search_cache = False
+    try:
+        yield
+        vacancy_ids, invalidate_search_cache = _batch.vacancy_ids, _batch.invalidate_search_cache
+    finally:
+        _batch.vacancy_ids = None
+    if vacancy_ids:
+        refresh_vacancies(vacancy_ids)
+    if invalidate_search_cache:
+        invalidate_vacancies_search_results()
+
+
+def refresh_vacancies(vacancy_ids: Iterable[int]) -> None:
+    """Recomputes search documents and listing rows of the vacancies, at the end of the current batch if any."""
+
+    if getattr(_batch, 'vacancy_ids', None) is not None:
+        _batch.vacancy_ids.update(vacancy_ids)
+        return
+
+    # Imported here, because the module imports the vacancy services that use this module.
+    from .vacancy_listing import refresh_vacancy_listings
+
+    vacancy_ids = list(vacancy_ids)
+    update_vacancies_search_vector(vacancy_ids=vacancy_ids)
+    refresh_vacancy_listings(vacancy_ids=vacancy_ids)
+
+
+def invalidate_vacancies_search_results() -> None:
+    """Makes cached vacancies search results stale, at the end of the current batch if any."""
+
+    if getattr(_batch, 'vacancy_ids', None) is not None:
+        _batch.invalidate_search_cache = True
+        return
+
+    # Imported here, because the module imports the vacancy services that use this module.
+    from .search_cache import invalidate_search_cache
+
+    invalidate_search_cache()
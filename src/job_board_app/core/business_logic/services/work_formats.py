@@ -2,11 +2,11 @@
 Services and business logic for working with data associated with WorkFormat entity in the database.
 """
 
-from core.models import WorkFormat
+from . import reference_data
 
 
 def get_work_formats() -> list[tuple[str, str]]:
-    """Gets work formats info from DB to EditProfileForm."""
+    """Gets work formats info from the reference data registry to EditProfileForm."""
 
-    formats = [(value.name, value.name) for value in WorkFormat.objects.all()]
+    formats = [(value.name, value.name) for value in reference_data.work_formats.all()]
     return formats
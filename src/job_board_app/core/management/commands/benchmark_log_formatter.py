@@ -0,0 +1,61 @@
+"""
+Management command that compares formatting time of log records by the previous and the current ContextFormatter.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from job_board_app.logger_formatter import ContextFormatter
+
+LOG_FORMAT = "[{asctime}] - {levelname} - {name} - {module}:{funcName}:{lineno} - {message}"
+
+
+class LegacyContextFormatter(logging.Formatter):
+    """Previous implementation of ContextFormatter: creates a record to get default attributes on every call."""
+
+    def format(self, record: logging.LogRecord) -> str:  # noqa
+        formatted_message: str = super().format(record=record)
+        default_log_record = logging.LogRecord('', 0, "", 0, None, None, None, None, None)
+        context_message = 'Context: '
+        for key, value in record.__dict__.items():
+            if key not in default_log_record.__dict__ and key not in ('message', 'asctime'):
+                context_message += f'({key}={value})| '
+        if context_message != 'Context: ':
+            formatted_message = formatted_message + ' ' + context_message
+        return formatted_message
+
+
+class Command(BaseCommand):
+    help = "Prints average time of formatting a log record by the previous and the current ContextFormatter."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--count', type=int, default=50000, help="Number of records formatted by every formatter.")
+        parser.add_argument('--context-size', type=int, default=5, help="Number of context values of every record.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        formatters: dict[str, logging.Formatter] = {
+            'Previous ContextFormatter': LegacyContextFormatter(LOG_FORMAT, style='{'),
+            'ContextFormatter': ContextFormatter(LOG_FORMAT, style='{'),
+            'ContextFormatter (JSON lines)': ContextFormatter(json_lines=True),
+        }
+        extra = {f'context_{index}': index for index in range(options['context_size'])}
+        for title, formatter in formatters.items():
+            average = self._measure(formatter, extra, options['count'])
+            self.stdout.write(f"{title}: {average * 1_000_000:.2f} us per record")
+
+    @staticmethod
+    def _measure(formatter: logging.Formatter, extra: dict[str, Any], count: int) -> float:
+        """Returns average time of formatting a record with the context in seconds."""
+
+        logger = logging.getLogger(__name__)
+        record = logger.makeRecord(logger.name, logging.INFO, __file__, 1, 'Vacancies have been found.', (), None)
+        record.__dict__.update(extra)
+        started = time.perf_counter()
+        for _ in range(count):
+            formatter.format(record)
+        return (time.perf_counter() - started) / count
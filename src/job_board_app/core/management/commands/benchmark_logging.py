@@ -0,0 +1,122 @@
+"""
+Management command that compares latency of API requests logging by synchronous handlers and by the queue handler.
+"""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+from core.models import Vacancy
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.test import Client, override_settings
+
+from job_board_app.logger_formatter import ContextFormatter
+from job_board_app.logger_handlers import ListenerQueueHandler
+
+LOG_FORMAT = "[{asctime}] - {levelname} - {name} - {module}:{funcName}:{lineno} - {message}"
+BENCHMARK_LOGGERS = ('root', 'django')
+
+
+class SlowStream:
+    """Text stream that waits `delay` seconds before every write, like a slow disk or a console read by a pipe."""
+
+    def __init__(self, stream: TextIO, delay: float) -> None:
+        self.stream = stream
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        if self.delay:
+            time.sleep(self.delay)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints latency of API requests while the app logs to a file and a stream by synchronous handlers "
+        "and by the queue handler with a listener thread."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--count', type=int, default=200, help="Number of requests with every logging setup.")
+        parser.add_argument('--url', help="Requested URL, the API URL of the first vacancy by default.")
+        parser.add_argument(
+            '--write-delay', type=float, default=0, help="Milliseconds every write of a log record to the stream takes."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        url = options['url']
+        if url is None:
+            vacancy_id = Vacancy.objects.order_by('pk').values_list('pk', flat=True).first()
+            if vacancy_id is None:
+                raise CommandError('There are no vacancies to request, pass --url.')
+            url = f'/api/v1/vacancies/{vacancy_id}/'
+
+        client = Client()
+        with tempfile.TemporaryDirectory() as directory, override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']
+        ):
+            client.get(url)
+            with open(Path(directory, 'console.log'), 'w', encoding='utf-8') as console:
+                stream = SlowStream(console, options['write_delay'] / 1000)
+                for title in ('Synchronous handlers', 'Queue handler'):
+                    targets: list[logging.Handler] = [
+                        logging.StreamHandler(stream),
+                        logging.FileHandler(Path(directory, 'inform.log'), encoding='utf-8'),
+                    ]
+                    for handler in targets:
+                        handler.setFormatter(ContextFormatter(LOG_FORMAT, style='{'))
+                    handlers = targets
+                    if title == 'Queue handler':
+                        handlers = [ListenerQueueHandler(targets, maxsize=settings.LOG_QUEUE_SIZE, overflow='block')]
+                    with self._log_to(handlers):
+                        latencies = self._measure(client, url, options['count'])
+                    for handler in targets:
+                        handler.close()
+                    self.stdout.write(
+                        f"{title}: {statistics.mean(latencies) * 1000:.2f} ms mean, "
+                        f"{statistics.median(latencies) * 1000:.2f} ms median, "
+                        f"{statistics.quantiles(latencies, n=20)[-1] * 1000:.2f} ms p95"
+                    )
+
+    @staticmethod
+    @contextmanager
+    def _log_to(handlers: list[logging.Handler]) -> Iterator[None]:
+        """Makes the benchmarked loggers pass INFO records to the handlers only, closes the handlers after it.
+
+        The queue handler is closed after the requests, so its listener thread writes all records before it stops.
+        """
+
+        loggers = [logging.getLogger(name) for name in BENCHMARK_LOGGERS]
+        previous = [(logger.handlers, logger.level) for logger in loggers]
+        for logger in loggers:
+            logger.handlers = handlers
+            logger.setLevel(logging.INFO)
+        try:
+            yield
+        finally:
+            for logger, (logger_handlers, level) in zip(loggers, previous):
+                logger.handlers = logger_handlers
+                logger.setLevel(level)
+            for handler in handlers:
+                handler.close()
+
+    @staticmethod
+    def _measure(client: Client, url: str, count: int) -> list[float]:
+        """Returns latencies of `count` GET requests to the URL in seconds."""
+
+        latencies = []
+        for _ in range(count):
+            started = time.perf_counter()
+            client.get(url)
+            latencies.append(time.perf_counter() - started)
+        return latencies
@@ -0,0 +1,65 @@
+"""
+Management command that compares per-vacancy latency of the local QR code renderer and the QR API adapter.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from core.business_logic.interfaces import QRApiAdapterProtocol
+from core.business_logic.services.common import QRApiAdapter, QRLocalAdapter
+from core.business_logic.services.qr_code import get_vacancy_qr_data
+from django.core.management.base import BaseCommand, CommandParser
+
+
+class QRApiStubHandler(BaseHTTPRequestHandler):
+    """Answers every request of the QR API adapter with the same PNG image, rendered once by the local adapter."""
+
+    png = QRLocalAdapter().render('stub')
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(self.png)))
+        self.end_headers()
+        self.wfile.write(self.png)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """Disables logging of stub requests."""
+
+
+class Command(BaseCommand):
+    help = "Prints average time of getting a vacancy QR code by QRLocalAdapter and by QRApiAdapter with a local stub."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--count', type=int, default=200, help="Number of QR codes got by every adapter.")
+        parser.add_argument('--size', type=int, default=150, help="Size of QR code images in pixels.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), QRApiStubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            adapters: dict[str, QRApiAdapterProtocol] = {
+                'QRLocalAdapter': QRLocalAdapter(size=options['size']),
+                'QRApiAdapter (local stub)': QRApiAdapter(base_url=f'http://127.0.0.1:{server.server_port}'),
+            }
+            for title, adapter in adapters.items():
+                average = self._measure(adapter, options['count'])
+                self.stdout.write(f"{title}: {average * 1000:.2f} ms per vacancy")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @staticmethod
+    def _measure(adapter: QRApiAdapterProtocol, count: int) -> float:
+        """Returns average time of getting QR codes of `count` different vacancies in seconds."""
+
+        started = time.perf_counter()
+        for vacancy_id in range(1, count + 1):
+            adapter.get_qr(data=get_vacancy_qr_data(vacancy_id)).read()
+        return (time.perf_counter() - started) / count
@@ -0,0 +1,97 @@
+"""
+Management command that compares EXPLAIN ANALYZE timings of vacancies search queries without and with search indexes.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from core.business_logic.dto.vacancy import LIST_SHAPE
+from core.business_logic.services import search_vacancies, search_vacancy_listings
+from core.management.commands.benchmark_search_vacancies import get_search_filters
+from core.management.seeding import SeedSize, seed_vacancies
+from core.models import City, Company, Vacancy
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.db.models import QuerySet
+
+# Indexes added for the vacancies search hot path (see the 0018_search_indexes and 0019_salary_range migrations).
+# Tags and cities are looked up by names through indexes of their unique constraints, which are not dropped.
+BENCHMARK_INDEXES = (
+    'vacancies_company_updated_idx',
+    'vacancies_level_id_idx',
+    'vacancies_salary_idx',
+    'vacancies_max_salary_idx',
+    'listings_level_id_idx',
+    'listings_salary_idx',
+    'listings_max_salary_idx',
+    'vacancies_salary_range_idx',
+    'listings_salary_range_idx',
+    'cities_name_idx',
+)
+EXECUTION_TIME_PATTERN = re.compile(r'Execution Time: ([\d.]+) ms')
+
+
+def get_benchmark_queries(limit: int) -> dict[str, QuerySet]:
+    """Builds the benchmarked queries: every query is served by one of the benchmarked indexes."""
+
+    company = Company.objects.filter(name__startswith='seed').order_by('pk').first() or Company.objects.first()
+    level_filters = get_search_filters(level='Middle')
+    salary_filters = get_search_filters(min_salary=4000, max_salary=5000)
+    max_salary_filters = get_search_filters(max_salary=700)
+    salary_overlap_filters = get_search_filters(min_salary=7000, max_salary=7500, salary_range_mode='overlaps')
+    return {
+        'company vacancies by updated_at': Vacancy.objects.filter(company=company).order_by('-updated_at'),
+        'level page': search_vacancies(level_filters, shape=LIST_SHAPE)[:limit],
+        'level page (listings)': search_vacancy_listings(level_filters)[:limit],
+        'salary range page': search_vacancies(salary_filters, shape=LIST_SHAPE)[:limit],
+        'salary range page (listings)': search_vacancy_listings(salary_filters)[:limit],
+        'max salary page (listings)': search_vacancy_listings(max_salary_filters)[:limit],
+        'salary overlap page': search_vacancies(salary_overlap_filters, shape=LIST_SHAPE)[:limit],
+        'salary overlap page (listings)': search_vacancy_listings(salary_overlap_filters)[:limit],
+        'city by name': City.objects.filter(name='seed_city_1_1'),
+    }
+
+
+class Command(BaseCommand):
+    help = "Prints EXPLAIN ANALYZE timings of vacancies search queries without and with the search indexes."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--seed-vacancies', type=int, default=0, help="Number of vacancies to seed before run.")
+        parser.add_argument('--random-seed', type=int, default=0)
+        parser.add_argument('--limit', type=int, default=20, help="Page size of benchmarked queries.")
+        parser.add_argument('--plans', action='store_true', help="Print full query plans.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['seed_vacancies']:
+            seed_vacancies(SeedSize(vacancies=options['seed_vacancies']), random_seed=options['random_seed'])
+            self.stdout.write(f"Seeded {options['seed_vacancies']} vacancies.")
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        # Indexes are dropped inside a transaction that is rolled back, so the database is left unchanged.
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for index in BENCHMARK_INDEXES:
+                    cursor.execute(f'DROP INDEX IF EXISTS "{index}"')
+            before = self._explain(get_benchmark_queries(options['limit']), plans=options['plans'], title='before')
+            transaction.set_rollback(True)
+        after = self._explain(get_benchmark_queries(options['limit']), plans=options['plans'], title='after')
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{'Query':<35}{'Before, ms':>12}{'After, ms':>12}"))
+        for title in before:
+            self.stdout.write(f'{title:<35}{before[title]:>12.3f}{after[title]:>12.3f}')
+
+    def _explain(self, queries: dict[str, QuerySet], plans: bool, title: str) -> dict[str, float]:
+        """Runs EXPLAIN ANALYZE of passed queries, returns their execution times in milliseconds."""
+
+        timings = {}
+        for query_title, queryset in queries.items():
+            plan = queryset.explain(analyze=True)
+            if plans:
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{query_title} / {title}'))
+                self.stdout.write(plan)
+            match = EXECUTION_TIME_PATTERN.search(plan)
+            timings[query_title] = float(match.group(1)) if match else float('nan')
+        return timings
@@ -0,0 +1,121 @@
+"""
+Management command that compares query plans of vacancies search with JOIN + DISTINCT and EXISTS filters.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from core.business_logic.dto import SearchVacancyDTO
+from core.business_logic.services import search_vacancies
+from core.management.seeding import SeedSize, seed_vacancies
+from core.models import Country, Vacancy
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Q, QuerySet
+
+BENCHMARK_FILTERS = {
+    'tag': {'tag': 'seed_tag_1'},
+    'formats': {'employment_format': ['B2B', 'Employment contract'], 'work_format': ['Remote work']},
+    'country + tag': {'country': 'seed_country_1', 'tag': 'seed_tag_2'},
+    'query': {'query': 'python'},
+}
+
+
+def get_search_filters(**filters: Any) -> SearchVacancyDTO:
+    """Creates SearchVacancyDTO with passed filters and empty values of other fields."""
+
+    search_filters = {
+        'name': '',
+        'company_name': '',
+        'level': '',
+        'experience': '',
+        'description': '',
+        'min_salary': None,
+        'max_salary': None,
+        'employment_format': [],
+        'work_format': [],
+        'country': '',
+        'city': '',
+        'tag': '',
+    }
+    search_filters.update(filters)
+    return SearchVacancyDTO(**search_filters)
+
+
+def search_vacancies_with_joins(search_filters: SearchVacancyDTO) -> QuerySet:
+    """Builds the vacancies search query the way it was built before EXISTS filters: JOINs + DISTINCT.
+
+    Supports the substring search mode only, it is kept as the reference for benchmarks and tests.
+    """
+
+    vacancies = Vacancy.objects.all()
+    if search_filters.name:
+        vacancies = vacancies.filter(name__icontains=search_filters.name)
+    if search_filters.company_name:
+        vacancies = vacancies.filter(company__name__icontains=search_filters.company_name)
+    if search_filters.level:
+        vacancies = vacancies.filter(level__name=search_filters.level)
+    if search_filters.experience:
+        vacancies = vacancies.filter(experience__icontains=search_filters.experience)
+    if search_filters.description:
+        vacancies = vacancies.filter(description__icontains=search_filters.description)
+    if search_filters.min_salary:
+        vacancies = vacancies.filter(min_salary__gte=search_filters.min_salary)
+    if search_filters.max_salary:
+        vacancies = vacancies.filter(max_salary__lte=search_filters.max_salary)
+    if search_filters.employment_format:
+        vacancies = vacancies.filter(employment_format__name__in=search_filters.employment_format)
+    if search_filters.work_format:
+        vacancies = vacancies.filter(work_format__name__in=search_filters.work_format)
+    if search_filters.country:
+        vacancies = vacancies.filter(city__country__in=Country.objects.filter(name=search_filters.country))
+    if search_filters.city:
+        vacancies = vacancies.filter(city__name=search_filters.city)
+    if search_filters.tag:
+        vacancies = vacancies.filter(tags__name=search_filters.tag)
+    if search_filters.query:
+        vacancies = vacancies.filter(
+            Q(name__icontains=search_filters.query)
+            | Q(description__icontains=search_filters.query)
+            | Q(company__name__icontains=search_filters.query)
+            | Q(tags__name__icontains=search_filters.query)
+            | Q(city__name__icontains=search_filters.query)
+        )
+    return vacancies.order_by('-id').distinct()
+
+
+class Command(BaseCommand):
+    help = "Prints EXPLAIN ANALYZE output and timings of vacancies search with JOIN + DISTINCT and EXISTS filters."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--seed-vacancies', type=int, default=0, help="Number of vacancies to seed before run.")
+        parser.add_argument('--random-seed', type=int, default=0)
+        parser.add_argument('--repeat', type=int, default=5, help="Number of timed executions of every query.")
+        parser.add_argument('--limit', type=int, default=20, help="Page size of benchmarked queries.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['seed_vacancies']:
+            seed_vacancies(SeedSize(vacancies=options['seed_vacancies']), random_seed=options['random_seed'])
+            self.stdout.write(f"Seeded {options['seed_vacancies']} vacancies.")
+
+        limit = options['limit']
+        for title, filters in BENCHMARK_FILTERS.items():
+            search_filters = get_search_filters(**filters)
+            queries = {
+                'JOIN + DISTINCT': search_vacancies_with_joins(search_filters)[:limit],
+                'EXISTS': search_vacancies(search_filters).prefetch_related(None).select_related(None)[:limit],
+            }
+            for variant, queryset in queries.items():
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{title} / {variant}'))
+                self.stdout.write(queryset.explain(analyze=True))
+                self.stdout.write(f"Average time: {self._measure(queryset, options['repeat']) * 1000:.2f} ms\n")
+
+    @staticmethod
+    def _measure(queryset: QuerySet, repeat: int) -> float:
+        """Returns average execution time of the passed query in seconds."""
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            list(queryset.values_list('pk', flat=True))
+        return (time.perf_counter() - started) / repeat
@@ -0,0 +1,69 @@
+"""
+Management command that compares peak memory of handling uploaded files kept in memory and streamed to temporary files.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from core.presentation.common.validators import ValidateFileExtensions, ValidateFileSize
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import RequestFactory, override_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints peak memory and time of parsing an uploaded PDF, validating it and saving it into the storage "
+        "when the upload is kept in memory and when it is streamed to a temporary file."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=4_000_000,
+            help="Size of the uploaded file in bytes, it should exceed FILE_UPLOAD_MAX_MEMORY_SIZE.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        content = b'%PDF-1.4\n' + b'0' * (options['size'] - 9)
+        # The memory upload handler compares the limit with the length of the whole request body.
+        limits = {
+            'In memory': options['size'] + 64 * 1024,
+            'Streamed to a temporary file': settings.FILE_UPLOAD_MAX_MEMORY_SIZE,
+        }
+        for title, limit in limits.items():
+            with tempfile.TemporaryDirectory() as media_root, override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=limit):
+                peak, duration, file_class = self._measure(content, FileSystemStorage(location=media_root))
+            self.stdout.write(
+                f"{title} ({file_class}): peak memory {peak / 1024 / 1024:.2f} MB, {duration * 1000:.2f} ms"
+            )
+
+    @staticmethod
+    def _measure(content: bytes, storage: FileSystemStorage) -> tuple[int, float, str]:
+        """Returns peak traced memory in bytes, time in seconds and the class of the uploaded file."""
+
+        request = RequestFactory().post('/', {'attachment': SimpleUploadedFile('cv.pdf', content)})
+        validators = [ValidateFileExtensions(['pdf']), ValidateFileSize(max_size=len(content) + 1)]
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            file = request.FILES['attachment']
+            for validator in validators:
+                result = validator(file)
+                if not result['status']:
+                    raise ValueError(result['message'])
+            storage.save(file.name, file)
+            duration = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        file.close()
+        return peak, duration, type(file).__name__
@@ -0,0 +1,34 @@
+"""
+Management command that deletes QR code images which are not referenced by vacancies.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from core.business_logic.services.qr_code import collect_unreferenced_qr_codes, get_qr_code_cache_hit_ratio
+from django.core.management.base import BaseCommand, CommandParser
+
+
+class Command(BaseCommand):
+    help = "Deletes QR code images that are not referenced by vacancies and prints the QR code cache hit ratio."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--min-age', type=int, default=3600, help="Seconds since the last modification of deleted images."
+        )
+        parser.add_argument('--dry-run', action='store_true', help="Print unreferenced images without deleting them.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        collected = collect_unreferenced_qr_codes(
+            min_age=timedelta(seconds=options['min_age']), dry_run=options['dry_run']
+        )
+        for name in collected:
+            self.stdout.write(name, style_func=None if options['dry_run'] else self.style.WARNING)
+        action = 'Found' if options['dry_run'] else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(f'{action} {len(collected)} unreferenced QR codes.'))
+
+        hit_ratio = get_qr_code_cache_hit_ratio()
+        if hit_ratio is not None:
+            self.stdout.write(f'QR code cache hit ratio: {hit_ratio:.1%}')
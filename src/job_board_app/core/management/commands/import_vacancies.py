@@ -0,0 +1,43 @@
+"""
+Management command that imports vacancies from a CSV or NDJSON file of a partner feed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from core.business_logic.dto.vacancy import IMPORT_FORMATS
+from core.business_logic.services import get_import_format, get_vacancy_import_rows, import_vacancies
+from core.presentation.api_v1.serializers import validate_add_vacancy_data
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+
+class Command(BaseCommand):
+    help = "Imports vacancies from a CSV file with a header row or an NDJSON file, prints errors of failed rows."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('path', help="Path to the imported file.")
+        parser.add_argument(
+            '--format',
+            choices=[file_format for file_format, _ in IMPORT_FORMATS],
+            help="Format of the file, detected by the file extension if not passed.",
+        )
+        parser.add_argument('--chunk-size', type=int, default=None, help="Number of rows saved by one transaction.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        file_format = options['format'] or get_import_format(options['path'])
+        if file_format is None:
+            raise CommandError("Format of the file is not supported, pass it with the --format option.")
+
+        with open(options['path'], 'rb') as file:
+            rows = get_vacancy_import_rows(
+                file=file, file_format=file_format, validate_vacancy_data=validate_add_vacancy_data
+            )
+            result = import_vacancies(rows=rows, chunk_size=options['chunk_size'])
+
+        for error in result.errors:
+            self.stderr.write(f'Row {error.row}: {json.dumps(error.errors)}')
+        if result.failed > len(result.errors):
+            self.stderr.write(f'Errors of {result.failed - len(result.errors)} more rows are not shown.')
+        self.stdout.write(self.style.SUCCESS(f'Created {result.created} vacancies, {result.failed} rows failed.'))
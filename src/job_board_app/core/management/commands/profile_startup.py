@@ -0,0 +1,41 @@
+"""
+Management command that reports import time of modules and database queries executed while an app process starts.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from core.management.startup import profile_startup
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+
+class Command(BaseCommand):
+    help = (
+        "Sets up Django and imports the URL configuration in a new interpreter, prints the slowest imported modules "
+        "and queries executed during imports."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--module', default=settings.ROOT_URLCONF, help="Imported module, ROOT_URLCONF by default.")
+        parser.add_argument('--limit', type=int, default=25, help="Number of printed modules.")
+        parser.add_argument('--prefix', default='', help="Print only modules whose names start with the prefix.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            profile = profile_startup(options['module'])
+        except RuntimeError as error:
+            raise CommandError(str(error)) from error
+
+        self.stdout.write(f"Startup with import of {options['module']}: {profile.duration * 1000:.0f} ms")
+        self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for item in profile.get_slowest_imports(options['limit'], prefix=options['prefix']):
+            self.stdout.write(f"{item.cumulative_time * 1000:>14.1f} {item.self_time * 1000:>9.1f}  {item.module}")
+
+        if not profile.queries:
+            self.stdout.write(self.style.SUCCESS('No queries are executed during imports.'))
+            return
+        self.stdout.write(self.style.WARNING(f'{len(profile.queries)} queries are executed during imports:'))
+        for query in profile.queries:
+            self.stdout.write(f"{query['module']}: {query['sql']}")
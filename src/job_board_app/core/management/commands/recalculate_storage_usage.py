@@ -0,0 +1,18 @@
+"""
+Management command that recalculates the media storage usage of companies from their stored files.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from core.business_logic.services.storage_usage import recalculate_companies_storage_usage
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recalculates the storage usage of every company by checking sizes of files referenced by it."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        updated = recalculate_companies_storage_usage()
+        self.stdout.write(self.style.SUCCESS(f'Updated storage usage of {updated} companies.'))
@@ -0,0 +1,39 @@
+"""
+Management command that runs the worker executing queued background jobs.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from core.business_logic.services import requeue_dead_jobs, run_pending_jobs
+from django.core.management.base import BaseCommand, CommandParser
+
+
+class Command(BaseCommand):
+    help = "Runs queued background jobs (QR codes of vacancies and others) until stopped."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--once', action='store_true', help="Run due jobs and exit.")
+        parser.add_argument('--limit', type=int, default=None, help="Maximum number of jobs run with --once.")
+        parser.add_argument('--sleep', type=float, default=1.0, help="Seconds to wait when there are no due jobs.")
+        parser.add_argument(
+            '--requeue-dead', action='store_true', help="Move jobs from the dead-letter list back to the queue first."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['requeue_dead']:
+            self.stdout.write(f'Requeued {requeue_dead_jobs()} dead jobs.')
+        if options['once']:
+            processed = run_pending_jobs(limit=options['limit'])
+            self.stdout.write(self.style.SUCCESS(f'Processed {processed} jobs.'))
+            return
+
+        self.stdout.write('Waiting for background jobs, press CTRL+C to stop.')
+        try:
+            while True:
+                if not run_pending_jobs(limit=100):
+                    time.sleep(options['sleep'])
+        except KeyboardInterrupt:
+            self.stdout.write('Worker has been stopped.')
@@ -0,0 +1,120 @@
+"""
+Helpers for seeding the database with a large synthetic set of vacancies (used by benchmarks and tests).
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from dataclasses import dataclass
+
+from core.business_logic.services.search_vector import update_vacancies_search_vector
+from core.business_logic.services.vacancy_listing import refresh_vacancy_listings
+from core.models import City, Company, Country, EmploymentFormat, Level, Tag, Vacancy, WorkFormat
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+SEED_PREFIX = 'seed'
+SEED_WORDS = (
+    'python', 'django', 'backend', 'frontend', 'developer', 'engineer', 'senior', 'data', 'analyst', 'devops',
+    'qa', 'manager', 'golang', 'java', 'react', 'cloud', 'platform', 'mobile', 'support', 'security',
+)  # fmt: skip
+
+
+@dataclass
+class SeedSize:
+    vacancies: int
+    companies: int = 50
+    tags: int = 100
+    countries: int = 5
+    cities_per_country: int = 10
+    batch_size: int = 1000
+
+
+def seed_vacancies(size: SeedSize, random_seed: int = 0) -> list[int]:
+    """Creates vacancies with random related entities, returns ids of created vacancies.
+
+    Random choices are driven by `random_seed`, so runs against the same database state produce
+    identical datasets. Rows are inserted with bulk queries in batches of `batch_size`.
+    """
+
+    rnd = random.Random(random_seed)
+    with transaction.atomic():
+        countries = [Country.objects.get_or_create(name=f'{SEED_PREFIX}_country_{i}')[0] for i in range(size.countries)]
+        cities = list(City.objects.filter(country__in=countries).order_by('pk'))
+        if not cities:
+            cities = City.objects.bulk_create(
+                [
+                    City(name=f'{SEED_PREFIX}_city_{country.pk}_{i}', country=country)
+                    for country in countries
+                    for i in range(size.cities_per_country)
+                ]
+            )
+        companies = _get_or_bulk_create_by_name(
+            Company,
+            names=[f'{SEED_PREFIX} {SEED_WORDS[i % len(SEED_WORDS)]} company {i}' for i in range(size.companies)],
+            staff=100,
+        )
+        tags = _get_or_bulk_create_by_name(Tag, names=[f'{SEED_PREFIX}_tag_{i}' for i in range(size.tags)])
+        levels = list(Level.objects.all())
+        employment_formats = list(EmploymentFormat.objects.all())
+        work_formats = list(WorkFormat.objects.all())
+
+        vacancies_ids: list[int] = []
+        for batch_start in range(0, size.vacancies, size.batch_size):
+            batch_end = min(batch_start + size.batch_size, size.vacancies)
+            vacancies = []
+            for i in range(batch_start, batch_end):
+                min_salary = rnd.randrange(500, 5000, 100)
+                max_salary = min_salary + rnd.randrange(0, 3000, 100)
+                vacancies.append(
+                    Vacancy(
+                        name=f'{rnd.choice(SEED_WORDS)} {rnd.choice(SEED_WORDS)} {i}',
+                        company=rnd.choice(companies),
+                        level=rnd.choice(levels),
+                        experience=f'{rnd.randint(0, 5)} years',
+                        min_salary=min_salary,
+                        max_salary=max_salary,
+                        description=' '.join(rnd.choices(SEED_WORDS, k=20)),
+                        attachment=f'{SEED_PREFIX}/attachment.pdf',
+                    )
+                )
+            vacancies = Vacancy.objects.bulk_create(vacancies)
+
+            vacancies_tags, vacancies_cities, vacancies_employment, vacancies_work = [], [], [], []
+            for vacancy in vacancies:
+                vacancies_tags += [
+                    Vacancy.tags.through(vacancy=vacancy, tag=tag) for tag in rnd.sample(tags, rnd.randint(1, 5))
+                ]
+                vacancies_cities += [
+                    Vacancy.city.through(vacancy=vacancy, city=city) for city in rnd.sample(cities, rnd.randint(1, 3))
+                ]
+                vacancies_employment += [
+                    Vacancy.employment_format.through(vacancy=vacancy, employmentformat=employment_format)
+                    for employment_format in rnd.sample(employment_formats, rnd.randint(1, len(employment_formats)))
+                ]
+                vacancies_work += [
+                    Vacancy.work_format.through(vacancy=vacancy, workformat=work_format)
+                    for work_format in rnd.sample(work_formats, rnd.randint(1, len(work_formats)))
+                ]
+            Vacancy.tags.through.objects.bulk_create(vacancies_tags)
+            Vacancy.city.through.objects.bulk_create(vacancies_cities)
+            Vacancy.employment_format.through.objects.bulk_create(vacancies_employment)
+            Vacancy.work_format.through.objects.bulk_create(vacancies_work)
+            vacancies_ids += [vacancy.pk for vacancy in vacancies]
+
+        update_vacancies_search_vector(vacancy_ids=vacancies_ids)
+        refresh_vacancy_listings(vacancy_ids=vacancies_ids)
+    logger.info('Successfully seeded vacancies.', extra={'vacancies': len(vacancies_ids)})
+    return vacancies_ids
+
+
+def _get_or_bulk_create_by_name(model: type[Company | Tag], names: list[str], **defaults: int) -> list:
+    """Gets entities with passed names, missing ones are created with a single bulk query."""
+
+    existing = list(model.objects.filter(name__in=names))
+    existing_names = {entity.name for entity in existing}
+    return existing + model.objects.bulk_create(
+        [model(name=name, **defaults) for name in names if name not in existing_names]
+    )
@@ -0,0 +1,94 @@
+"""
+Helpers for profiling the startup of an app process: import time of modules and queries executed during imports.
+
+The startup is measured in a fresh interpreter, so modules already imported by the current process
+do not hide their import cost. Import times are reported by `python -X importtime`, which does not see
+modules imported by `importlib.import_module` (e.g. URL configurations included by name), only their imports.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+# Sets up Django, imports the module passed as the first argument and prints queries executed meanwhile
+# with the innermost module being imported.
+PROFILED_STARTUP_SCRIPT = '''
+import json, sys, time, traceback
+
+started = time.perf_counter()
+queries = []
+
+
+def record_query(execute, sql, params, many, context):
+    frames = (frame for frame, _ in traceback.walk_stack(None) if frame.f_code.co_name == "<module>")
+    module = next((frame.f_globals.get("__name__") for frame in frames), None)
+    queries.append({"module": module, "sql": sql})
+    return execute(sql, params, many, context)
+
+
+import django
+from django.db import connection
+
+with connection.execute_wrapper(record_query):
+    django.setup()
+    __import__(sys.argv[1])
+print(json.dumps({"duration": time.perf_counter() - started, "queries": queries}))
+'''
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+@dataclass
+class ModuleImportTime:
+    module: str
+    self_time: float
+    cumulative_time: float
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    duration: float
+    import_times: list[ModuleImportTime] = field(default_factory=list)
+    queries: list[dict[str, str | None]] = field(default_factory=list)
+
+    def get_slowest_imports(self, limit: int, prefix: str = '') -> list[ModuleImportTime]:
+        """Gets modules with the longest cumulative import time, optionally only the ones starting with `prefix`."""
+
+        import_times = [item for item in self.import_times if item.module.startswith(prefix)]
+        return sorted(import_times, key=lambda item: item.cumulative_time, reverse=True)[:limit]
+
+
+def profile_startup(module: str) -> StartupProfile:
+    """Sets up Django and imports the module in a new interpreter, returns import times in seconds and queries."""
+
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROFILED_STARTUP_SCRIPT, module],
+        capture_output=True,
+        text=True,
+        # The interpreter gets the import path of the current process, so it finds the same settings module.
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(os.path.abspath(path) for path in sys.path)},
+        check=False,
+    )
+    if process.returncode:
+        raise RuntimeError(f'Failed to import {module}:\n{process.stderr[-2000:]}')
+
+    import_times = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is not None:
+            self_time, cumulative_time, indent, name = match.groups()
+            import_times.append(
+                ModuleImportTime(
+                    module=name,
+                    self_time=int(self_time) / 1_000_000,
+                    cumulative_time=int(cumulative_time) / 1_000_000,
+                    depth=len(indent) // 2,
+                )
+            )
+    result = json.loads(process.stdout.splitlines()[-1])
+    return StartupProfile(duration=result['duration'], import_times=import_times, queries=result['queries'])
@@ -0,0 +1,68 @@
+# Generated by Django 4.2.3 on 2026-10-17 22:19
+
+from typing import Any
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def populate_search_vector(apps: Any, schema_editor: Any) -> None:
+    """Populates search vector of already existing vacancies.
+
+    The search document is built from historical models as it is defined at this migration.
+    """
+    Vacancy = apps.get_model('core', 'Vacancy')
+    Company = apps.get_model('core', 'Company')
+    Tag = apps.get_model('core', 'Tag')
+    City = apps.get_model('core', 'City')
+
+    company_name = Subquery(Company.objects.filter(pk=OuterRef('company_id')).values('name')[:1])
+    tags_names = Subquery(
+        Tag.objects.filter(vacancies=OuterRef('pk'))
+        .values('vacancies')
+        .annotate(names=StringAgg('name', delimiter=' '))
+        .values('names')
+    )
+    cities_names = Subquery(
+        City.objects.filter(vacancies=OuterRef('pk'))
+        .values('vacancies')
+        .annotate(names=StringAgg('name', delimiter=' '))
+        .values('names')
+    )
+    config = settings.FULL_TEXT_SEARCH_CONFIG
+    Vacancy.objects.update(
+        search_vector=SearchVector('name', weight='A', config=config)
+        + SearchVector(company_name, weight='B', config=config)
+        + SearchVector(tags_names, weight='B', config=config)
+        + SearchVector(cities_names, weight='C', config=config)
+        + SearchVector('description', weight='D', config=config)
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0014_vacancy_qr_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['search_vector'], name='vacancies_search_vector_idx'
+            ),
+        ),
+        migrations.RunPython(
+            code=populate_search_vector,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
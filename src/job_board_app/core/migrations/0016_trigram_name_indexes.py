@@ -0,0 +1,27 @@
+# Generated by Django 4.2.3 on 2026-10-17 23:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0015_vacancy_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='company',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['name'], name='companies_name_trgm_idx', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['name'], name='vacancies_name_trgm_idx', opclasses=['gin_trgm_ops']
+            ),
+        ),
+    ]
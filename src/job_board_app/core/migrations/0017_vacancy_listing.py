@@ -0,0 +1,82 @@
+# Generated by Django 4.2.3 on 2026-10-17 22:36
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+POPULATE_VACANCY_LISTINGS_SQL = '''
+INSERT INTO vacancy_listings (
+    id, name, company_id, company_name, level_id, level_name, experience, min_salary, max_salary,
+    employment_format_ids, work_format_ids, tag_ids, city_ids
+)
+SELECT
+    v.id, v.name, v.company_id, c.name, v.level_id, l.name, v.experience, v.min_salary, v.max_salary,
+    ARRAY(SELECT employmentformat_id FROM vacancy_employment_formats WHERE vacancy_id = v.id),
+    ARRAY(SELECT workformat_id FROM vacancy_work_formats WHERE vacancy_id = v.id),
+    ARRAY(SELECT tag_id FROM vacancies_tags WHERE vacancy_id = v.id),
+    ARRAY(SELECT city_id FROM vacancy_cities WHERE vacancy_id = v.id)
+FROM vacancies v
+JOIN companies c ON c.id = v.company_id
+JOIN levels l ON l.id = v.level_id
+'''
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0016_trigram_name_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VacancyListing',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('company_id', models.BigIntegerField()),
+                ('company_name', models.CharField(max_length=100)),
+                ('level_id', models.BigIntegerField()),
+                ('level_name', models.CharField(max_length=30)),
+                ('experience', models.CharField(max_length=30, null=True)),
+                ('min_salary', models.PositiveIntegerField(null=True)),
+                ('max_salary', models.PositiveIntegerField(null=True)),
+                (
+                    'employment_format_ids',
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), default=list, size=None
+                    ),
+                ),
+                (
+                    'work_format_ids',
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), default=list, size=None
+                    ),
+                ),
+                (
+                    'tag_ids',
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), default=list, size=None
+                    ),
+                ),
+                (
+                    'city_ids',
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), default=list, size=None
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'vacancy_listings',
+                'indexes': [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=['employment_format_ids'], name='listings_employment_fmts_idx'
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=['work_format_ids'], name='listings_work_formats_idx'
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(fields=['tag_ids'], name='listings_tags_idx'),
+                    django.contrib.postgres.indexes.GinIndex(fields=['city_ids'], name='listings_cities_idx'),
+                ],
+            },
+        ),
+        migrations.RunSQL(sql=POPULATE_VACANCY_LISTINGS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
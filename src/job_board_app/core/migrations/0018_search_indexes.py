@@ -0,0 +1,58 @@
+# Generated by Django 4.2.3 on 2026-10-17 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0017_vacancy_listing'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='city',
+            index=models.Index(fields=['name'], name='cities_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='city',
+            index=models.Index(fields=['country', 'name'], name='cities_country_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['name'], name='tags_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['company', '-updated_at'], name='vacancies_company_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['level', '-id'], name='vacancies_level_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['min_salary', 'max_salary'], name='vacancies_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(
+                condition=models.Q(('max_salary__isnull', False)),
+                fields=['max_salary'],
+                name='vacancies_max_salary_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='vacancylisting',
+            index=models.Index(fields=['level_name', '-id'], name='listings_level_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancylisting',
+            index=models.Index(fields=['min_salary', 'max_salary'], name='listings_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancylisting',
+            index=models.Index(
+                condition=models.Q(('max_salary__isnull', False)), fields=['max_salary'], name='listings_max_salary_idx'
+            ),
+        ),
+    ]
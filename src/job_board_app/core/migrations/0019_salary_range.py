@@ -0,0 +1,43 @@
+# Generated by Django 4.2.3 on 2026-10-17 22:49
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0018_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='salary_range',
+            field=django.contrib.postgres.fields.ranges.IntegerRangeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancylisting',
+            name='salary_range',
+            field=django.contrib.postgres.fields.ranges.IntegerRangeField(null=True),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE vacancies SET salary_range = int4range("
+                "CASE WHEN min_salary > max_salary THEN max_salary ELSE min_salary END, "
+                "CASE WHEN min_salary > max_salary THEN min_salary ELSE max_salary END, '[]') "
+                "WHERE min_salary IS NOT NULL OR max_salary IS NOT NULL",
+                "UPDATE vacancy_listings SET salary_range = vacancies.salary_range "
+                "FROM vacancies WHERE vacancies.id = vacancy_listings.id",
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['salary_range'], name='vacancies_salary_range_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancylisting',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['salary_range'], name='listings_salary_range_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.3 on 2026-10-17 23:18
+
+import core.models.company
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0020_background_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='companyprofile',
+            name='logo_error',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='companyprofile',
+            name='logo_original',
+            field=models.ImageField(null=True, upload_to=core.models.company.company_directory_path),
+        ),
+        migrations.AddField(
+            model_name='companyprofile',
+            name='logo_progress',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='companyprofile',
+            name='logo_status',
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ('pending', 'Pending'),
+                    ('processing', 'Processing'),
+                    ('ready', 'Ready'),
+                    ('failed', 'Failed'),
+                ],
+                default='',
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name='companyprofile',
+            name='logo_variants',
+            field=models.JSONField(default=dict),
+        ),
+    ]
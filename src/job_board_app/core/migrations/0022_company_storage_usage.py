@@ -0,0 +1,17 @@
+# Generated by Django 4.2.3 on 2026-10-17 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0021_company_logo_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='storage_usage',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
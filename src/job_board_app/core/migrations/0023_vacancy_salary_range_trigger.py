@@ -0,0 +1,53 @@
+"""
+Keeps the salary range of vacancies in sync with their minimum and maximum salaries by a database trigger.
+
+The range was set by a `pre_save` signal receiver only, so `QuerySet.update()` and `bulk_update()` of salaries
+left it stale. The trigger sets it on every insert and every update of the salaries or the range itself.
+"""
+
+from django.db import migrations
+
+CREATE_TRIGGER_SQL = """
+CREATE FUNCTION set_vacancy_salary_range() RETURNS trigger AS $$
+BEGIN
+    IF NEW.min_salary IS NULL AND NEW.max_salary IS NULL THEN
+        NEW.salary_range := NULL;
+    ELSE
+        NEW.salary_range := int4range(
+            CASE WHEN NEW.min_salary > NEW.max_salary THEN NEW.max_salary ELSE NEW.min_salary END,
+            CASE WHEN NEW.min_salary > NEW.max_salary THEN NEW.min_salary ELSE NEW.max_salary END,
+            '[]'
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vacancies_salary_range
+    BEFORE INSERT OR UPDATE OF min_salary, max_salary, salary_range ON vacancies
+    FOR EACH ROW EXECUTE FUNCTION set_vacancy_salary_range();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS vacancies_salary_range ON vacancies;
+DROP FUNCTION IF EXISTS set_vacancy_salary_range();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0022_company_storage_usage'),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=CREATE_TRIGGER_SQL, reverse_sql=DROP_TRIGGER_SQL),
+        migrations.RunSQL(
+            sql=(
+                # Recomputes ranges left stale by updates of salaries before the trigger.
+                "UPDATE vacancies SET salary_range = NULL",
+                "UPDATE vacancy_listings SET salary_range = vacancies.salary_range "
+                "FROM vacancies WHERE vacancies.id = vacancy_listings.id",
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
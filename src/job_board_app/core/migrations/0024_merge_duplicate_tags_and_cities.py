@@ -0,0 +1,85 @@
+"""
+Merges tags with equal names and cities with equal names in one country before they are made unique.
+
+References to a duplicate are moved to the earliest created row of its group, then duplicates are deleted.
+"""
+
+from typing import Any, Iterable
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import migrations
+from django.db.models import Count, Min, OuterRef
+
+
+def merge_duplicates(
+    queryset: Any, fields: Iterable[str], m2m_relations: Iterable[tuple], fk_relations: Iterable[tuple]
+) -> set[tuple[Any, int]]:
+    """Moves references to rows with equal `fields` to the earliest created row and deletes the other rows.
+
+    `m2m_relations` are (through model, owner field, target field) triples, `fk_relations` are (model, field) pairs.
+    Returns (through model, owner id) pairs of changed many-to-many relations.
+    """
+
+    changed_relations = set()
+    groups = queryset.values(*fields).annotate(kept_id=Min('pk'), rows=Count('pk')).filter(rows__gt=1)
+    for group in groups:
+        kept_id = group.pop('kept_id')
+        group.pop('rows')
+        duplicate_ids = list(queryset.filter(**group).exclude(pk=kept_id).values_list('pk', flat=True))
+
+        for through, owner, target in m2m_relations:
+            owner_ids = set(through.objects.filter(**{target: kept_id}).values_list(f'{owner}_id', flat=True))
+            for row in through.objects.filter(**{f'{target}__in': duplicate_ids}).order_by('pk'):
+                owner_id = getattr(row, f'{owner}_id')
+                if owner_id in owner_ids:
+                    # The owner already references the kept row.
+                    row.delete()
+                else:
+                    through.objects.filter(pk=row.pk).update(**{target: kept_id})
+                    owner_ids.add(owner_id)
+                changed_relations.add((through, owner_id))
+
+        for model, field in fk_relations:
+            model.objects.filter(**{f'{field}__in': duplicate_ids}).update(**{field: kept_id})
+        queryset.filter(pk__in=duplicate_ids).delete()
+    return changed_relations
+
+
+def merge_duplicate_tags_and_cities(apps: Any, schema_editor: Any) -> None:
+    Tag = apps.get_model('core', 'Tag')
+    City = apps.get_model('core', 'City')
+    Vacancy = apps.get_model('core', 'Vacancy')
+    VacancyListing = apps.get_model('core', 'VacancyListing')
+    Profile = apps.get_model('core', 'Profile')
+    Address = apps.get_model('core', 'Address')
+    Employee = apps.get_model('core', 'Employee')
+
+    changed = merge_duplicates(
+        Tag.objects.all(),
+        fields=('name',),
+        m2m_relations=((Vacancy.tags.through, 'vacancy', 'tag'), (Profile.tags.through, 'profile', 'tag')),
+        fk_relations=(),
+    )
+    changed |= merge_duplicates(
+        City.objects.all(),
+        fields=('country', 'name'),
+        m2m_relations=((Vacancy.city.through, 'vacancy', 'city'),),
+        fk_relations=((Address, 'city'), (Employee, 'city'), (Profile, 'city')),
+    )
+
+    # Listing rows keep ids of the vacancy tags and cities, they are recomputed for the changed vacancies.
+    vacancy_ids = {owner_id for through, owner_id in changed if through in (Vacancy.tags.through, Vacancy.city.through)}
+    VacancyListing.objects.filter(pk__in=vacancy_ids).update(
+        tag_ids=ArraySubquery(Vacancy.tags.through.objects.filter(vacancy=OuterRef('pk')).values('tag_id')),
+        city_ids=ArraySubquery(Vacancy.city.through.objects.filter(vacancy=OuterRef('pk')).values('city_id')),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0023_vacancy_salary_range_trigger'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_tags_and_cities, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.3 on 2026-10-18 00:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0024_merge_duplicate_tags_and_cities'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='city',
+            name='cities_country_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tag',
+            name='tags_name_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='city',
+            constraint=models.UniqueConstraint(fields=('country', 'name'), name='cities_country_name_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='tag',
+            constraint=models.UniqueConstraint(fields=('name',), name='tags_name_unique'),
+        ),
+    ]
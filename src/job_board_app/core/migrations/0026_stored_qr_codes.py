@@ -0,0 +1,36 @@
+# Generated by Django 4.2.3 on 2026-10-18 01:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0025_unique_tag_and_city_names'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredQRCode',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.PositiveIntegerField()),
+                (
+                    'company',
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name='stored_qr_codes',
+                        related_query_name='stored_qr_code',
+                        to='core.company',
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'stored_qr_codes',
+            },
+        ),
+    ]
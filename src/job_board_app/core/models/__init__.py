@@ -2,6 +2,7 @@
 Models package attributes.
 """
 from .address import Address
+from .background_job import BackgroundJob
 from .base import BaseModel
 from .business_area import BusinessArea
 from .city import City
@@ -13,17 +14,20 @@ from .employment_format import EmploymentFormat
 from .language import Language, LanguageLevel
 from .level import Level
 from .position import Position
+from .qr_code import StoredQRCode
 from .response import Response, ResponseStatus
 from .review import Review
 from .tag import Tag
 from .user import Profile, UsersLanguages
 from .vacancy import Vacancy
+from .vacancy_listing import VacancyListing
 from .work_format import WorkFormat
 from .work_status import WorkStatus
 
 __all__ = [
     "Country",
     "Address",
+    "BackgroundJob",
     "BaseModel",
     "BusinessArea",
     "City",
@@ -38,10 +42,12 @@ __all__ = [
     "Response",
     "ResponseStatus",
     "Review",
+    "StoredQRCode",
     "Tag",
     "Profile",
     "UsersLanguages",
     "Vacancy",
+    "VacancyListing",
     "WorkFormat",
     "WorkStatus",
     "EmailConfirmationCodes",
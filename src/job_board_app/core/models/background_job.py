@@ -0,0 +1,40 @@
+"""
+"Core" app BackgroundJob model of job_board_app project.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+from .base import BaseModel
+
+
+class BackgroundJob(BaseModel):
+    """Describes the fields and attributes of the BackgroundJob model in the database.
+
+    Jobs are queued tasks executed by the `run_background_jobs` worker. Completed jobs are deleted,
+    jobs that have failed all attempts stay with the "dead" status as a dead-letter list.
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DEAD = 'dead'
+    STATUSES = ((PENDING, 'Pending'), (RUNNING, 'Running'), (DEAD, 'Dead'))
+
+    task = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUSES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField()
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True)
+    last_error = models.TextField(default='', blank=True)
+
+    class Meta:
+        """Describes class metadata."""
+
+        db_table = "background_jobs"
+        indexes = [
+            models.Index(
+                fields=['run_after'], name='background_jobs_pending_idx', condition=models.Q(status='pending')
+            ),
+        ]
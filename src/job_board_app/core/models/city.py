@@ -19,3 +19,5 @@ class City(BaseModel):
         """Describes class metadata."""
 
         db_table = 'cities'
+        indexes = [models.Index(fields=['name'], name='cities_name_idx')]
+        constraints = [models.UniqueConstraint(fields=['country', 'name'], name='cities_country_name_unique')]
@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from .base import BaseModel
@@ -15,9 +16,29 @@ def company_directory_path(instance: "CompanyProfile", filename: str) -> str:
 
 
 class CompanyProfile(BaseModel):
-    """Describes the fields and attributes of the Company_Profile model in the database."""
+    """Describes the fields and attributes of the Company_Profile model in the database.
+
+    The uploaded logo is stored as `logo_original`, resized variants are generated by a background job.
+    `logo` is switched to the default variant when all variants are ready.
+    """
+
+    LOGO_PENDING = 'pending'
+    LOGO_PROCESSING = 'processing'
+    LOGO_READY = 'ready'
+    LOGO_FAILED = 'failed'
+    LOGO_STATUSES = (
+        (LOGO_PENDING, 'Pending'),
+        (LOGO_PROCESSING, 'Processing'),
+        (LOGO_READY, 'Ready'),
+        (LOGO_FAILED, 'Failed'),
+    )
 
     logo = models.ImageField(upload_to=company_directory_path, null=True)
+    logo_original = models.ImageField(upload_to=company_directory_path, null=True)
+    logo_variants = models.JSONField(default=dict)
+    logo_status = models.CharField(max_length=10, choices=LOGO_STATUSES, default='', blank=True)
+    logo_progress = models.PositiveSmallIntegerField(default=0)
+    logo_error = models.TextField(default='', blank=True)
     email = models.EmailField(null=False)
     founding_year = models.PositiveSmallIntegerField()
     description = models.CharField(max_length=800)
@@ -51,6 +72,7 @@ class Company(BaseModel):
 
     name = models.CharField(unique=True, max_length=100)
     staff = models.PositiveIntegerField(default=0)
+    storage_usage = models.BigIntegerField(default=0)
 
     business_area = models.ManyToManyField(
         to="BusinessArea", related_name='companies', related_query_name='company', db_table='company_business_areas'
@@ -60,3 +82,6 @@ class Company(BaseModel):
         """Describes class metadata."""
 
         db_table = "companies"
+        indexes = [
+            GinIndex(fields=['name'], name='companies_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
@@ -0,0 +1,30 @@
+"""
+"Core" app StoredQRCode model of job_board_app project.
+"""
+
+from django.db import models
+
+from .base import BaseModel
+
+
+class StoredQRCode(BaseModel):
+    """Describes the fields and attributes of the StoredQRCode model in the database.
+
+    Every row records a content-addressed QR code image stored by a background job and the company whose storage
+    usage its size has been added to, so the size is subtracted when the unreferenced image is collected.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveIntegerField()
+    company = models.ForeignKey(
+        to="Company",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='stored_qr_codes',
+        related_query_name='stored_qr_code',
+    )
+
+    class Meta:
+        """Describes class metadata."""
+
+        db_table = "stored_qr_codes"
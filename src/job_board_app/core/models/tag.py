@@ -16,3 +16,4 @@ class Tag(BaseModel):
         """Describes class metadata."""
 
         db_table = "tags"
+        constraints = [models.UniqueConstraint(fields=['name'], name='tags_name_unique')]
@@ -2,6 +2,9 @@
 "Core" app Vacancy model of job_board_app project.
 """
 
+from django.contrib.postgres.fields import IntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from .base import BaseModel
@@ -41,11 +44,25 @@ class Vacancy(BaseModel):
     city = models.ManyToManyField(to='City', related_name='vacancies', db_table='vacancy_cities')
     attachment = models.FileField(upload_to=vacancy_attachments_directory_path, null=True)
     qr_code = models.ImageField(upload_to=vacancy_qr_codes_directory_path, null=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Set from min_salary and max_salary by the vacancies_salary_range database trigger on every write.
+    salary_range = IntegerRangeField(null=True, editable=False)
 
     class Meta:
         """Describes class metadata."""
 
         db_table = "vacancies"
+        indexes = [
+            GinIndex(fields=['search_vector'], name='vacancies_search_vector_idx'),
+            GinIndex(fields=['name'], name='vacancies_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['company', '-updated_at'], name='vacancies_company_updated_idx'),
+            models.Index(fields=['level', '-id'], name='vacancies_level_id_idx'),
+            models.Index(fields=['min_salary', 'max_salary'], name='vacancies_salary_idx'),
+            models.Index(
+                fields=['max_salary'], name='vacancies_max_salary_idx', condition=models.Q(max_salary__isnull=False)
+            ),
+            GistIndex(fields=['salary_range'], name='vacancies_salary_range_idx'),
+        ]
         permissions = [
             ('apply_to_vacancy', 'Allows apply to any vacancy'),
         ]
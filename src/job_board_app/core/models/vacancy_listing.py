@@ -0,0 +1,64 @@
+"""
+"Core" app VacancyListing model of job_board_app project.
+"""
+
+from typing import NamedTuple
+
+from django.contrib.postgres.fields import ArrayField, IntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.db import models
+
+
+class ListingRelation(NamedTuple):
+    """Id and name of the company or level of a vacancy listing."""
+
+    id: int
+    name: str
+
+
+class VacancyListing(models.Model):
+    """Describes the fields of the flattened vacancy read model used by vacancies lists.
+
+    Every row mirrors the vacancy with the same id and is maintained by signal receivers
+    of the "core" app, it is never edited directly.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=100)
+    company_id = models.BigIntegerField()
+    company_name = models.CharField(max_length=100)
+    level_id = models.BigIntegerField()
+    level_name = models.CharField(max_length=30)
+    experience = models.CharField(max_length=30, null=True)
+    min_salary = models.PositiveIntegerField(null=True)
+    max_salary = models.PositiveIntegerField(null=True)
+    salary_range = IntegerRangeField(null=True)
+    employment_format_ids = ArrayField(models.BigIntegerField(), default=list)
+    work_format_ids = ArrayField(models.BigIntegerField(), default=list)
+    tag_ids = ArrayField(models.BigIntegerField(), default=list)
+    city_ids = ArrayField(models.BigIntegerField(), default=list)
+
+    class Meta:
+        """Describes class metadata."""
+
+        db_table = "vacancy_listings"
+        indexes = [
+            GinIndex(fields=['employment_format_ids'], name='listings_employment_fmts_idx'),
+            GinIndex(fields=['work_format_ids'], name='listings_work_formats_idx'),
+            GinIndex(fields=['tag_ids'], name='listings_tags_idx'),
+            GinIndex(fields=['city_ids'], name='listings_cities_idx'),
+            models.Index(fields=['level_name', '-id'], name='listings_level_id_idx'),
+            models.Index(fields=['min_salary', 'max_salary'], name='listings_salary_idx'),
+            models.Index(
+                fields=['max_salary'], name='listings_max_salary_idx', condition=models.Q(max_salary__isnull=False)
+            ),
+            GistIndex(fields=['salary_range'], name='listings_salary_range_idx'),
+        ]
+
+    @property
+    def company(self) -> ListingRelation:
+        return ListingRelation(id=self.company_id, name=self.company_name)
+
+    @property
+    def level(self) -> ListingRelation:
+        return ListingRelation(id=self.level_id, name=self.level_name)
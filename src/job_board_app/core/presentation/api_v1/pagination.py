@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from core.presentation.common.pagination import KeysetPagination
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 if TYPE_CHECKING:
+    from core.presentation.common.pagination import Cursor, KeysetPage
     from django.db.models import QuerySet
+    from django.http import QueryDict
     from rest_framework.request import Request
-    from rest_framework.response import Response
 
 
 class APIPaginator:
@@ -27,3 +31,39 @@ class APIPaginator:
     def paginate(self, data: Any) -> Response:
         """Creates paginated response."""
         return self._paginator_class.get_paginated_response(data=data)
+
+
+class APICursorPaginator:
+    """Custom API keyset (cursor) paginator. Doesn't count the total number of rows."""
+
+    def __init__(self, per_page: int) -> None:
+        self._pagination = KeysetPagination(per_page=per_page)
+        self._page: KeysetPage | None = None
+        self._url = ""
+
+    def get_cursor(self, request: Request) -> Cursor | None:
+        """Gets decoded cursor from the request query params, or `None` if the first page is requested."""
+        value = request.query_params.get("cursor")
+        if not value:
+            return None
+        return self._pagination.decode_cursor(value=value)
+
+    def get_paginated_data(
+        self, queryset: QuerySet, request: Request, filters: QueryDict, cursor: Cursor | None
+    ) -> list:
+        """Gets the page of data that follows passed cursor."""
+        self._url = request.build_absolute_uri(request.path)
+        self._page = self._pagination.paginate(data=queryset, filters=filters, cursor=cursor)
+        return self._page.data
+
+    def paginate(self, data: Any) -> Response:
+        """Creates paginated response."""
+        next_cursor = self._page.next_cursor if self._page is not None else None
+        prev_cursor = self._page.prev_cursor if self._page is not None else None
+        return Response(
+            data={
+                "next": replace_query_param(self._url, "cursor", next_cursor) if next_cursor else None,
+                "previous": replace_query_param(self._url, "cursor", prev_cursor) if prev_cursor else None,
+                "results": data,
+            }
+        )
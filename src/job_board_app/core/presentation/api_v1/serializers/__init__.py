@@ -13,8 +13,12 @@ from .vacancy import (
     AddVacancySerializer,
     SearchVacancySerializer,
     VacancyExtendedInfoSerializer,
+    VacancyFacetsResponseSerializer,
+    VacancyImportResponseSerializer,
+    VacancyImportSerializer,
     VacancyInfoPaginatedResponseSerializer,
     VacancyInfoSerializer,
+    validate_add_vacancy_data,
 )
 
 __all__ = [
@@ -29,4 +33,8 @@ __all__ = [
     "ErrorSerializer",
     "AddVacancyResponseSerializer",
     "VacancyInfoPaginatedResponseSerializer",
+    "VacancyFacetsResponseSerializer",
+    "VacancyImportSerializer",
+    "VacancyImportResponseSerializer",
+    "validate_add_vacancy_data",
 ]
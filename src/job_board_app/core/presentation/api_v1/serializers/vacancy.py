@@ -2,6 +2,9 @@
 "Core" app Vacancy API serializers of job_board_app project.
 """
 
+from typing import Any
+
+from core.business_logic.dto.vacancy import ICONTAINS_SEARCH_MODE, IMPORT_FORMATS, SALARY_RANGE_MODES, SEARCH_MODES
 from core.presentation.api_v1.validators import ValidateAPIData
 from core.presentation.common.validators import ValidateFileExtensions, ValidateFileSize
 from rest_framework import serializers
@@ -37,6 +40,11 @@ class SearchVacancySerializer(serializers.Serializer):
     )
     country = serializers.CharField(max_length=30, trim_whitespace=True, required=False, default="")
     city = serializers.CharField(max_length=30, trim_whitespace=True, required=False, default="")
+    query = serializers.CharField(max_length=100, trim_whitespace=True, required=False, default="")
+    search_mode = serializers.ChoiceField(choices=SEARCH_MODES, required=False, default=ICONTAINS_SEARCH_MODE)
+    salary_range_mode = serializers.ChoiceField(
+        choices=SALARY_RANGE_MODES, required=False, allow_blank=True, default=''
+    )
 
 
 class VacancyCompanyInfoSerializer(serializers.Serializer):
@@ -95,6 +103,15 @@ class AddVacancySerializer(serializers.Serializer):
     )
 
 
+def validate_add_vacancy_data(data: dict[str, Any]) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+    """Validates vacancy data with AddVacancySerializer, returns validated data (None if invalid) and errors."""
+
+    serializer = AddVacancySerializer(data=data)
+    if not serializer.is_valid():
+        return None, serializer.errors
+    return serializer.validated_data, {}
+
+
 class AddVacancyResponseSerializer(serializers.Serializer):
     """Serializes response message about successfully vacancy creation."""
 
@@ -109,3 +126,43 @@ class VacancyInfoPaginatedResponseSerializer(serializers.Serializer):
     next = serializers.CharField()
     previous = serializers.CharField()
     results = VacancyInfoSerializer(many=True)
+
+
+class VacancyFacetSerializer(serializers.Serializer):
+    """Serializes the number of found vacancies with a specific filter option."""
+
+    name = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class VacancyFacetsResponseSerializer(serializers.Serializer):
+    """Serializes vacancy facets response message."""
+
+    level = VacancyFacetSerializer(many=True)
+    employment_format = VacancyFacetSerializer(many=True)
+    work_format = VacancyFacetSerializer(many=True)
+    country = VacancyFacetSerializer(many=True)
+    city = VacancyFacetSerializer(many=True)
+    tag = VacancyFacetSerializer(many=True)
+
+
+class VacancyImportSerializer(serializers.Serializer):
+    """Validates the uploaded file of imported vacancies."""
+
+    file = serializers.FileField(allow_empty_file=False)
+    format = serializers.ChoiceField(choices=IMPORT_FORMATS, required=False)
+
+
+class VacancyImportErrorSerializer(serializers.Serializer):
+    """Serializes errors of a row that has not been imported."""
+
+    row = serializers.IntegerField()
+    errors = serializers.DictField()
+
+
+class VacancyImportResponseSerializer(serializers.Serializer):
+    """Serializes the result of vacancies import."""
+
+    created = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    errors = VacancyImportErrorSerializer(many=True)
@@ -2,11 +2,22 @@
 API Views package attributes, classes, and functions.
 """
 from .company import companies_api_controller, company_api_controller
-from .vacancy import vacancies_api_controller, vacancy_api_controller
+from .docs import swagger_ui_controller
+from .metrics import metrics_api_controller
+from .vacancy import (
+    vacancies_api_controller,
+    vacancies_import_api_controller,
+    vacancy_api_controller,
+    vacancy_facets_api_controller,
+)
 
 __all__ = [
     "vacancies_api_controller",
     "companies_api_controller",
     "vacancy_api_controller",
     "company_api_controller",
+    "vacancy_facets_api_controller",
+    "metrics_api_controller",
+    "vacancies_import_api_controller",
+    "swagger_ui_controller",
 ]
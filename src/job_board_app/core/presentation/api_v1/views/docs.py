@@ -0,0 +1,43 @@
+"""
+API Views (controllers) for job_board_app that serve the API documentation.
+
+The schema view of drf_yasg is created on the first request, so its schema generation machinery
+is not imported while app processes load URLs.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+    from django.http import HttpRequest, HttpResponse
+
+
+@lru_cache(maxsize=None)
+def get_swagger_ui_view() -> Callable[..., HttpResponse]:
+    """Creates the view rendering the API schema in Swagger UI."""
+
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+
+    schema_view = get_schema_view(
+        openapi.Info(
+            title="Jobbard API",
+            default_version="v1",
+            description="REST API for job_board project",
+            license=openapi.License(name="MIT License"),
+        ),
+        public=True,
+        permission_classes=[permissions.AllowAny],
+    )
+    view: Callable[..., HttpResponse] = schema_view.with_ui("swagger", cache_timeout=0)
+    return view
+
+
+def swagger_ui_controller(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+    """API controller that returns the API schema rendered in Swagger UI."""
+
+    return get_swagger_ui_view()(request, *args, **kwargs)
@@ -0,0 +1,34 @@
+"""
+API Views (controllers) for job_board_app that expose application counters for monitoring.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from core.business_logic.services import get_metrics
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+
+
+@swagger_auto_schema(
+    method="GET",
+    responses={
+        200: openapi.Response(
+            description="Successfull response",
+            schema=openapi.Schema(type=openapi.TYPE_OBJECT, additional_properties=openapi.Schema(type="integer")),
+        ),
+        403: openapi.Response(description="User is not an admin"),
+    },
+)
+@api_view(http_method_names=['GET'])
+@permission_classes([IsAdminUser])
+def metrics_api_controller(request: Request) -> Response:
+    """API controller that returns current values of application counters."""
+
+    return Response(data=get_metrics())
@@ -11,6 +11,7 @@ from logging import getLogger
 from typing import TYPE_CHECKING
 
 from core.business_logic.dto import AddVacancyDTO, SearchVacancyDTO
+from core.business_logic.dto.vacancy import IMPORT_FORMATS, SALARY_RANGE_MODES, SEARCH_MODES
 from core.business_logic.exceptions import (
     CompanyNotExistsError,
     CountryNotExistError,
@@ -18,23 +19,38 @@ from core.business_logic.exceptions import (
     VacancyNotExistsError,
     WorkFormatNotExistError,
 )
-from core.business_logic.services import create_vacancy, get_vacancy_by_id, search_vacancies
-from core.business_logic.services.common import QRApiAdapter
-from core.presentation.api_v1.pagination import APIPaginator
+from core.business_logic.services import (
+    create_vacancy,
+    get_import_format,
+    get_vacancy_by_id,
+    get_vacancy_facets,
+    get_vacancy_import_rows,
+    import_vacancies,
+    search_vacancies_cached,
+    search_vacancies_for_list,
+)
+from core.presentation.api_v1.pagination import APICursorPaginator, APIPaginator
 from core.presentation.api_v1.serializers import (
     AddVacancyResponseSerializer,
     AddVacancySerializer,
     ErrorSerializer,
     SearchVacancySerializer,
     VacancyExtendedInfoSerializer,
+    VacancyFacetsResponseSerializer,
+    VacancyImportResponseSerializer,
+    VacancyImportSerializer,
     VacancyInfoPaginatedResponseSerializer,
     VacancyInfoSerializer,
+    validate_add_vacancy_data,
 )
 from core.presentation.common.converters import convert_data_from_request_to_dto
+from core.presentation.common.pagination import InvalidCursor, OrderingNotSupported
+from django.db import transaction
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import parsers
-from rest_framework.decorators import api_view, parser_classes
+from rest_framework.decorators import api_view, parser_classes, permission_classes
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 
@@ -44,6 +60,43 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+SEARCH_VACANCY_PARAMETERS = [
+    openapi.Parameter(name="name", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(name="company_name", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(name="level", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(name="experience", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(name="min_salary", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    openapi.Parameter(name="max_salary", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    openapi.Parameter(name="tag", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(
+        name="employment_format",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_ARRAY,
+        items=openapi.Items(type=openapi.TYPE_STRING),
+    ),
+    openapi.Parameter(
+        name="work_format",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_ARRAY,
+        items=openapi.Items(type=openapi.TYPE_STRING),
+    ),
+    openapi.Parameter(name="country", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(name="city", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(name="query", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter(
+        name="search_mode",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        enum=[mode for mode, _ in SEARCH_MODES],
+    ),
+    openapi.Parameter(
+        name="salary_range_mode",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        enum=[mode for mode, _ in SALARY_RANGE_MODES],
+    ),
+]
+
 
 @swagger_auto_schema(
     method="POST",
@@ -86,30 +139,24 @@ logger = getLogger(__name__)
     method="GET",
     manual_parameters=[
         openapi.Parameter(name="page", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
-        openapi.Parameter(name="name", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
-        openapi.Parameter(name="company_name", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
-        openapi.Parameter(name="level", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
-        openapi.Parameter(name="experience", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
-        openapi.Parameter(name="min_salary", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
-        openapi.Parameter(name="max_salary", in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
-        openapi.Parameter(name="tag", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
         openapi.Parameter(
-            name="employment_format",
+            name="pagination",
+            description="Pass `cursor` to get keyset paginated response (`next`, `previous`, `results`) without count",
             in_=openapi.IN_QUERY,
-            type=openapi.TYPE_ARRAY,
-            items=openapi.Items(type=openapi.TYPE_STRING),
+            type=openapi.TYPE_STRING,
+            enum=["page", "cursor"],
         ),
         openapi.Parameter(
-            name="work_format",
+            name="cursor",
+            description="Opaque cursor from `next`/`previous` link, it already contains the filters",
             in_=openapi.IN_QUERY,
-            type=openapi.TYPE_ARRAY,
-            items=openapi.Items(type=openapi.TYPE_STRING),
+            type=openapi.TYPE_STRING,
         ),
-        openapi.Parameter(name="country", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
-        openapi.Parameter(name="city", in_=openapi.IN_QUERY, type=openapi.TYPE_STRING),
+        *SEARCH_VACANCY_PARAMETERS,
     ],
     responses={
         200: openapi.Response(description="Successfull response", schema=VacancyInfoPaginatedResponseSerializer),
+        400: openapi.Response(description="Provided invalid filters or cursor"),
         500: openapi.Response(description="Unhandled server error"),
     },
 )
@@ -120,13 +167,32 @@ logger = getLogger(__name__)
 def vacancies_api_controller(request: Request) -> Response:
     """API controller that returns list of all vacancies."""
     if request.method == 'GET':
-        filters_serializer = SearchVacancySerializer(data=request.query_params)
+        cursor_paginator = APICursorPaginator(per_page=20)
+        try:
+            cursor = cursor_paginator.get_cursor(request=request)
+        except InvalidCursor:
+            return Response(data={"message": "Invalid cursor."}, status=HTTP_400_BAD_REQUEST)
+        query_params = cursor.filters if cursor is not None else request.query_params
+        filters_serializer = SearchVacancySerializer(data=query_params)
         if filters_serializer.is_valid():
             data = convert_data_from_request_to_dto(
                 dto=SearchVacancyDTO, data_from_request=filters_serializer.validated_data
             )
-            vacancies = search_vacancies(search_filters=data)
+            if cursor is not None or request.query_params.get("pagination") == "cursor":
+                try:
+                    result_data = cursor_paginator.get_paginated_data(
+                        queryset=search_vacancies_for_list(search_filters=data),
+                        request=request,
+                        filters=query_params,
+                        cursor=cursor,
+                    )
+                except OrderingNotSupported:
+                    error_data = {"message": "Cursor pagination is not available for ranked search modes."}
+                    return Response(data=error_data, status=HTTP_400_BAD_REQUEST)
+                vacancies_info_serializer = VacancyInfoSerializer(result_data, many=True)
+                return cursor_paginator.paginate(data=vacancies_info_serializer.data)
             paginator = APIPaginator(per_page=20)
+            vacancies = search_vacancies_cached(search_filters=data)
             result_page = paginator.get_paginated_data(queryset=vacancies, request=request)
             vacancies_info_serializer = VacancyInfoSerializer(result_page, many=True)
             return paginator.paginate(data=vacancies_info_serializer.data)
@@ -138,8 +204,7 @@ def vacancies_api_controller(request: Request) -> Response:
         if add_vacancy_serializer.is_valid():
             vacancy_dto = convert_data_from_request_to_dto(AddVacancyDTO, add_vacancy_serializer.validated_data)
             try:
-                qr_adapter = QRApiAdapter(base_url="https://api.qrserver.com/v1/")
-                vacancy_id = create_vacancy(data=vacancy_dto, qr_adapter=qr_adapter)
+                vacancy_id = create_vacancy(data=vacancy_dto)
             except CompanyNotExistsError:
                 error_data = {"message": "Company with provided name does not exist in the database."}
                 return Response(data=error_data, status=HTTP_400_BAD_REQUEST)
@@ -159,6 +224,29 @@ def vacancies_api_controller(request: Request) -> Response:
         return Response(data=data_message)
 
 
+@swagger_auto_schema(
+    method="GET",
+    manual_parameters=SEARCH_VACANCY_PARAMETERS,
+    responses={
+        200: openapi.Response(description="Successfull response", schema=VacancyFacetsResponseSerializer),
+        400: openapi.Response(description="Provided invalid filters"),
+        500: openapi.Response(description="Unhandled server error"),
+    },
+)
+@api_view(http_method_names=['GET'])
+def vacancy_facets_api_controller(request: Request) -> Response:
+    """API controller that returns number of found vacancies per option of every search filter."""
+
+    filters_serializer = SearchVacancySerializer(data=request.query_params)
+    if not filters_serializer.is_valid():
+        logger.warning(f'The forms have not been validated. Errors: {filters_serializer.errors}')
+        return Response(data=filters_serializer.errors, status=HTTP_400_BAD_REQUEST)
+    data = convert_data_from_request_to_dto(dto=SearchVacancyDTO, data_from_request=filters_serializer.validated_data)
+    facets = get_vacancy_facets(search_filters=data)
+    facets_serializer = VacancyFacetsResponseSerializer(facets)
+    return Response(data=facets_serializer.data)
+
+
 @swagger_auto_schema(
     method="GET",
     manual_parameters=[openapi.Parameter(name="vacancy_id", in_=openapi.IN_PATH, type=openapi.TYPE_INTEGER)],
@@ -180,3 +268,53 @@ def vacancy_api_controller(request: Request, vacancy_id: int) -> Response:
         return Response(data=data, status=HTTP_404_NOT_FOUND)
     vacancy_serializer = VacancyExtendedInfoSerializer(vacancy.vacancy)
     return Response(data=vacancy_serializer.data)
+
+
+@swagger_auto_schema(
+    method="POST",
+    manual_parameters=[
+        openapi.Parameter(
+            name="file",
+            description="CSV file with a header row or NDJSON file, list fields of CSV rows are separated by `;`",
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_FILE,
+            required=True,
+        ),
+        openapi.Parameter(
+            name="format",
+            description="Format of the file, detected by the file extension if not passed",
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_STRING,
+            enum=[file_format for file_format, _ in IMPORT_FORMATS],
+            required=False,
+        ),
+    ],
+    responses={
+        200: openapi.Response(description="Successfully response", schema=VacancyImportResponseSerializer),
+        400: openapi.Response(description="Provided invalid file"),
+        403: openapi.Response(description="User is not an admin"),
+        500: openapi.Response(description="Unhandled server error"),
+    },
+)
+@transaction.non_atomic_requests
+@api_view(http_method_names=['POST'])
+@permission_classes([IsAdminUser])
+@parser_classes([parsers.MultiPartParser])
+def vacancies_import_api_controller(request: Request) -> Response:
+    """API controller that imports vacancies from the uploaded CSV or NDJSON file.
+
+    The request is not atomic, every chunk of rows is saved in its own transaction.
+    """
+
+    import_serializer = VacancyImportSerializer(data=request.data)
+    if not import_serializer.is_valid():
+        logger.warning(f'The forms have not been validated. Errors: {import_serializer.errors}')
+        return Response(data=import_serializer.errors, status=HTTP_400_BAD_REQUEST)
+    file = import_serializer.validated_data["file"]
+    file_format = import_serializer.validated_data.get("format") or get_import_format(file.name)
+    if file_format is None:
+        error_data = {"message": "Format of the file is not supported, pass it in the `format` field."}
+        return Response(data=error_data, status=HTTP_400_BAD_REQUEST)
+    rows = get_vacancy_import_rows(file=file, file_format=file_format, validate_vacancy_data=validate_add_vacancy_data)
+    result = import_vacancies(rows=rows)
+    return Response(data=VacancyImportResponseSerializer(result).data)
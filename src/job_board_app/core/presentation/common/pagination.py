@@ -0,0 +1,100 @@
+"""
+Keyset (cursor) pagination shared by API and web controllers.
+
+Pages are selected with `id < last_id` / `id > first_id` conditions instead of OFFSET, and the total
+number of rows is never counted. Cursors are signed, URL-safe tokens that carry the position and the
+filter set of the first request, so a cursor alone is enough to get the next or previous page.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.core import signing
+from django.http import QueryDict
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+CURSOR_QUERY_PARAMS = ("cursor", "pagination", "page")
+
+
+class InvalidCursor(Exception):
+    """Exception that raises when passed cursor is malformed or has been tampered with."""
+
+
+class OrderingNotSupported(Exception):
+    """Exception that raises when queryset is ordered not only by the pagination key."""
+
+
+@dataclass
+class Cursor:
+    position: int
+    reverse: bool
+    filters: QueryDict
+
+
+@dataclass
+class KeysetPage:
+    data: list
+    next_cursor: str | None
+    prev_cursor: str | None
+
+
+class KeysetPagination:
+    """Keyset pagination object. Paginates data ordered by descending id by passed per_page value."""
+
+    salt = "core.presentation.keyset_pagination"
+    ordering = ("-id",)
+
+    def __init__(self, per_page: int) -> None:
+        self._per_page = per_page
+
+    def encode_cursor(self, position: int, reverse: bool, filters: QueryDict) -> str:
+        """Encodes page position and filter set into an opaque cursor."""
+        payload = {
+            "p": position,
+            "r": reverse,
+            "f": {key: values for key, values in filters.lists() if key not in CURSOR_QUERY_PARAMS},
+        }
+        return signing.dumps(payload, salt=self.salt, compress=True)
+
+    def decode_cursor(self, value: str) -> Cursor:
+        """Decodes cursor created by `encode_cursor`."""
+        try:
+            payload = signing.loads(value, salt=self.salt)
+            filters = QueryDict(mutable=True)
+            for key, values in payload["f"].items():
+                filters.setlist(key, [str(item) for item in values])
+            return Cursor(position=int(payload["p"]), reverse=bool(payload["r"]), filters=filters)
+        except (signing.BadSignature, KeyError, TypeError, ValueError, AttributeError):
+            raise InvalidCursor
+
+    def paginate(self, data: QuerySet, filters: QueryDict, cursor: Cursor | None = None) -> KeysetPage:
+        """Gets the page of data that follows (or precedes) passed cursor."""
+        if tuple(data.query.order_by) != self.ordering:
+            raise OrderingNotSupported
+
+        if cursor is None:
+            rows = list(data[: self._per_page + 1])
+        elif not cursor.reverse:
+            rows = list(data.filter(id__lt=cursor.position)[: self._per_page + 1])
+        else:
+            rows = list(data.filter(id__gt=cursor.position).order_by("id")[: self._per_page + 1])
+
+        has_more = len(rows) > self._per_page
+        rows = rows[: self._per_page]
+        if cursor is not None and cursor.reverse:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, cursor is not None
+
+        next_cursor = None
+        prev_cursor = None
+        if rows and has_next:
+            next_cursor = self.encode_cursor(position=rows[-1].id, reverse=False, filters=filters)
+        if rows and has_previous:
+            prev_cursor = self.encode_cursor(position=rows[0].id, reverse=True, filters=filters)
+        return KeysetPage(data=rows, next_cursor=next_cursor, prev_cursor=prev_cursor)
@@ -12,6 +12,31 @@ if TYPE_CHECKING:
     from django.core.files import File
 
 
+# Leading bytes of files with the extension, checked by file validators
+FILE_SIGNATURES = {
+    'pdf': (b'%PDF-',),
+    'png': (b'\x89PNG\r\n\x1a\n',),
+    'jpg': (b'\xff\xd8\xff',),
+    'jpeg': (b'\xff\xd8\xff',),
+}
+
+
+def has_file_signature(file: File, extension: str) -> bool:
+    """Checks that the file starts with the signature of the extension, files of unknown extensions pass the check.
+
+    Only the first bytes of the file are read, so uploads stored in temporary files are not loaded into memory.
+    """
+
+    signatures = FILE_SIGNATURES.get(extension.lower())
+    if not signatures:
+        return True
+    position = file.tell()
+    file.seek(0)
+    header = file.read(max(len(signature) for signature in signatures))
+    file.seek(position)
+    return header.startswith(signatures)
+
+
 class ValidatorResponse(TypedDict):
     status: bool
     message: NotRequired[str]
@@ -55,7 +80,7 @@ class ValidateMaxAreasCount:
 
 
 class ValidateFileExtensions:
-    """Validates file extensions."""
+    """Validates file extensions and that the file content starts with the signature of its extension."""
 
     def __init__(self, available_extensions: list[str]) -> None:
         self._available_extensions = available_extensions
@@ -70,11 +95,14 @@ class ValidateFileExtensions:
         if file_extension not in self._available_extensions:
             return {"status": False, "message": f"Accept only {self._available_extensions}"}
 
+        if not has_file_signature(value, file_extension):
+            return {"status": False, "message": f"File content does not match the {file_extension} format"}
+
         return {"status": True}
 
 
 class ValidateFileSize:
-    """Validates file size."""
+    """Validates file size counted while the upload was streamed, the file content is not read."""
 
     def __init__(self, max_size: int) -> None:
         self._max_size = max_size
@@ -88,7 +116,7 @@ class ValidateFileSize:
 
 
 class ValidateImageExtensions:
-    """Validates image extensions."""
+    """Validates image extensions and that the image content starts with the signature of its extension."""
 
     def __init__(self, available_extensions: list[str]) -> None:
         self._available_extensions = available_extensions
@@ -98,4 +126,7 @@ class ValidateImageExtensions:
         if image_extensions not in self._available_extensions:
             return {"status": False, "message": f"Accept only {self._available_extensions}"}
 
+        if not has_file_signature(value, image_extensions):
+            return {"status": False, "message": f"File content does not match the {image_extensions} format"}
+
         return {"status": True}
@@ -3,6 +3,7 @@
 """
 from typing import Any
 
+from core.business_logic.dto.vacancy import SALARY_RANGE_MODES, SEARCH_MODES
 from core.presentation.common.validators import ValidateFileExtensions, ValidateFileSize, ValidateMaxTagCount
 from core.presentation.web.validators import ValidateWebData
 from django import forms
@@ -62,6 +63,9 @@ class SearchVacancyForm(forms.Form):
     experience = forms.CharField(label="Experience", max_length=30, strip=True, required=False)
     min_salary = forms.IntegerField(label="Min Salary", min_value=0, required=False)
     max_salary = forms.IntegerField(label="Max Salary", min_value=0, required=False)
+    salary_range_mode = forms.ChoiceField(
+        label="Salary match", choices=[("", "Min and max separately"), *SALARY_RANGE_MODES], required=False
+    )
     tag = forms.CharField(label="Tags", required=False)
     employment_format = forms.MultipleChoiceField(
         label='Employment formats', widget=forms.CheckboxSelectMultiple, required=False
@@ -69,6 +73,8 @@ class SearchVacancyForm(forms.Form):
     work_format = forms.MultipleChoiceField(label='Work formats', widget=forms.CheckboxSelectMultiple, required=False)
     country = forms.ChoiceField(label='Country', required=False)
     city = forms.CharField(label='City', required=False)
+    query = forms.CharField(label="Keywords", max_length=100, strip=True, required=False)
+    search_mode = forms.ChoiceField(label="Search mode", choices=SEARCH_MODES, required=False)
 
     def __init__(
         self,
@@ -20,6 +20,7 @@ from core.presentation.web.views import (
     add_vacancy_controller,
     apply_vacancy_controller,
     companies_list_controller,
+    company_logo_controller,
     get_company_controller,
     get_vacancy_controller,
     index_controller,
@@ -38,6 +39,11 @@ urlpatterns = [
     path("vacancy/add/", add_vacancy_controller, name="add-vacancy"),
     path("vacancy/<int:vacancy_id>/", get_vacancy_controller, name="vacancy"),
     path("company/<int:company_id>/", get_company_controller, name="company"),
+    path(
+        "company/<int:company_id>/logo/<slug:variant>.<slug:file_format>",
+        company_logo_controller,
+        name="company-logo",
+    ),
     path("signup/", registration_controller, name='signup'),
     path("confirmation/", registration_confirmation, name='confirm-signup'),
     path("signin/", login_controller, name='login'),
@@ -1,6 +1,6 @@
 """Views package initial attributes, classes, and functions."""
 
-from .company import add_company_controller, companies_list_controller, get_company_controller
+from .company import add_company_controller, companies_list_controller, company_logo_controller, get_company_controller
 from .login import login_controller
 from .logout import logout_controller
 from .registration import registration_confirmation, registration_controller
@@ -15,6 +15,7 @@ from .vacancy import (
 __all__ = [
     "add_company_controller",
     "get_company_controller",
+    "company_logo_controller",
     "companies_list_controller",
     "index_controller",
     "add_vacancy_controller",
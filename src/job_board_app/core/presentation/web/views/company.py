@@ -13,30 +13,36 @@ from core.business_logic.exceptions import (
     CompanyNotExistsError,
     CompanyProfileNotExistsError,
     CountryNotExistError,
+    ImageVariantNotExistError,
 )
 from core.business_logic.services import (
     create_company,
     get_companies,
     get_company_by_id,
+    get_company_logo_variant,
     get_company_profile_by_id,
     get_countries,
     get_vacancies_by_company_id,
 )
+from core.business_logic.services.image_variants import IMAGE_VARIANT_FORMATS
 from core.presentation.common.converters import convert_data_from_request_to_dto
 from core.presentation.web.forms import AddAddressFrom, AddCompanyForm, CompanyProfileForm
+from django.conf import settings
 from django.contrib.auth.decorators import login_required, permission_required
-from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseRedirect
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseBadRequest, HttpResponseRedirect
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.cache import patch_cache_control
 from django.views.decorators.cache import cache_page
 from django.views.decorators.http import require_http_methods
 
 if TYPE_CHECKING:
+    from core.models import CompanyProfile
     from django.http import HttpRequest
 
 
 logger = logging.getLogger(__name__)
-COUNTRIES = get_countries()
 
 
 @permission_required(["core.add_company"])
@@ -46,7 +52,7 @@ def add_company_controller(request: HttpRequest) -> HttpResponse:
     if request.method == "GET":
         company_form = AddCompanyForm(prefix='company')
         profile_form = CompanyProfileForm(prefix='profile')
-        address_form = AddAddressFrom(countries=COUNTRIES, prefix='address')
+        address_form = AddAddressFrom(countries=get_countries(), prefix='address')
         context = {"company_form": company_form, "profile_form": profile_form, "address_form": address_form}
         logger.info('Successfully rendered forms for adding a new company.')
         return render(request=request, template_name="add_company.html", context=context)
@@ -54,7 +60,7 @@ def add_company_controller(request: HttpRequest) -> HttpResponse:
     if request.method == "POST":
         company_form = AddCompanyForm(request.POST, prefix='company')
         profile_form = CompanyProfileForm(request.POST, request.FILES, prefix='profile')
-        address_form = AddAddressFrom(COUNTRIES, request.POST, prefix='address')
+        address_form = AddAddressFrom(get_countries(), request.POST, prefix='address')
         if company_form.is_valid() and profile_form.is_valid() and address_form.is_valid():
             company_data = convert_data_from_request_to_dto(AddCompanyDTO, company_form.cleaned_data)
             profile_data = convert_data_from_request_to_dto(AddCompanyProfileDTO, profile_form.cleaned_data)
@@ -107,7 +113,12 @@ def get_company_controller(request: HttpRequest, company_id: int) -> HttpRespons
         company = get_company_by_id(company_id=company_id)
         profile = get_company_profile_by_id(company_id=company_id)
         vacancies = get_vacancies_by_company_id(company_id=company_id)
-        context = {"company": company, "profile": profile, "vacancies": vacancies}
+        context = {
+            "company": company,
+            "profile": profile,
+            "vacancies": vacancies,
+            "logo_urls": get_company_logo_urls(profile),
+        }
         logger.info(  # pylint: disable=logging-fstring-interpolation
             f'Successfully rendered template(page) of company {company.name}.',
             extra={'company_id': company_id, 'company_name': company.name},
@@ -123,3 +134,40 @@ def get_company_controller(request: HttpRequest, company_id: int) -> HttpRespons
         return HttpResponseBadRequest("Company Profile with provided data does not exist in the database.")
 
     return render(request=request, template_name="get_company.html", context=context)
+
+
+def get_company_logo_urls(profile: CompanyProfile) -> dict[str, dict[str, str]]:
+    """Gets URLs of all variants of the company logo by variant name and format.
+
+    URLs contain the name of the uploaded logo, so a new logo gets new URLs and cached variants are not reused.
+    """
+
+    source = profile.logo_original or profile.logo
+    if not source:
+        return {}
+    version = source.name.rsplit('/', 1)[-1].split('.')[0]
+    return {
+        variant: {
+            file_format: reverse(
+                'company-logo',
+                kwargs={'company_id': profile.pk, 'variant': variant, 'file_format': file_format},
+            )
+            + f'?v={version}'
+            for file_format in IMAGE_VARIANT_FORMATS
+        }
+        for variant in settings.IMAGE_VARIANTS
+    }
+
+
+@require_http_methods(request_method_list=['GET'])
+def company_logo_controller(request: HttpRequest, company_id: int, variant: str, file_format: str) -> FileResponse:
+    """Controller for the company logo variant, it is generated on the first request and cached by clients."""
+
+    try:
+        name = get_company_logo_variant(company_id=company_id, variant=variant, file_format=file_format)
+    except (CompanyProfileNotExistsError, ImageVariantNotExistError):
+        logger.warning('Company logo variant does not exist.', extra={'company_id': company_id, 'variant': variant})
+        raise Http404("Company logo variant does not exist.")
+    response = FileResponse(default_storage.open(name))
+    patch_cache_control(response, public=True, max_age=settings.IMAGE_VARIANTS_CACHE_MAX_AGE, immutable=True)
+    return response
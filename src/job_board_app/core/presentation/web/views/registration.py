@@ -23,19 +23,16 @@ if TYPE_CHECKING:
     from django.http import HttpRequest
 
 
-ROLES = get_groups()
-
-
 @require_http_methods(['GET', 'POST'])
 def registration_controller(request: HttpRequest) -> HttpResponse:
     """Controller for registration(sign in) page."""
 
     if request.method == 'GET':
-        form = RegistrationForm(ROLES)
+        form = RegistrationForm(get_groups())
         context_1 = {'form': form}
         return render(request=request, template_name='sign-up.html', context=context_1)
     if request.method == 'POST':
-        form = RegistrationForm(ROLES, request.POST)
+        form = RegistrationForm(get_groups(), request.POST)
         if form.is_valid():
             received_data = convert_data_from_request_to_dto(dto=RegistrationDTO, data_from_request=form.cleaned_data)
             try:
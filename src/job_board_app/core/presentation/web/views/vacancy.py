@@ -22,10 +22,11 @@ from core.business_logic.services import (
     get_levels,
     get_vacancy_by_id,
     get_work_formats,
-    search_vacancies,
+    search_vacancies_cached,
+    search_vacancies_for_list,
 )
-from core.business_logic.services.common import QRApiAdapter
 from core.presentation.common.converters import convert_data_from_request_to_dto
+from core.presentation.common.pagination import InvalidCursor, KeysetPagination, OrderingNotSupported
 from core.presentation.web.forms import AddVacancyForm, ApplyVacancyForm, SearchVacancyForm
 from core.presentation.web.pagination import CustomPagination, PageNotExists
 from django.contrib.auth.decorators import login_required, permission_required
@@ -41,44 +42,64 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
-COUNTRIES: list[tuple[str, str]] = get_countries()
-WORK_FORMATS: list[tuple[str, str]] = get_work_formats()
-EMPLOYMENT_FORMATS: list[tuple[str, str]] = get_employment_formats()
-LEVELS: list[tuple[str, str]] = get_levels()
-
 
 @require_http_methods(request_method_list=["GET"])
 @login_required
 def index_controller(request: HttpRequest) -> HttpResponse:
     """Controller for index(main) page."""
+    keyset_paginator = KeysetPagination(per_page=20)
+    cursor = None
+    if request.GET.get("cursor"):
+        try:
+            cursor = keyset_paginator.decode_cursor(value=request.GET["cursor"])
+        except InvalidCursor:
+            return HttpResponseBadRequest("Invalid cursor.")
+    query_params = cursor.filters if cursor is not None else request.GET
+    levels, countries = [('', 'All')] + get_levels(), [('', 'All')] + get_countries()
+    employment_formats, work_formats = get_employment_formats(), get_work_formats()
     filters_form = SearchVacancyForm(
-        levels=[('', 'All')] + LEVELS,
-        employment_formats=EMPLOYMENT_FORMATS,
-        work_formats=WORK_FORMATS,
-        countries=[('', 'All')] + COUNTRIES,
-        data=request.GET,
+        levels=levels,
+        employment_formats=employment_formats,
+        work_formats=work_formats,
+        countries=countries,
+        data=query_params,
     )
     logger.info('index_page_log')
     if filters_form.is_valid():
         search_filters = convert_data_from_request_to_dto(SearchVacancyDTO, filters_form.cleaned_data)
-        vacancies = search_vacancies(search_filters=search_filters)
         form = SearchVacancyForm(
-            levels=[('', 'All')] + LEVELS,
-            employment_formats=EMPLOYMENT_FORMATS,
-            work_formats=WORK_FORMATS,
-            countries=[('', 'All')] + COUNTRIES,
-            data=request.GET,
+            levels=levels,
+            employment_formats=employment_formats,
+            work_formats=work_formats,
+            countries=countries,
+            data=query_params,
         )
-        page_number = request.GET.get("page", 1)
-        paginator = CustomPagination(per_page=20)
-        try:
-            vacancies_paginated = paginator.paginate(data=vacancies, page_number=page_number)
-        except PageNotExists:
-            return HttpResponseBadRequest("Page with provided number doesn't exist.")
-        context = {"vacancies": vacancies_paginated.data, "form": form}
+        if cursor is not None or request.GET.get("pagination") == "cursor":
+            try:
+                vacancies_page = keyset_paginator.paginate(
+                    data=search_vacancies_for_list(search_filters=search_filters), filters=query_params, cursor=cursor
+                )
+            except OrderingNotSupported:
+                return HttpResponseBadRequest("Cursor pagination is not available for ranked search modes.")
+            context = {
+                "vacancies": vacancies_page.data,
+                "form": form,
+                "next_cursor": vacancies_page.next_cursor,
+                "prev_cursor": vacancies_page.prev_cursor,
+                "cursor_pagination": True,
+            }
+        else:
+            page_number = request.GET.get("page", 1)
+            paginator = CustomPagination(per_page=20)
+            vacancies = search_vacancies_cached(search_filters=search_filters)
+            try:
+                vacancies_paginated = paginator.paginate(data=vacancies, page_number=page_number)
+            except PageNotExists:
+                return HttpResponseBadRequest("Page with provided number doesn't exist.")
+            context = {"vacancies": vacancies_paginated.data, "form": form}
         logger.info(
             "Successfully rendered index page by entered filters.",
-            extra={'Vacancies number': len(vacancies), "filter_data": filters_form.changed_data},
+            extra={'Vacancies number': len(context["vacancies"]), "filter_data": filters_form.changed_data},
         )
     else:
         context = {"form": filters_form}
@@ -91,23 +112,20 @@ def index_controller(request: HttpRequest) -> HttpResponse:
 @require_http_methods(request_method_list=["GET", "POST"])
 def add_vacancy_controller(request: HttpRequest) -> HttpResponse:
     """Controller for adding a new vacancy."""
+    choices = {
+        'levels': get_levels(),
+        'employment_formats': get_employment_formats(),
+        'work_formats': get_work_formats(),
+        'countries': get_countries(),
+    }
     if request.method == "GET":
-        form = AddVacancyForm(
-            levels=LEVELS, employment_formats=EMPLOYMENT_FORMATS, work_formats=WORK_FORMATS, countries=COUNTRIES
-        )
+        form = AddVacancyForm(**choices)
         context = {"form": form}
         logger.info("Successfully rendered form for adding vacancy.")
         return render(request=request, template_name="add_vacancy.html", context=context)
 
     if request.method == 'POST':
-        form = AddVacancyForm(
-            levels=LEVELS,
-            employment_formats=EMPLOYMENT_FORMATS,
-            work_formats=WORK_FORMATS,
-            countries=COUNTRIES,
-            data=request.POST,
-            files=request.FILES,
-        )
+        form = AddVacancyForm(**choices, data=request.POST, files=request.FILES)
         if form.is_valid():
             data = convert_data_from_request_to_dto(AddVacancyDTO, form.cleaned_data)
             logger.info(
@@ -117,8 +135,7 @@ def add_vacancy_controller(request: HttpRequest) -> HttpResponse:
                 },
             )
             try:
-                qr_adapter = QRApiAdapter(base_url="https://api.qrserver.com/v1/")
-                create_vacancy(data=data, qr_adapter=qr_adapter)
+                create_vacancy(data=data)
             except CompanyNotExistsError:
                 error_context = {
                     "form": form,
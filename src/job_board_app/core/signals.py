@@ -0,0 +1,169 @@
+"""
+Signal receivers of "core" app job_board_app project.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from core.business_logic.services.reference_data import invalidate_reference_data
+from core.business_logic.services.search_vector import update_vacancies_search_vector
+from core.business_logic.services.vacancy_listing import delete_vacancy_listings, refresh_vacancy_listings
+from core.business_logic.services.vacancy_refresh import invalidate_vacancies_search_results, refresh_vacancies
+from core.models import City, Company, Country, EmploymentFormat, Level, ResponseStatus, Tag, Vacancy, WorkFormat
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+
+def get_m2m_changed_vacancy_ids(
+    instance: Vacancy | Tag | City | EmploymentFormat | WorkFormat, action: str, reverse: bool, pk_set: set[int] | None
+) -> list[int] | set[int]:
+    """Gets ids of vacancies whose relations have been changed by the `m2m_changed` signal action.
+
+    Ids of vacancies related to the instance are remembered on `pre_clear` of the reverse side,
+    because on `post_clear` the relations are already deleted.
+    """
+
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            return [instance.pk]
+        return []
+
+    if action == 'pre_clear':
+        instance._cleared_vacancy_ids = list(instance.vacancies.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        return getattr(instance, '_cleared_vacancy_ids', [])
+    elif action in ('post_add', 'post_remove') and pk_set:
+        return pk_set
+    return []
+
+
+@receiver(post_save, sender=Vacancy)
+def refresh_saved_vacancy(sender: type[Vacancy], instance: Vacancy, **kwargs: Any) -> None:
+    """Refreshes the search document and the listing row of the created or updated vacancy."""
+
+    refresh_vacancies(vacancy_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=City)
+def refresh_related_vacancies_search_vector(
+    sender: type[Company | Tag | City], instance: Company | Tag | City, created: bool, **kwargs: Any
+) -> None:
+    """Refreshes the search documents of vacancies related to the renamed company, tag or city."""
+
+    if created:
+        return
+    vacancy_ids = instance.vacancies.values('pk')
+    update_vacancies_search_vector(vacancy_ids=vacancy_ids)
+
+
+@receiver(post_delete, sender=Vacancy)
+def delete_deleted_vacancy_listing(sender: type[Vacancy], instance: Vacancy, **kwargs: Any) -> None:
+    """Deletes the listing row of the deleted vacancy."""
+
+    delete_vacancy_listings(vacancy_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Level)
+def refresh_related_vacancy_listings(
+    sender: type[Company | Level], instance: Company | Level, created: bool, **kwargs: Any
+) -> None:
+    """Refreshes the listing rows of vacancies related to the renamed company or level."""
+
+    if created:
+        return
+    refresh_vacancy_listings(vacancy_ids=instance.vacancies.values('pk'))
+
+
+@receiver(m2m_changed, sender=Vacancy.tags.through)
+@receiver(m2m_changed, sender=Vacancy.city.through)
+@receiver(m2m_changed, sender=Vacancy.employment_format.through)
+@receiver(m2m_changed, sender=Vacancy.work_format.through)
+def refresh_vacancies_on_m2m_change(
+    sender: type,
+    instance: Vacancy | Tag | City | EmploymentFormat | WorkFormat,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: Any,
+) -> None:
+    """Refreshes search documents and listing rows of vacancies whose tags, cities or formats have been changed."""
+
+    vacancy_ids = get_m2m_changed_vacancy_ids(instance=instance, action=action, reverse=reverse, pk_set=pk_set)
+    if vacancy_ids:
+        refresh_vacancies(vacancy_ids=vacancy_ids)
+
+
+@receiver(pre_delete, sender=Tag)
+@receiver(pre_delete, sender=City)
+@receiver(pre_delete, sender=EmploymentFormat)
+@receiver(pre_delete, sender=WorkFormat)
+def remember_vacancies_of_deleted_relation(
+    sender: type, instance: Tag | City | EmploymentFormat | WorkFormat, **kwargs: Any
+) -> None:
+    """Remembers vacancies related to the deleted entity, relations are deleted without `m2m_changed` signals."""
+
+    instance._deleted_vacancy_ids = list(instance.vacancies.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=City)
+@receiver(post_delete, sender=EmploymentFormat)
+@receiver(post_delete, sender=WorkFormat)
+def refresh_vacancies_of_deleted_relation(
+    sender: type, instance: Tag | City | EmploymentFormat | WorkFormat, **kwargs: Any
+) -> None:
+    """Refreshes search documents and listing rows of vacancies related to the deleted entity."""
+
+    vacancy_ids = getattr(instance, '_deleted_vacancy_ids', [])
+    if vacancy_ids:
+        refresh_vacancies(vacancy_ids=vacancy_ids)
+
+
+@receiver(post_save, sender=Vacancy)
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=City)
+@receiver(post_save, sender=Country)
+@receiver(post_save, sender=Level)
+@receiver(post_save, sender=EmploymentFormat)
+@receiver(post_save, sender=WorkFormat)
+@receiver(post_delete, sender=Vacancy)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=City)
+@receiver(post_delete, sender=Country)
+@receiver(post_delete, sender=Level)
+@receiver(post_delete, sender=EmploymentFormat)
+@receiver(post_delete, sender=WorkFormat)
+@receiver(m2m_changed, sender=Vacancy.tags.through)
+@receiver(m2m_changed, sender=Vacancy.city.through)
+@receiver(m2m_changed, sender=Vacancy.employment_format.through)
+@receiver(m2m_changed, sender=Vacancy.work_format.through)
+def invalidate_vacancies_search_cache(sender: type, **kwargs: Any) -> None:
+    """Invalidates cached vacancies search results on change of data used by the search filters."""
+
+    if kwargs.get('action', 'post_').startswith('post_'):
+        invalidate_vacancies_search_results()
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_save, sender=Level)
+@receiver(post_save, sender=EmploymentFormat)
+@receiver(post_save, sender=WorkFormat)
+@receiver(post_save, sender=ResponseStatus)
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Country)
+@receiver(post_delete, sender=Level)
+@receiver(post_delete, sender=EmploymentFormat)
+@receiver(post_delete, sender=WorkFormat)
+@receiver(post_delete, sender=ResponseStatus)
+@receiver(post_delete, sender=Group)
+def invalidate_reference_data_cache(sender: type, **kwargs: Any) -> None:
+    """Makes cached rows of the changed reference model stale in all app processes."""
+
+    invalidate_reference_data(sender)
@@ -1,5 +1,9 @@
-class FileMock:
-    def __init__(self, size: int | None = None, name: str | None = None) -> None:
+from io import BytesIO
+
+
+class FileMock(BytesIO):
+    def __init__(self, size: int | None = None, name: str | None = None, content: bytes = b'') -> None:
+        super().__init__(content)
         self._size = size
         self._name = name
 
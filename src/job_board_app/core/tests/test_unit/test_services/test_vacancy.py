@@ -13,7 +13,6 @@ from core.business_logic.services import (
     search_vacancies,
 )
 from core.models import City, Tag, Vacancy
-from core.tests.mocks import QRApiAdapterMock
 from core.tests.utils import create_test_company_in_db, create_test_vacancy_in_db, get_test_image, get_test_pdf
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.test import TestCase
@@ -196,8 +195,7 @@ class VacancyServicesTests(TestCase):
 
         vacancy_data = self._get_add_vacancy_data(attachment=self.attachment_for_test, name='Python Developer')
         count_before_request = Vacancy.objects.all().count()
-        qr_adapter = QRApiAdapterMock()
-        created_vacancy_id = create_vacancy(data=vacancy_data, qr_adapter=qr_adapter)
+        created_vacancy_id = create_vacancy(data=vacancy_data)
         self.assertIsInstance(created_vacancy_id, int)
         count_after_request = Vacancy.objects.all().count()
         self.assertEqual(count_before_request + 1, count_after_request)
@@ -242,8 +240,7 @@ class VacancyServicesTests(TestCase):
         count_tags_before_request = Tag.objects.all().count()
         count_cities_before_request = City.objects.all().count()
         with self.assertRaises(CompanyNotExistsError):
-            qr_adapter = QRApiAdapterMock()
-            create_vacancy(vacancy_data, qr_adapter=qr_adapter)
+            create_vacancy(vacancy_data)
         count_vacancies_after_request = Vacancy.objects.all().count()
         count_tags_after_request = Tag.objects.all().count()
         count_cities_after_request = City.objects.all().count()
@@ -259,8 +256,7 @@ class VacancyServicesTests(TestCase):
         count_tags_before_request = Tag.objects.all().count()
         count_cities_before_request = City.objects.all().count()
         with self.assertRaises(CountryNotExistError):
-            qr_adapter = QRApiAdapterMock()
-            create_vacancy(vacancy_data, qr_adapter=qr_adapter)
+            create_vacancy(vacancy_data)
         count_vacancies_after_request = Vacancy.objects.all().count()
         count_tags_after_request = Tag.objects.all().count()
         count_cities_after_request = City.objects.all().count()
@@ -278,8 +274,7 @@ class VacancyServicesTests(TestCase):
         count_tags_before_request = Tag.objects.all().count()
         count_cities_before_request = City.objects.all().count()
         with self.assertRaises(EmploymentFormatNotExistError):
-            qr_adapter = QRApiAdapterMock()
-            create_vacancy(vacancy_data, qr_adapter=qr_adapter)
+            create_vacancy(vacancy_data)
         count_vacancies_after_request = Vacancy.objects.all().count()
         count_tags_after_request = Tag.objects.all().count()
         count_cities_after_request = City.objects.all().count()
@@ -297,8 +292,7 @@ class VacancyServicesTests(TestCase):
         count_tags_before_request = Tag.objects.all().count()
         count_cities_before_request = City.objects.all().count()
         with self.assertRaises(WorkFormatNotExistError):
-            qr_adapter = QRApiAdapterMock()
-            create_vacancy(vacancy_data, qr_adapter=qr_adapter)
+            create_vacancy(vacancy_data)
         count_vacancies_after_request = Vacancy.objects.all().count()
         count_tags_after_request = Tag.objects.all().count()
         count_cities_after_request = City.objects.all().count()
@@ -37,7 +37,7 @@ class ValidatorsTests(TestCase):
         """Checks correctness of file extension validation when passed valid value."""
 
         validator = ValidateFileExtensions(available_extensions=["pdf"])
-        test_file = FileMock(name="test.pdf")
+        test_file = FileMock(name="test.pdf", content=b'%PDF-1.4')
 
         result = validator(value=test_file)
 
@@ -57,9 +57,9 @@ class ValidatorsTests(TestCase):
         """Checks correctness of image extension validation when passed valid value."""
 
         validator = ValidateImageExtensions(available_extensions=["jpg", "jpeg", "png"])
-        test_file_1 = FileMock(name="test.jpg")
-        test_file_2 = FileMock(name="test.jpeg")
-        test_file_3 = FileMock(name="test.png")
+        test_file_1 = FileMock(name="test.jpg", content=b'\xff\xd8\xff\xe0')
+        test_file_2 = FileMock(name="test.jpeg", content=b'\xff\xd8\xff\xe0')
+        test_file_3 = FileMock(name="test.png", content=b'\x89PNG\r\n\x1a\n')
         result_1 = validator(value=test_file_1)
         result_2 = validator(value=test_file_2)
         result_3 = validator(value=test_file_3)
@@ -75,6 +75,16 @@ class ValidatorsTests(TestCase):
         result = validator(value=test_file)
         self.assertEqual(result, {"status": False, "message": "Accept only ['jpg', 'jpeg', 'png']"})
 
+    def test_validate_file_extension_content_mismatch(self) -> None:
+        """Checks that files whose leading bytes do not match the extension are rejected."""
+
+        validator = ValidateFileExtensions(available_extensions=["pdf"])
+        test_file = FileMock(name="test.pdf", content=b'\x89PNG\r\n\x1a\n')
+
+        result = validator(value=test_file)
+
+        self.assertEqual(result, {"status": False, "message": "File content does not match the pdf format"})
+
     def test_validate_max_tag_count_successfully(self) -> None:
         """Checks correctness of max tag count validation when passed valid value."""
 
@@ -1,5 +1,4 @@
 import re
-import sys
 import tempfile
 from io import BytesIO
 
@@ -33,7 +32,12 @@ def get_test_image() -> InMemoryUploadedFile:
     image = Image.new('RGB', (100, 100))
     image.save(output, format='PNG', quality=100)
     return InMemoryUploadedFile(
-        file=output, field_name=None, name="test.png", content_type="image/png", size=10, charset=None
+        file=output,
+        field_name=None,
+        name="test.png",
+        content_type="image/png",
+        size=output.getbuffer().nbytes,
+        charset=None,
     )
 
 
@@ -51,7 +55,7 @@ def get_test_pdf() -> InMemoryUploadedFile:
             field_name=None,
             name="test.pdf",
             content_type="application/pdf",
-            size=sys.getsizeof(file),
+            size=output.getbuffer().nbytes,
             charset=None,
         )
 
@@ -2,6 +2,7 @@ import io
 from dataclasses import dataclass
 
 import pytest
+from core.business_logic.services.reference_data import ReferenceData
 from core.models import Company, Vacancy
 from core.tests_pytest.mocks import QRApiAdapterMock
 from core.tests_pytest.utils import (
@@ -43,6 +44,14 @@ def png_bytes() -> io.BytesIO:
     return get_test_file_bytes()
 
 
+@pytest.fixture(autouse=True)
+def reload_reference_data() -> None:
+    """Makes reference data rows cached by previous tests stale, changes of tests are rolled back without signals."""
+
+    for reference_data in ReferenceData.registry.values():
+        reference_data.invalidate()
+
+
 @pytest.fixture(autouse=True)
 def populate_db(png_for_test: InMemoryUploadedFile, pdf_for_test: InMemoryUploadedFile) -> CreatedDBData:
     company_1 = create_test_company_in_db(company_name='test_company_1', test_file=png_for_test)
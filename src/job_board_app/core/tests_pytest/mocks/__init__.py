@@ -1,4 +1,4 @@
 from .file_mock import FileMock
-from .qr_adapter_mock import QRApiAdapterMock
+from .qr_adapter_mock import QRApiAdapterMock, QRApiAdapterUnavailableMock
 
-__all__ = ["FileMock", "QRApiAdapterMock"]
+__all__ = ["FileMock", "QRApiAdapterMock", "QRApiAdapterUnavailableMock"]
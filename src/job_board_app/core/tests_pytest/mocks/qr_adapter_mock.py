@@ -1,7 +1,19 @@
+from core.business_logic.exceptions import QRCodeServiceUnavailable
 from core.tests.utils import get_test_image
 from django.core.files.uploadedfile import InMemoryUploadedFile
 
 
 class QRApiAdapterMock:
+    def __init__(self, size: int = 150) -> None:
+        self.size = size
+
     def get_qr(self, data: str) -> InMemoryUploadedFile:
         return get_test_image()
+
+
+class QRApiAdapterUnavailableMock:
+    def __init__(self, size: int = 150) -> None:
+        self.size = size
+
+    def get_qr(self, data: str) -> InMemoryUploadedFile:
+        raise QRCodeServiceUnavailable
@@ -1,6 +1,13 @@
 import pytest
 from core.tests_pytest.conftest import CreatedDBData
+from core.tests_pytest.utils import create_test_vacancy_in_db
 from dirty_equals import IsListOrTuple, IsPositiveInt, IsStr
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
 from rest_framework.test import APIClient
 
 
@@ -145,3 +152,220 @@ def test_get_vacancy_by_invalid_id(api_client: APIClient) -> None:
     response_data = response.json()
     assert response.status_code == 404
     assert response_data["message"] == "Vacancy with provided id doesn't exist."
+
+
+@pytest.mark.django_db
+def test_get_vacancies_fulltext_search(api_client: APIClient, populate_db: CreatedDBData) -> None:
+    response = api_client.get("/api/v1/vacancies/?query=python&search_mode=fulltext")
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert response_data["count"] == 2
+    assert {vacancy["id"] for vacancy in response_data["results"]} == {
+        populate_db.vacancy_1.pk,
+        populate_db.vacancy_4.pk,
+    }
+
+
+@pytest.mark.django_db
+def test_get_vacancies_invalid_search_mode(api_client: APIClient) -> None:
+    response = api_client.get("/api/v1/vacancies/?query=python&search_mode=invalid")
+
+    assert response.status_code == 400
+    assert "search_mode" in response.json()
+
+
+@pytest.mark.django_db
+def test_get_vacancies_salary_range_search(api_client: APIClient, populate_db: CreatedDBData) -> None:
+    response = api_client.get("/api/v1/vacancies/?min_salary=900&max_salary=3500&salary_range_mode=overlaps")
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert {vacancy["id"] for vacancy in response_data["results"]} == {
+        populate_db.vacancy_1.pk,
+        populate_db.vacancy_4.pk,
+    }
+
+
+@pytest.mark.django_db
+def test_get_vacancies_invalid_salary_range_mode(api_client: APIClient) -> None:
+    response = api_client.get("/api/v1/vacancies/?min_salary=900&salary_range_mode=invalid")
+
+    assert response.status_code == 400
+    assert "salary_range_mode" in response.json()
+
+
+@pytest.mark.django_db
+def test_get_vacancies_fuzzy_search(api_client: APIClient, populate_db: CreatedDBData) -> None:
+    response = api_client.get("/api/v1/vacancies/?company_name=tset_company_3&search_mode=fuzzy")
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert response_data["results"][0]["id"] == populate_db.vacancy_4.pk
+
+
+@pytest.mark.django_db
+def test_get_vacancies_cursor_pagination(
+    api_client: APIClient, populate_db: CreatedDBData, pdf_for_test: InMemoryUploadedFile
+) -> None:
+    for i in range(25):
+        create_test_vacancy_in_db(
+            vacancy_name=f'Paginated_vacancy_{i}', company=populate_db.company_2, attachment_file=pdf_for_test
+        )
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/api/v1/vacancies/?level=Junior&pagination=cursor")
+    first_page = response.json()
+
+    assert response.status_code == 200
+    assert not [query for query in queries.captured_queries if "COUNT(" in query["sql"]]
+    assert "count" not in first_page
+    assert first_page["previous"] is None
+    assert len(first_page["results"]) == 20
+    assert "level=" not in first_page["next"]
+
+    response = api_client.get(first_page["next"])
+    second_page = response.json()
+
+    assert response.status_code == 200
+    assert len(second_page["results"]) == 8
+    assert second_page["next"] is None
+    assert {vacancy["level"]["name"] for vacancy in second_page["results"]} == {"Junior"}
+    ids = [vacancy["id"] for vacancy in first_page["results"] + second_page["results"]]
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == 28
+
+    response = api_client.get(second_page["previous"])
+
+    assert response.status_code == 200
+    assert response.json()["results"] == first_page["results"]
+
+
+@pytest.mark.django_db
+def test_get_vacancies_invalid_cursor(api_client: APIClient) -> None:
+    response = api_client.get("/api/v1/vacancies/?cursor=invalid")
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid cursor."
+
+    response = api_client.get("/api/v1/vacancies/?name=vacancy&search_mode=fuzzy&pagination=cursor")
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@override_settings(VACANCY_FACETS_CACHE_TIMEOUT=0)
+def test_get_vacancy_facets(api_client: APIClient) -> None:
+    response = api_client.get("/api/v1/vacancies/facets/?country=Belarus&level=Junior")
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert set(response_data) == {"level", "employment_format", "work_format", "country", "city", "tag"}
+    assert response_data["level"] == [{"name": "Junior", "count": 3}]
+    assert response_data["country"] == [{"name": "Belarus", "count": 3}]
+    assert {"name": "Minsk", "count": 3} in response_data["city"]
+
+
+@pytest.mark.django_db
+def test_get_vacancy_facets_invalid_filters(api_client: APIClient) -> None:
+    response = api_client.get("/api/v1/vacancies/facets/?min_salary=invalid")
+
+    assert response.status_code == 400
+    assert "min_salary" in response.json()
+
+
+@pytest.mark.django_db
+def test_get_metrics(api_client: APIClient, admin_user: AbstractBaseUser) -> None:
+    api_client.get("/api/v1/vacancies/?level=Middle")
+
+    response = api_client.get("/api/v1/metrics/")
+
+    assert response.status_code == 403
+
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.get("/api/v1/metrics/")
+    api_client.force_authenticate(user=None)
+
+    assert response.status_code == 200
+    assert response.json()["vacancy_search_cache_misses"] == IsPositiveInt
+
+
+@pytest.mark.django_db
+@override_settings(VACANCY_SEARCH_CACHE_TIMEOUT=0)
+def test_get_vacancies_served_from_listings(api_client: APIClient, populate_db: CreatedDBData) -> None:
+    api_client.get("/api/v1/vacancies/")  # URLconf import runs its own queries on the first request
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/api/v1/vacancies/?tag=python&country=Armenia&work_format=Part-time")
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert [vacancy["id"] for vacancy in response_data["results"]] == [populate_db.vacancy_4.pk]
+    assert response_data["results"][0]["company"] == {"id": populate_db.company_3.pk, "name": "test_company_3"}
+    selects = [query["sql"] for query in queries.captured_queries if "SAVEPOINT" not in query["sql"]]
+    assert len(selects) == 2
+    assert all('FROM "vacancy_listings"' in sql for sql in selects)
+
+
+@pytest.mark.django_db
+@override_settings(VACANCY_SEARCH_CACHE_TIMEOUT=0)
+def test_get_vacancies_by_query_without_prefetches(api_client: APIClient) -> None:
+    api_client.get("/api/v1/vacancies/")  # URLconf import runs its own queries on the first request
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/api/v1/vacancies/?query=python")
+
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+    selects = [query["sql"] for query in queries.captured_queries if "SAVEPOINT" not in query["sql"]]
+    assert len(selects) == 2
+    assert '"vacancies"."description"' not in selects[1].split(" FROM ")[0]
+
+
+@pytest.mark.django_db
+def test_import_vacancies(api_client: APIClient, admin_user: AbstractBaseUser) -> None:
+    content = (
+        b'{"name": "Imported", "company_name": "test_company_1", "level": "Junior", "experience": "1 year", '
+        b'"description": "Imported", "employment_format": ["B2B"], "work_format": ["Hybrid"], '
+        b'"country": "Belarus", "city": "Minsk", "tags": "python"}\n'
+        b'{"name": "Imported"}\n'
+    )
+    file = SimpleUploadedFile('vacancies.ndjson', content)
+
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.post('/api/v1/vacancies/import/', data={'file': file}, format='multipart')
+    api_client.force_authenticate(user=None)
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert response_data['created'] == 1
+    assert response_data['failed'] == 1
+    assert response_data['errors'][0]['row'] == 2
+    assert 'company_name' in response_data['errors'][0]['errors']
+
+
+@pytest.mark.django_db
+def test_import_vacancies_by_not_admin(api_client: APIClient) -> None:
+    # DRF rolls back the test transaction on errors of views that are not atomic, so the request is not combined
+    # with others in one test.
+    response = api_client.post(
+        '/api/v1/vacancies/import/', data={'file': SimpleUploadedFile('vacancies.csv', b'')}, format='multipart'
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_import_vacancies_unknown_format(api_client: APIClient, admin_user: AbstractBaseUser) -> None:
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.post(
+        '/api/v1/vacancies/import/', data={'file': SimpleUploadedFile('vacancies.xml', b'<xml/>')}, format='multipart'
+    )
+    api_client.force_authenticate(user=None)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_import_vacancies_request_is_not_atomic() -> None:
+    view = resolve('/api/v1/vacancies/import/').func
+
+    assert 'default' in getattr(view, '_non_atomic_requests', set())
@@ -0,0 +1,62 @@
+import copy
+import json
+import logging
+import sys
+
+import pytest
+from core.management.commands.benchmark_log_formatter import LOG_FORMAT, LegacyContextFormatter
+from django.core.management import call_command
+
+from job_board_app.logger_formatter import ContextFormatter
+
+pytestmark = pytest.mark.django_db
+
+
+def make_record(**extra: object) -> logging.LogRecord:
+    logger = logging.getLogger('core.business_logic.services.vacancy')
+    return logger.makeRecord(
+        logger.name, logging.INFO, __file__, 10, 'Vacancy %s has been created.', (1,), None, extra=extra
+    )
+
+
+@pytest.mark.parametrize('extra', [{}, {'vacancy_id': 1, 'tags': ['python', 'django']}])
+def test_context_formatter_output_matches_previous_formatter(extra: dict) -> None:
+    record = make_record(**extra)
+    expected = LegacyContextFormatter(LOG_FORMAT, style='{').format(copy.copy(record))
+
+    assert ContextFormatter(LOG_FORMAT, style='{').format(copy.copy(record)) == expected
+
+
+def test_context_formatter_renders_only_extra_attributes() -> None:
+    formatted = ContextFormatter('{message}', style='{').format(make_record(vacancy_id=1, company='Company'))
+
+    assert formatted == 'Vacancy 1 has been created. Context: (vacancy_id=1)| (company=Company)| '
+
+
+def test_context_formatter_json_lines() -> None:
+    formatter = ContextFormatter(json_lines=True)
+    try:
+        raise ValueError('Invalid level')
+    except ValueError:
+        record = make_record(vacancy_id=1, level=object())
+        record.exc_info = sys.exc_info()
+
+    formatted = formatter.format(record)
+
+    assert '\n' not in formatted
+    data = json.loads(formatted)
+    assert data['level'] == 'INFO'
+    assert data['logger'] == 'core.business_logic.services.vacancy'
+    assert data['line'] == 10
+    assert data['message'] == 'Vacancy 1 has been created.'
+    assert data['context']['vacancy_id'] == 1
+    assert data['context']['level'].startswith('<object object')
+    assert 'ValueError: Invalid level' in data['exception']
+
+
+def test_benchmark_log_formatter_command(capsys: pytest.CaptureFixture) -> None:
+    call_command('benchmark_log_formatter', count=100)
+
+    output = capsys.readouterr().out
+    assert 'Previous ContextFormatter:' in output
+    assert 'ContextFormatter (JSON lines):' in output
@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+
+import pytest
+from django.core.management import call_command
+
+from job_board_app.logger_handlers import ListenerQueueHandler
+
+pytestmark = pytest.mark.django_db
+
+
+class CollectingHandler(logging.Handler):
+    """Collects messages of handled records, waits for `released` once `started` if it is blocked."""
+
+    def __init__(self, blocked: bool = False) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: set[threading.Thread] = set()
+        self.started = threading.Event()
+        self.released = threading.Event()
+        if not blocked:
+            self.released.set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.started.set()
+        self.released.wait(timeout=5)
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread())
+
+
+def log(handler: logging.Handler, message: str, *args: object) -> None:
+    handler.handle(logging.makeLogRecord({'msg': message, 'args': args, 'levelno': logging.INFO}))
+
+
+def fill_queue(handler: ListenerQueueHandler, target: CollectingHandler) -> None:
+    """Blocks the listener thread on the first record and fills the queue of one record with the second one."""
+
+    log(handler, 'first')
+    assert target.started.wait(timeout=5)
+    log(handler, 'second')
+
+
+def test_listener_thread_writes_records() -> None:
+    target = CollectingHandler()
+    handler = ListenerQueueHandler([target])
+
+    log(handler, 'Vacancy %s has been created.', 1)
+    handler.flush()
+
+    assert target.messages == ['Vacancy 1 has been created.']
+    assert target.threads.isdisjoint({threading.current_thread()})
+    handler.close()
+
+
+def test_drop_policy_drops_records_and_logs_their_number() -> None:
+    target = CollectingHandler(blocked=True)
+    handler = ListenerQueueHandler([target], maxsize=1, overflow='drop')
+    fill_queue(handler, target)
+
+    log(handler, 'dropped')
+    assert handler.dropped_records == 1
+    target.released.set()
+    handler.flush()
+    log(handler, 'third')
+    handler.close()
+
+    assert target.messages == [
+        'first',
+        'second',
+        'third',
+        '1 log records have been dropped, the logging queue is full.',
+    ]
+
+
+def test_block_policy_waits_for_free_place() -> None:
+    target = CollectingHandler(blocked=True)
+    handler = ListenerQueueHandler([target], maxsize=1, overflow='block', block_timeout=5)
+    fill_queue(handler, target)
+
+    threading.Timer(0.05, target.released.set).start()
+    log(handler, 'third')
+    handler.close()
+
+    assert handler.dropped_records == 0
+    assert target.messages == ['first', 'second', 'third']
+
+
+def test_block_policy_drops_record_after_timeout() -> None:
+    target = CollectingHandler(blocked=True)
+    handler = ListenerQueueHandler([target], maxsize=1, overflow='block', block_timeout=0.05)
+    fill_queue(handler, target)
+
+    started = time.perf_counter()
+    log(handler, 'dropped')
+
+    assert time.perf_counter() - started >= 0.05
+    assert handler.dropped_records == 1
+    target.released.set()
+    handler.close()
+
+
+def test_close_writes_queued_records() -> None:
+    target = CollectingHandler(blocked=True)
+    handler = ListenerQueueHandler([target], maxsize=1)
+    fill_queue(handler, target)
+
+    threading.Timer(0.05, target.released.set).start()
+    handler.close()
+
+    assert target.messages == ['first', 'second']
+    assert not handler.listening
+
+
+def test_unknown_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        ListenerQueueHandler([CollectingHandler()], overflow='wait')
+
+
+def test_loggers_use_queue_handler() -> None:
+    handlers = [handler for handler in logging.getLogger().handlers if isinstance(handler, ListenerQueueHandler)]
+
+    assert len(handlers) == 1
+    assert [type(handler) for handler in handlers[0].handlers] == [logging.StreamHandler, logging.FileHandler]
+    assert handlers[0].listening
+
+
+def test_benchmark_logging_command(capsys: pytest.CaptureFixture) -> None:
+    call_command('benchmark_logging', count=20)
+
+    output = capsys.readouterr().out
+    assert 'Synchronous handlers:' in output
+    assert 'Queue handler:' in output
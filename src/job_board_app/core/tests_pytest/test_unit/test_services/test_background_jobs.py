@@ -0,0 +1,148 @@
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from core.business_logic.exceptions import CompanyNotExistsError
+from core.business_logic.services import create_vacancy, enqueue_job, requeue_dead_jobs, run_pending_jobs
+from core.business_logic.services.background_jobs import background_jobs_dead, get_retry_delay
+from core.business_logic.services.qr_code import VACANCY_QR_CODE_TASK, get_vacancy_qr_data
+from core.models import BackgroundJob, Vacancy
+from core.tests_pytest.test_unit.test_services.test_vacancy import get_add_vacancy_data
+from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+QR_API_ADAPTER_MOCK = {"BACKEND": "core.tests_pytest.mocks.QRApiAdapterMock"}
+QR_API_ADAPTER_UNAVAILABLE_MOCK = {"BACKEND": "core.tests_pytest.mocks.QRApiAdapterUnavailableMock"}
+
+
+@pytest.fixture(autouse=True)
+def media_root(tmp_path: Path) -> Iterator[Path]:
+    """Stores QR codes of the test in a temporary directory, so they are not found in the content-addressed cache."""
+
+    with override_settings(MEDIA_ROOT=str(tmp_path)):
+        yield tmp_path
+
+
+def make_jobs_due() -> None:
+    """Moves scheduled retries of all pending jobs to the past."""
+
+    BackgroundJob.objects.filter(status=BackgroundJob.PENDING).update(run_after=timezone.now() - timedelta(seconds=1))
+
+
+@pytest.mark.django_db
+@override_settings(QR_API_ADAPTER=QR_API_ADAPTER_MOCK)
+def test_create_vacancy_generates_qr_code_in_background(pdf_for_test: InMemoryUploadedFile) -> None:
+    """Checks that the vacancy is created without QR code and the queued job fills it in."""
+
+    vacancy_id = create_vacancy(data=get_add_vacancy_data(attachment=pdf_for_test))
+
+    assert not Vacancy.objects.get(pk=vacancy_id).qr_code
+    job = BackgroundJob.objects.get(task=VACANCY_QR_CODE_TASK, payload={'vacancy_id': vacancy_id})
+    assert get_vacancy_qr_data(vacancy_id).endswith(f'/vacancy/{vacancy_id}/')
+
+    assert run_pending_jobs() == 1
+    assert Vacancy.objects.get(pk=vacancy_id).qr_code.name.startswith('vacancy_qr/')
+    assert not BackgroundJob.objects.filter(pk=job.pk).exists()
+
+
+@pytest.mark.django_db
+def test_failed_create_vacancy_does_not_enqueue_qr_code(pdf_for_test: InMemoryUploadedFile) -> None:
+    """Checks that the QR code job is rolled back with the vacancy."""
+
+    with pytest.raises(CompanyNotExistsError):
+        create_vacancy(data=get_add_vacancy_data(attachment=pdf_for_test, company_name='Invalid Company name'))
+
+    assert not BackgroundJob.objects.exists()
+
+
+@pytest.mark.django_db
+@override_settings(QR_API_ADAPTER=QR_API_ADAPTER_UNAVAILABLE_MOCK, BACKGROUND_JOBS_MAX_ATTEMPTS=3)
+def test_failed_job_is_retried_with_backoff_and_moved_to_dead_letters(pdf_for_test: InMemoryUploadedFile) -> None:
+    """Checks retries of the failed job, the dead-letter status after the last attempt and requeueing."""
+
+    vacancy_id = create_vacancy(data=get_add_vacancy_data(attachment=pdf_for_test))
+    dead_before = background_jobs_dead.get()
+
+    assert run_pending_jobs() == 1
+    job = BackgroundJob.objects.get()
+    assert job.status == BackgroundJob.PENDING
+    assert job.attempts == 1
+    assert job.run_after > timezone.now() + timedelta(seconds=5)
+    assert job.last_error == 'QRCodeServiceUnavailable: '
+    assert run_pending_jobs() == 0
+
+    for _ in range(2):
+        make_jobs_due()
+        assert run_pending_jobs() == 1
+    job.refresh_from_db()
+    assert job.status == BackgroundJob.DEAD
+    assert job.attempts == 3
+    assert background_jobs_dead.get() == dead_before + 1
+    assert run_pending_jobs() == 0
+
+    assert requeue_dead_jobs() == 1
+    with override_settings(QR_API_ADAPTER=QR_API_ADAPTER_MOCK):
+        assert run_pending_jobs() == 1
+    assert Vacancy.objects.get(pk=vacancy_id).qr_code
+
+
+@pytest.mark.django_db
+def test_unknown_task_job_is_moved_to_dead_letters() -> None:
+    job = enqueue_job('unknown_task', {})
+
+    assert run_pending_jobs() == 1
+    job.refresh_from_db()
+    assert job.status == BackgroundJob.DEAD
+    assert job.attempts == 1
+
+
+@pytest.mark.django_db
+@override_settings(BACKGROUND_JOBS_LOCK_TIMEOUT=60)
+def test_abandoned_running_job_is_claimed_again() -> None:
+    job = enqueue_job('unknown_task', {})
+    BackgroundJob.objects.filter(pk=job.pk).update(status=BackgroundJob.RUNNING, locked_at=timezone.now())
+    assert run_pending_jobs() == 0
+
+    BackgroundJob.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(seconds=61))
+    assert run_pending_jobs() == 1
+
+
+@pytest.mark.django_db
+@override_settings(BACKGROUND_JOBS_LOCK_TIMEOUT=60, BACKGROUND_JOBS_MAX_ATTEMPTS=2)
+def test_abandoned_job_without_attempts_left_is_moved_to_dead_letters() -> None:
+    """Checks that a job abandoned by crashing workers is not claimed again once it has used all attempts."""
+
+    job = enqueue_job('unknown_task', {})
+    abandoned_at = timezone.now() - timedelta(seconds=61)
+    BackgroundJob.objects.filter(pk=job.pk).update(status=BackgroundJob.RUNNING, locked_at=abandoned_at, attempts=2)
+    dead_before = background_jobs_dead.get()
+
+    assert run_pending_jobs() == 0
+    job.refresh_from_db()
+    assert (job.status, job.attempts, job.locked_at) == (BackgroundJob.DEAD, 2, None)
+    assert job.last_error
+    assert background_jobs_dead.get() == dead_before + 1
+
+
+@pytest.mark.django_db
+@override_settings(BACKGROUND_JOBS_RETRY_BACKOFF=10, BACKGROUND_JOBS_MAX_RETRY_BACKOFF=600)
+def test_get_retry_delay() -> None:
+    assert [get_retry_delay(attempts).total_seconds() for attempts in (1, 2, 3, 7, 20)] == [10, 20, 40, 600, 600]
+
+
+@pytest.mark.django_db
+@override_settings(QR_API_ADAPTER=QR_API_ADAPTER_MOCK)
+def test_run_background_jobs_command(pdf_for_test: InMemoryUploadedFile, capsys: pytest.CaptureFixture) -> None:
+    for name in ('Vacancy 1', 'Vacancy 2', 'Vacancy 3'):
+        create_vacancy(data=get_add_vacancy_data(attachment=pdf_for_test, name=name))
+
+    call_command('run_background_jobs', once=True, limit=2)
+    assert BackgroundJob.objects.count() == 1
+    call_command('run_background_jobs', once=True)
+
+    assert 'Processed 1 jobs.' in capsys.readouterr().out
+    assert not BackgroundJob.objects.exists()
+    assert not Vacancy.objects.filter(name__startswith='Vacancy ', qr_code='').exists()
@@ -1,3 +1,7 @@
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator
+
 import pytest
 from core.business_logic.dto import AddAddressDTO, AddCompanyDTO, AddCompanyProfileDTO
 from core.business_logic.exceptions import (
@@ -6,9 +10,18 @@ from core.business_logic.exceptions import (
     CompanyProfileNotExistsError,
     CountryNotExistError,
 )
-from core.business_logic.services import create_company, get_companies, get_company_by_id, get_company_profile_by_id
-from core.models import Address, BusinessArea, City, Company, CompanyProfile
+from core.business_logic.services import (
+    create_company,
+    get_companies,
+    get_company_by_id,
+    get_company_logo_variant,
+    get_company_profile_by_id,
+    run_pending_jobs,
+)
+from core.models import Address, BackgroundJob, BusinessArea, City, Company, CompanyProfile
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.test import override_settings
+from PIL import Image
 
 
 def get_company_data(name: str = 'TEST', staff: int = 100, business_area: str = 'test1 test2') -> AddCompanyDTO:
@@ -290,3 +303,70 @@ def test_get_companies_order_by_vacancy_count() -> None:
     result_companies_list = get_companies()
     for ind in range(1, len(result_companies_list)):
         assert result_companies_list[ind].vacancy__count <= result_companies_list[ind - 2].vacancy__count
+
+
+@pytest.fixture
+def media_root(tmp_path: Path) -> Iterator[Path]:
+    with override_settings(MEDIA_ROOT=str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('workers', [0, 1])
+def test_create_company_processes_logo_in_background(
+    media_root: Path, png_for_test: InMemoryUploadedFile, workers: int
+) -> None:
+    """Checks that the original logo is stored first and the resized variants are set by the background job."""
+
+    company_id = create_company(
+        company_data=get_company_data(name='EPAM'),
+        profile_data=get_company_profile_data(logo=png_for_test),
+        address_data=get_address_data(),
+    )
+
+    profile = CompanyProfile.objects.get(pk=company_id)
+    assert not profile.logo
+    assert profile.logo_status == CompanyProfile.LOGO_PENDING
+    assert (media_root / profile.logo_original.name).exists()
+
+    with override_settings(
+        IMAGE_PROCESSING_WORKERS=workers,
+        IMAGE_VARIANTS={'small': (10, 10), 'medium': (50, 40)},
+        COMPANY_LOGO_VARIANT='medium',
+    ):
+        assert run_pending_jobs() == 1
+
+        profile.refresh_from_db()
+        assert profile.logo_status == CompanyProfile.LOGO_READY
+        assert profile.logo_progress == 4
+        assert profile.logo.name == profile.logo_variants['medium.original']
+        assert set(profile.logo_variants) == {'small.webp', 'small.original', 'medium.webp', 'medium.original'}
+        for key, file_format, size in (('medium.original', 'PNG', (40, 40)), ('small.webp', 'WEBP', (10, 10))):
+            with Image.open(media_root / profile.logo_variants[key]) as image:
+                assert (image.format, image.size) == (file_format, size)
+            # The logo endpoint serves the stored variants.
+            variant, variant_format = key.split('.')
+            assert get_company_logo_variant(company_id, variant, variant_format) == profile.logo_variants[key]
+    with Image.open(media_root / profile.logo_original.name) as image:
+        assert image.size == (100, 100)
+
+
+@pytest.mark.django_db
+def test_failed_logo_processing_is_recorded(media_root: Path) -> None:
+    broken_logo = InMemoryUploadedFile(
+        file=BytesIO(b'not an image'), field_name=None, name='logo.png', content_type='image/png', size=12, charset=None
+    )
+    company_id = create_company(
+        company_data=get_company_data(name='EPAM'),
+        profile_data=get_company_profile_data(logo=broken_logo),
+        address_data=get_address_data(),
+    )
+
+    with override_settings(IMAGE_PROCESSING_WORKERS=0):
+        run_pending_jobs()
+
+    profile = CompanyProfile.objects.get(pk=company_id)
+    assert profile.logo_status == CompanyProfile.LOGO_FAILED
+    assert profile.logo_error.startswith('UnidentifiedImageError')
+    assert not profile.logo
+    assert BackgroundJob.objects.get(payload={'company_id': company_id}).status == BackgroundJob.PENDING
@@ -0,0 +1,173 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+from core.business_logic.exceptions import ExternalServiceUnavailable, QRCodeServiceUnavailable
+from core.business_logic.services.common import QRApiAdapter
+from core.business_logic.services.http_client import CircuitBreaker, close_http_clients, get_http_client
+from django.test import override_settings
+
+pytestmark = pytest.mark.django_db
+
+HTTP_CLIENT_TEST_SETTINGS = {
+    'HTTP_CLIENT_READ_TIMEOUT': 0.5,
+    'HTTP_CLIENT_MAX_RETRIES': 2,
+    'HTTP_CLIENT_RETRY_BACKOFF': 0,
+    'HTTP_CLIENT_CIRCUIT_BREAKER_FAILURES': 2,
+    'HTTP_CLIENT_CIRCUIT_BREAKER_RESET_TIMEOUT': 0.2,
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers requests with statuses from `server.statuses`, the last status is repeated. Status 0 hangs."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.requests.append((self.client_address, self.path))
+        status = self.server.statuses.pop(0) if len(self.server.statuses) > 1 else self.server.statuses[0]
+        if not status:
+            time.sleep(1)
+            status = 200
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format: str, *args: object) -> None:  # pylint: disable=redefined-builtin
+        """Disables logging of stub requests."""
+
+
+@pytest.fixture
+def stub_server() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.statuses = [200]
+    server.requests = []
+    server.url = f'http://127.0.0.1:{server.server_port}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with override_settings(**HTTP_CLIENT_TEST_SETTINGS):
+        yield server
+    close_http_clients()
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_is_shared_and_keeps_connection_alive(stub_server: ThreadingHTTPServer) -> None:
+    client = get_http_client(stub_server.url, name='stub')
+
+    assert get_http_client(stub_server.url + '/', name='stub') is client
+    for _ in range(3):
+        assert client.get('/path/', params={'a': 1}).content == b'ok'
+
+    assert len({address for address, _ in stub_server.requests}) == 1
+    assert stub_server.requests[0][1] == '/path/?a=1'
+
+
+def test_failed_requests_are_retried(stub_server: ThreadingHTTPServer) -> None:
+    client = get_http_client(stub_server.url, name='stub')
+    requests_before, errors_before = client.requests_counter.get(), client.errors_counter.get()
+    stub_server.statuses = [503, 502, 200]
+
+    assert client.get('/').status_code == 200
+
+    assert len(stub_server.requests) == 3
+    assert client.requests_counter.get() == requests_before + 3
+    assert client.errors_counter.get() == errors_before + 2
+
+
+def test_client_errors_are_not_retried(stub_server: ThreadingHTTPServer) -> None:
+    stub_server.statuses = [404]
+
+    with pytest.raises(ExternalServiceUnavailable):
+        get_http_client(stub_server.url, name='stub').get('/')
+
+    assert len(stub_server.requests) == 1
+
+
+def test_server_errors_open_circuit_breaker(stub_server: ThreadingHTTPServer) -> None:
+    """Checks that server errors which are not retried are failures of the circuit breaker."""
+
+    client = get_http_client(stub_server.url, name='stub')
+    stub_server.statuses = [500]
+    for _ in range(2):
+        with pytest.raises(ExternalServiceUnavailable):
+            client.get('/')
+
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(ExternalServiceUnavailable):
+        client.get('/')
+    assert len(stub_server.requests) == 2
+
+
+def test_hung_upstream_fails_by_timeout(stub_server: ThreadingHTTPServer) -> None:
+    stub_server.statuses = [0]
+    client = get_http_client(stub_server.url, name='stub')
+
+    started = time.monotonic()
+    with pytest.raises(ExternalServiceUnavailable):
+        client.get('/')
+
+    assert time.monotonic() - started < 3
+    assert len(stub_server.requests) == 3
+
+
+def test_circuit_breaker_fails_fast_until_trial_request_succeeds(stub_server: ThreadingHTTPServer) -> None:
+    """Checks that the QR API adapter is rejected without requests while the upstream is unhealthy."""
+
+    adapter = QRApiAdapter(base_url=stub_server.url)
+    client = get_http_client(stub_server.url, name='qr_api')
+    stub_server.statuses = [503]
+    for _ in range(2):
+        with pytest.raises(QRCodeServiceUnavailable):
+            adapter.get_qr('data')
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+    requests_count = len(stub_server.requests)
+    rejected_before = client.rejected_counter.get()
+
+    with pytest.raises(QRCodeServiceUnavailable):
+        adapter.get_qr('data')
+    assert len(stub_server.requests) == requests_count
+    assert client.rejected_counter.get() == rejected_before + 1
+
+    time.sleep(0.2)
+    stub_server.statuses = [200]
+    assert client.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    assert adapter.get_qr('data').read() == b'ok'
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+    assert stub_server.requests[-1][1] == '/create-qr-code/?size=150x150&data=data'
+
+
+def test_unexpected_error_of_trial_call_opens_circuit_breaker_again(stub_server: ThreadingHTTPServer) -> None:
+    """Checks that an error other than a failed request does not leave the breaker half-open forever."""
+
+    client = get_http_client(stub_server.url, name='stub')
+    stub_server.statuses = [503]
+    for _ in range(2):
+        with pytest.raises(ExternalServiceUnavailable):
+            client.get('/')
+    time.sleep(0.2)
+
+    def fail(response: object, **kwargs: object) -> None:
+        raise RuntimeError('Response hook failed.')
+
+    with pytest.raises(RuntimeError):
+        client.get('/', hooks={'response': fail})
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.2)
+    stub_server.statuses = [200]
+    assert client.get('/').ok
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_opens_again_after_failed_trial_call() -> None:
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.allow_request()
+    assert not circuit_breaker.allow_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.allow_request()
@@ -0,0 +1,76 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from core.business_logic.exceptions import CompanyProfileNotExistsError, ImageVariantNotExistError
+from core.business_logic.services import get_company_logo_variant
+from core.business_logic.services.image_variants import get_image_variant_name, image_variant_hits, image_variant_misses
+from core.models import Company, CompanyProfile
+from core.tests_pytest.conftest import CreatedDBData
+from core.tests_pytest.utils import get_test_image
+from django.test import Client, override_settings
+from PIL import Image
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def company_logo(tmp_path: Path, populate_db: CreatedDBData) -> Iterator[CompanyProfile]:
+    """Stores media files of the test in a temporary directory and uploads a 100x100 PNG logo of the first company."""
+
+    with override_settings(MEDIA_ROOT=str(tmp_path), IMAGE_VARIANTS={'small': (10, 10), 'medium': (50, 40)}):
+        profile = populate_db.company_1.company_profile
+        profile.logo_original.save('logo.png', get_test_image())
+        yield profile
+
+
+def test_get_image_variant_name_is_deterministic() -> None:
+    assert get_image_variant_name('companies_media/company_1/logo.PNG', 'small', 'webp') == (
+        'image_variants/companies_media/company_1/logo/small.webp'
+    )
+    assert get_image_variant_name('companies_media/company_1/logo.PNG', 'small', 'original') == (
+        'image_variants/companies_media/company_1/logo/small.png'
+    )
+
+
+def test_company_logo_variant_is_generated_once(company_logo: CompanyProfile, tmp_path: Path) -> None:
+    hits, misses = image_variant_hits.get(), image_variant_misses.get()
+
+    name = get_company_logo_variant(company_logo.pk, variant='medium', file_format='webp')
+
+    assert name == get_image_variant_name(company_logo.logo_original.name, 'medium', 'webp')
+    with Image.open(tmp_path / name) as image:
+        assert (image.format, image.size) == ('WEBP', (40, 40))
+    assert get_company_logo_variant(company_logo.pk, variant='medium', file_format='webp') == name
+    assert (image_variant_hits.get(), image_variant_misses.get()) == (hits + 1, misses + 1)
+
+    name = get_company_logo_variant(company_logo.pk, variant='small', file_format='original')
+    with Image.open(tmp_path / name) as image:
+        assert (image.format, image.size) == ('PNG', (10, 10))
+
+
+def test_company_logo_variant_errors(company_logo: CompanyProfile) -> None:
+    with pytest.raises(ImageVariantNotExistError):
+        get_company_logo_variant(company_logo.pk, variant='huge', file_format='webp')
+    with pytest.raises(ImageVariantNotExistError):
+        get_company_logo_variant(company_logo.pk, variant='small', file_format='gif')
+    company_without_logo = Company.objects.create(name='Company without logo')
+    with pytest.raises(CompanyProfileNotExistsError):
+        get_company_logo_variant(company_without_logo.pk, variant='small', file_format='webp')
+
+
+def test_company_logo_endpoint(company_logo: CompanyProfile, admin_user: object) -> None:
+    client = Client()
+    client.force_login(admin_user)
+
+    page = client.get(f'/company/{company_logo.pk}/')
+    logo_url = f'/company/{company_logo.pk}/logo/medium.webp?v=logo'
+    assert logo_url in page.content.decode()
+
+    response = client.get(logo_url)
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'image/webp'
+    assert response['Cache-Control'] == 'public, max-age=31536000, immutable'
+    assert b''.join(response.streaming_content).startswith(b'RIFF')
+
+    assert client.get(f'/company/{company_logo.pk}/logo/huge.webp').status_code == 404
@@ -0,0 +1,43 @@
+from typing import Iterator
+
+import pytest
+from core.business_logic.services.metrics import Counter
+from django.core.cache import cache
+from django.test import override_settings
+
+pytestmark = pytest.mark.django_db
+
+UNAVAILABLE_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:1'}
+}
+
+
+@pytest.fixture
+def counter() -> Iterator[Counter]:
+    counter = Counter('test_counter', 'Counter of tests.')
+    counter.reset()
+    yield counter
+    cache.delete('metrics:test_counter')
+    del Counter.registry['test_counter']
+
+
+def test_counter_increment(counter: Counter) -> None:
+    counter.increment()
+    counter.increment(2)
+
+    assert counter.get() == 3
+
+
+def test_counter_increment_recreates_evicted_value(counter: Counter) -> None:
+    counter.increment()
+    cache.delete('metrics:test_counter')
+    counter.increment(2)
+
+    assert counter.get() == 2
+
+
+def test_counter_increment_does_not_raise_cache_errors(counter: Counter, caplog: pytest.LogCaptureFixture) -> None:
+    with override_settings(CACHES=UNAVAILABLE_CACHES):
+        counter.increment()
+
+    assert 'Failed to increment the counter.' in caplog.text
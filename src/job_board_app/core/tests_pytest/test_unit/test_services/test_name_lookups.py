@@ -0,0 +1,53 @@
+import pytest
+from core.business_logic.services import get_response_status_by_name
+from core.business_logic.services.metrics import get_metrics
+from core.business_logic.services.name_lookups import (
+    LOOKUPS_FLUSH_INTERVAL,
+    level_lookup,
+    name_lookups,
+    response_status_lookup,
+)
+from core.models import Level, ResponseStatus
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = pytest.mark.django_db
+
+
+def test_repeated_lookups_are_served_without_queries() -> None:
+    response_status_lookup.flush()
+    metrics_before = get_metrics()
+
+    with CaptureQueriesContext(connection) as queries:
+        statuses = {get_response_status_by_name('new') for _ in range(150)}
+
+    assert len(queries) == 1
+    assert statuses == {ResponseStatus.objects.get(name='New')}
+    # Lookups are added to the shared counter in batches.
+    assert name_lookups.get() == metrics_before['name_lookups'] + LOOKUPS_FLUSH_INTERVAL
+    response_status_lookup.flush()
+    assert get_metrics() == {
+        **metrics_before,
+        'name_lookups': metrics_before['name_lookups'] + 150,
+        'name_lookup_loads': metrics_before['name_lookup_loads'] + 1,
+        'reference_data_loads': metrics_before['reference_data_loads'] + 1,
+    }
+
+
+def test_missing_names_are_not_found() -> None:
+    with pytest.raises(Level.DoesNotExist):
+        level_lookup.get('Lead')
+
+
+def test_lookups_follow_changes_of_reference_data() -> None:
+    level = level_lookup.get('Junior')
+
+    level.name = 'Junior+'
+    level.save()
+    with pytest.raises(Level.DoesNotExist):
+        level_lookup.get('Junior')
+    assert level_lookup.get('Junior+').pk == level.pk
+
+    Level.objects.get(pk=level.pk).delete()
+    with pytest.raises(Level.DoesNotExist):
+        level_lookup.get('Junior+')
@@ -0,0 +1,151 @@
+import os
+import posixpath
+import time
+from datetime import timedelta
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from core.business_logic.services import enqueue_vacancy_qr_codes, get_qr_adapter, run_pending_jobs
+from core.business_logic.services.common import QRLocalAdapter
+from core.business_logic.services.qr_code import (
+    collect_unreferenced_qr_codes,
+    get_or_create_qr_code,
+    get_qr_code_name,
+    get_vacancy_qr_data,
+    qr_code_cache_hits,
+    qr_code_cache_misses,
+)
+from core.business_logic.services.qr_encoder import encode_qr
+from core.models import Vacancy
+from core.tests_pytest.test_unit.test_services.test_background_jobs import QR_API_ADAPTER_MOCK
+from django.core.management import call_command
+from django.test import override_settings
+from PIL import Image
+
+QR_DATA = 'http://localhost:8000/vacancy/1/'
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    'data, error_correction, expected_size',
+    [(b'1', 'L', 21), (QR_DATA.encode(), 'M', 29), (b'x' * 100, 'M', 41), (b'x' * 300, 'H', 89)],
+)
+def test_encode_qr_chooses_smallest_version(data: bytes, error_correction: str, expected_size: int) -> None:
+    matrix = encode_qr(data, error_correction=error_correction)
+
+    assert len(matrix) == expected_size
+    assert all(len(row) == expected_size for row in matrix)
+    finder_rows = [[True] * 7, [True] + [False] * 5 + [True], [True, False, True, True, True, False, True]]
+    for x, y in ((0, 0), (expected_size - 7, 0), (0, expected_size - 7)):
+        assert [row[x:][:7] for row in matrix[y:][:3]] == finder_rows
+
+
+def test_encode_qr_rejects_too_long_data() -> None:
+    with pytest.raises(ValueError):
+        encode_qr(b'x' * 3000, error_correction='L')
+
+
+def test_qr_local_adapter_renders_identical_images_for_identical_data() -> None:
+    qr_code = QRLocalAdapter().get_qr(QR_DATA)
+    content = qr_code.read()
+
+    assert content == QRLocalAdapter().render(QR_DATA)
+    assert content != QRLocalAdapter().render('http://localhost:8000/vacancy/2/')
+    assert qr_code.size == len(content)
+    assert qr_code.content_type == 'image/png'
+    with Image.open(BytesIO(content)) as image:
+        assert image.format == 'PNG'
+        assert image.size == (150, 150)
+        assert image.getpixel((0, 0)) == 255
+        # 37 modules with the border are scaled by 4 pixels and centered, the finder pattern starts after the border
+        assert image.getpixel((1 + 4 * 4, 1 + 4 * 4)) == 0
+        assert image.getpixel((1 + 4 * 4 - 1, 1 + 4 * 4)) == 255
+
+
+@override_settings(QR_API_ADAPTER={'BACKEND': 'core.business_logic.services.common.QRLocalAdapter'})
+def test_get_qr_adapter_uses_adapter_from_settings() -> None:
+    assert isinstance(get_qr_adapter(), QRLocalAdapter)
+
+
+def test_benchmark_qr_adapters_command(capsys: pytest.CaptureFixture) -> None:
+    call_command('benchmark_qr_adapters', count=2)
+
+    output = capsys.readouterr().out
+    assert 'QRLocalAdapter:' in output
+    assert 'QRApiAdapter (local stub):' in output
+
+
+@pytest.fixture
+def qr_codes_storage(tmp_path: Path) -> Iterator[Path]:
+    """Stores media files of the test in a temporary directory and uses the QR adapter mock."""
+
+    with override_settings(MEDIA_ROOT=str(tmp_path), QR_API_ADAPTER=QR_API_ADAPTER_MOCK):
+        yield tmp_path
+
+
+def test_get_qr_code_name_depends_on_data_and_size() -> None:
+    name = get_qr_code_name(QR_DATA, size=150)
+
+    assert name == get_qr_code_name(QR_DATA, size=150)
+    assert name.startswith('vacancy_qr/') and name.endswith('.png')
+    assert name != get_qr_code_name(QR_DATA, size=300)
+    assert name != get_qr_code_name('http://localhost:8000/vacancy/2/', size=150)
+
+
+def test_vacancy_qr_code_is_stored_once(qr_codes_storage: Path) -> None:
+    """Checks that regenerating the QR code of the vacancy reuses the stored image."""
+
+    vacancy = Vacancy.objects.first()
+    hits, misses = qr_code_cache_hits.get(), qr_code_cache_misses.get()
+
+    enqueue_vacancy_qr_codes([vacancy.pk, vacancy.pk])
+    run_pending_jobs()
+
+    vacancy.refresh_from_db()
+    assert vacancy.qr_code.name == get_qr_code_name(get_vacancy_qr_data(vacancy.pk), size=150)
+    assert [path.name for path in qr_codes_storage.rglob('*.png')] == [posixpath.basename(vacancy.qr_code.name)]
+    assert qr_code_cache_hits.get() == hits + 1
+    assert qr_code_cache_misses.get() == misses + 1
+
+
+def test_collect_unreferenced_qr_codes(qr_codes_storage: Path) -> None:
+    vacancy = Vacancy.objects.first()
+    enqueue_vacancy_qr_codes([vacancy.pk])
+    run_pending_jobs()
+    old_legacy_file = qr_codes_storage / 'vacancy_qr' / 'company_1' / 'old.png'
+    old_legacy_file.parent.mkdir(parents=True)
+    old_legacy_file.write_bytes(b'png')
+    fresh_file = qr_codes_storage / 'vacancy_qr' / 'ab' / 'fresh.png'
+    fresh_file.parent.mkdir(parents=True)
+    fresh_file.write_bytes(b'png')
+    hour_ago = time.time() - 3600
+    for path in qr_codes_storage.rglob('*.png'):
+        if path != fresh_file:
+            os.utime(path, (hour_ago, hour_ago))
+
+    assert collect_unreferenced_qr_codes(min_age=timedelta(minutes=30), dry_run=True) == [
+        'vacancy_qr/company_1/old.png'
+    ]
+    assert old_legacy_file.exists()
+
+    call_command('collect_qr_codes', min_age=1800)
+
+    assert not old_legacy_file.exists()
+    assert fresh_file.exists()
+    vacancy.refresh_from_db()
+    assert (qr_codes_storage / vacancy.qr_code.name).exists()
+
+
+def test_qr_code_found_in_storage_is_not_collected(qr_codes_storage: Path) -> None:
+    """Checks that an old unreferenced image reused by a job is kept until the job sets it."""
+
+    name = get_or_create_qr_code(QR_DATA)
+    hour_ago = time.time() - 3600
+    os.utime(qr_codes_storage / name, (hour_ago, hour_ago))
+
+    assert get_or_create_qr_code(QR_DATA) == name
+    assert collect_unreferenced_qr_codes(min_age=timedelta(minutes=30)) == []
+    assert (qr_codes_storage / name).exists()
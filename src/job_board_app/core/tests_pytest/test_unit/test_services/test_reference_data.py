@@ -0,0 +1,74 @@
+import importlib
+
+import pytest
+from core.business_logic.services import get_countries, get_groups, get_levels
+from core.business_logic.services.metrics import Counter
+from core.business_logic.services.reference_data import countries, levels
+from core.models import Country, Level
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    'module',
+    [
+        'core.presentation.web.views.vacancy',
+        'core.presentation.web.views.company',
+        'core.presentation.web.views.registration',
+    ],
+)
+def test_views_do_not_query_database_on_import(module: str) -> None:
+    with CaptureQueriesContext(connection) as queries:
+        importlib.reload(importlib.import_module(module))
+
+    assert len(queries) == 0
+
+
+def test_reference_data_is_loaded_once() -> None:
+    loads = Counter.registry['reference_data_loads']
+    loads_before = loads.get()
+    expected = [('', '')] + [(name, name) for name in Country.objects.values_list('name', flat=True)]
+
+    assert get_countries() == expected
+    with CaptureQueriesContext(connection) as queries:
+        assert get_countries() == expected
+
+    assert len(queries) == 0
+    assert loads.get() == loads_before + 1
+
+
+def test_reference_data_is_reloaded_after_change() -> None:
+    get_levels()
+
+    level = Level.objects.create(name='Lead')
+    assert ('Lead', 'Lead') in get_levels()
+
+    level.delete()
+    assert ('Lead', 'Lead') not in get_levels()
+
+    Group.objects.create(name='Moderator')
+    assert ('Moderator', 'Moderator') in get_groups()
+
+
+def test_reference_data_is_reloaded_when_version_is_changed_by_another_process() -> None:
+    countries.all()
+    # Bulk updates do not send signals, the version is increased explicitly.
+    Country.objects.filter(name='Belarus').update(name='Republic of Belarus')
+    assert 'Republic of Belarus' not in {country.name for country in countries.all()}
+
+    cache.incr(countries._version_key)
+
+    assert 'Republic of Belarus' in {country.name for country in countries.all()}
+
+
+def test_reference_data_is_reloaded_when_version_is_evicted() -> None:
+    levels.all()
+    Level.objects.filter(name='Intern').update(name='Trainee')
+
+    cache.delete(levels._version_key)
+
+    assert 'Trainee' in {level.name for level in levels.all()}
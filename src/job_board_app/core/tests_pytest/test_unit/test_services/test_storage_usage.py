@@ -0,0 +1,130 @@
+import hashlib
+import os
+import time
+from datetime import timedelta
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from core.business_logic.services import get_company_storage_usage, run_pending_jobs
+from core.business_logic.services.common import GeneratedFile, QRLocalAdapter, change_file_size
+from core.business_logic.services.company_logo import enqueue_company_logo_processing, get_company_logo_variant
+from core.business_logic.services.qr_code import collect_unreferenced_qr_codes, generate_vacancy_qr_code
+from core.business_logic.services.storage_usage import (
+    calculate_company_storage_usage,
+    delete_company_file,
+    save_company_file,
+)
+from core.models import Company, CompanyProfile, StoredQRCode, Vacancy
+from core.tests_pytest.conftest import CreatedDBData
+from core.tests_pytest.utils import get_test_image
+from django.core.management import call_command
+from django.test import override_settings
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def media_root(tmp_path: Path) -> Iterator[Path]:
+    with override_settings(MEDIA_ROOT=str(tmp_path)):
+        yield tmp_path
+
+
+def test_generated_file_has_exact_size_and_hash() -> None:
+    content = b'generated content' * 100
+    output = BytesIO(content)
+
+    file = GeneratedFile(output, name='file.png')
+
+    assert file.size == len(content)
+    assert file.sha256 == hashlib.sha256(content).hexdigest()
+    assert file.content_type == 'image/png'
+    # The buffer is released, so the file can still be written.
+    output.write(b'!')
+
+
+def test_generated_files_report_size_of_their_content() -> None:
+    qr_code = QRLocalAdapter().get_qr('data')
+    resized_image = change_file_size(get_test_image())
+
+    for file in (qr_code, resized_image):
+        content = file.read()
+        assert file.size == len(content)
+        assert file.sha256 == hashlib.sha256(content).hexdigest()
+
+
+def test_save_and_delete_company_file(populate_db: CreatedDBData, media_root: Path) -> None:
+    company_id = populate_db.company_1.pk
+    Company.objects.filter(pk=company_id).update(storage_usage=0)
+
+    name = save_company_file(company_id, 'files/file.txt', GeneratedFile.from_bytes(b'12345', name='file.txt'))
+    assert get_company_storage_usage(company_id) == 5
+
+    delete_company_file(company_id, name)
+    delete_company_file(company_id, name)
+    assert get_company_storage_usage(company_id) == 0
+    assert not (media_root / name).exists()
+
+
+def test_generated_qr_code_is_added_to_company_storage_usage(populate_db: CreatedDBData) -> None:
+    vacancy = populate_db.vacancy_1
+    usage = get_company_storage_usage(vacancy.company_id)
+
+    generate_vacancy_qr_code({'vacancy_id': vacancy.pk})
+    vacancy.refresh_from_db()
+    qr_code_size = vacancy.qr_code.size
+    assert get_company_storage_usage(vacancy.company_id) == usage + qr_code_size
+
+    # The stored QR code is reused and counted once.
+    generate_vacancy_qr_code({'vacancy_id': vacancy.pk})
+    assert get_company_storage_usage(vacancy.company_id) == usage + qr_code_size
+
+
+def test_collected_qr_code_is_subtracted_from_company_storage_usage(
+    populate_db: CreatedDBData, media_root: Path
+) -> None:
+    vacancy = populate_db.vacancy_1
+    usage = get_company_storage_usage(vacancy.company_id)
+    generate_vacancy_qr_code({'vacancy_id': vacancy.pk})
+    qr_code_name = Vacancy.objects.get(pk=vacancy.pk).qr_code.name
+    Vacancy.objects.filter(pk=vacancy.pk).update(qr_code='')
+    hour_ago = time.time() - 3600
+    os.utime(media_root / qr_code_name, (hour_ago, hour_ago))
+
+    assert collect_unreferenced_qr_codes(min_age=timedelta(minutes=30)) == [qr_code_name]
+    assert get_company_storage_usage(vacancy.company_id) == usage
+    assert not StoredQRCode.objects.filter(name=qr_code_name).exists()
+
+
+def test_company_logo_files_are_added_to_company_storage_usage(populate_db: CreatedDBData) -> None:
+    company_id = populate_db.company_1.pk
+    Company.objects.filter(pk=company_id).update(storage_usage=0)
+    logo_name = save_company_file(company_id, 'company_logos/logo.png', get_test_image())
+    CompanyProfile.objects.filter(pk=company_id).update(logo_original=logo_name)
+
+    enqueue_company_logo_processing(company_id)
+    with override_settings(IMAGE_PROCESSING_WORKERS=0, IMAGE_VARIANTS={'medium': (50, 40)}):
+        run_pending_jobs()
+        # Processing the logo again keeps its stored variants.
+        enqueue_company_logo_processing(company_id)
+        run_pending_jobs()
+        get_company_logo_variant(company_id, variant='medium', file_format='webp')
+
+    assert get_company_storage_usage(company_id) == calculate_company_storage_usage(company_id)
+
+
+def test_recalculate_storage_usage_command(populate_db: CreatedDBData, capsys: pytest.CaptureFixture) -> None:
+    vacancy = populate_db.vacancy_1
+    attachment_name = save_company_file(
+        vacancy.company_id, 'attachments/cv.pdf', GeneratedFile.from_bytes(b'%PDF-1.4', name='cv.pdf')
+    )
+    Vacancy.objects.filter(pk=vacancy.pk).update(attachment=attachment_name)
+    Company.objects.update(storage_usage=0)
+
+    call_command('recalculate_storage_usage')
+
+    assert 'Updated storage usage of' in capsys.readouterr().out
+    for company in Company.objects.all():
+        assert company.storage_usage == calculate_company_storage_usage(company.pk)
+    assert get_company_storage_usage(vacancy.company_id) == 8
@@ -1,5 +1,11 @@
+import dataclasses
+import os
+import re
+from pathlib import Path
+from typing import Callable
+
 import pytest
-from core.business_logic.dto import AddVacancyDTO, SearchVacancyDTO
+from core.business_logic.dto import AddVacancyDTO, SearchVacancyDTO, VacancyFacetDTO
 from core.business_logic.exceptions import (
     CompanyNotExistsError,
     CountryNotExistError,
@@ -11,12 +17,27 @@ from core.business_logic.services import (
     create_vacancy,
     get_vacancies_by_company_id,
     get_vacancy_by_id,
+    get_vacancy_facets,
     search_vacancies,
+    search_vacancies_cached,
+    search_vacancy_listings,
 )
-from core.models import City, Tag, Vacancy
+from core.business_logic.services.reference_data import levels
+from core.business_logic.services.search_cache import search_cache_hits, search_cache_misses
+from core.business_logic.services.vacancy_listing import can_search_vacancy_listings
+from core.business_logic.services.vacancy_refresh import batch_vacancies_refresh
+from core.management.commands.benchmark_search_vacancies import search_vacancies_with_joins
+from core.management.seeding import SeedSize, seed_vacancies
+from core.models import City, Company, EmploymentFormat, Tag, Vacancy, VacancyListing
+from core.presentation.common.converters import convert_data_from_request_to_dto
 from core.tests_pytest.conftest import CreatedDBData
-from core.tests_pytest.mocks import QRApiAdapterMock
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from core.tests_pytest.test_unit.test_services.test_metrics import UNAVAILABLE_CACHES
+from core.tests_pytest.utils import create_test_vacancy_in_db
+from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 
 def get_add_vacancy_data(
@@ -96,6 +117,9 @@ def get_search_vacancy_data(
     country: str = '',
     city: str = '',
     tag: str = '',
+    query: str = '',
+    search_mode: str = 'icontains',
+    salary_range_mode: str = '',
 ) -> SearchVacancyDTO:
     """Creates SearchVacancyDTO with default empty values for further use in tests.
 
@@ -123,6 +147,12 @@ def get_search_vacancy_data(
     :type city: str
     :param tags: searched vacancy related tag. Default = ''
     :type tags: str
+    :param query: free-text search query. Default = ''
+    :type query: str
+    :param search_mode: mode of matching the free-text query. Default = 'icontains'
+    :type search_mode: str
+    :param salary_range_mode: mode of matching the salary range. Default = ''
+    :type salary_range_mode: str
 
     :rtype: SearchVacancyDTO
     :return: data transfer object with data about searched vacancy
@@ -140,6 +170,9 @@ def get_search_vacancy_data(
         country=country,
         city=city,
         tag=tag,
+        query=query,
+        search_mode=search_mode,
+        salary_range_mode=salary_range_mode,
     )
     return result
 
@@ -150,8 +183,7 @@ def test_create_vacancy_successfully(pdf_for_test: InMemoryUploadedFile) -> None
 
     vacancy_data = get_add_vacancy_data(attachment=pdf_for_test, name='Python Developer')
     count_before_request = Vacancy.objects.all().count()
-    qr_adapter = QRApiAdapterMock()
-    created_vacancy_id = create_vacancy(data=vacancy_data, qr_adapter=qr_adapter)
+    created_vacancy_id = create_vacancy(data=vacancy_data)
     assert type(created_vacancy_id) is int
     count_after_request = Vacancy.objects.all().count()
     assert count_before_request + 1 == count_after_request
@@ -188,9 +220,7 @@ def test_create_vacancy_successfully(pdf_for_test: InMemoryUploadedFile) -> None
 
 
 @pytest.mark.django_db
-def test_create_vacancy_with_invalid_company(
-    pdf_for_test: InMemoryUploadedFile, qr_adapter_mock: QRApiAdapterMock
-) -> None:
+def test_create_vacancy_with_invalid_company(pdf_for_test: InMemoryUploadedFile) -> None:
     """Checks if an exception is raised if specified invalid company name."""
 
     vacancy_data = get_add_vacancy_data(attachment=pdf_for_test, company_name='Invalid Company name')
@@ -198,7 +228,7 @@ def test_create_vacancy_with_invalid_company(
     count_tags_before_request = Tag.objects.all().count()
     count_cities_before_request = City.objects.all().count()
     with pytest.raises(CompanyNotExistsError):
-        create_vacancy(vacancy_data, qr_adapter=qr_adapter_mock)
+        create_vacancy(vacancy_data)
     count_vacancies_after_request = Vacancy.objects.all().count()
     count_tags_after_request = Tag.objects.all().count()
     count_cities_after_request = City.objects.all().count()
@@ -208,9 +238,7 @@ def test_create_vacancy_with_invalid_company(
 
 
 @pytest.mark.django_db
-def test_create_vacancy_with_invalid_country(
-    pdf_for_test: InMemoryUploadedFile, qr_adapter_mock: QRApiAdapterMock
-) -> None:
+def test_create_vacancy_with_invalid_country(pdf_for_test: InMemoryUploadedFile) -> None:
     """Checks if an exception is raised if specified invalid country name."""
 
     vacancy_data = get_add_vacancy_data(attachment=pdf_for_test, country='Invalid Country name')
@@ -218,7 +246,7 @@ def test_create_vacancy_with_invalid_country(
     count_tags_before_request = Tag.objects.all().count()
     count_cities_before_request = City.objects.all().count()
     with pytest.raises(CountryNotExistError):
-        create_vacancy(vacancy_data, qr_adapter=qr_adapter_mock)
+        create_vacancy(vacancy_data)
     count_vacancies_after_request = Vacancy.objects.all().count()
     count_tags_after_request = Tag.objects.all().count()
     count_cities_after_request = City.objects.all().count()
@@ -228,9 +256,7 @@ def test_create_vacancy_with_invalid_country(
 
 
 @pytest.mark.django_db
-def test_create_vacancy_with_invalid_employment_formats(
-    pdf_for_test: InMemoryUploadedFile, qr_adapter_mock: QRApiAdapterMock
-) -> None:
+def test_create_vacancy_with_invalid_employment_formats(pdf_for_test: InMemoryUploadedFile) -> None:
     """Checks if an exception is raised if specified invalid employment format."""
 
     vacancy_data = get_add_vacancy_data(attachment=pdf_for_test, employment_format=['Invalid', 'Formats'])
@@ -238,7 +264,7 @@ def test_create_vacancy_with_invalid_employment_formats(
     count_tags_before_request = Tag.objects.all().count()
     count_cities_before_request = City.objects.all().count()
     with pytest.raises(EmploymentFormatNotExistError):
-        create_vacancy(vacancy_data, qr_adapter=qr_adapter_mock)
+        create_vacancy(vacancy_data)
     count_vacancies_after_request = Vacancy.objects.all().count()
     count_tags_after_request = Tag.objects.all().count()
     count_cities_after_request = City.objects.all().count()
@@ -248,9 +274,7 @@ def test_create_vacancy_with_invalid_employment_formats(
 
 
 @pytest.mark.django_db
-def test_create_vacancy_with_invalid_work_formats(
-    pdf_for_test: InMemoryUploadedFile, qr_adapter_mock: QRApiAdapterMock
-) -> None:
+def test_create_vacancy_with_invalid_work_formats(pdf_for_test: InMemoryUploadedFile) -> None:
     """Checks if an exception is raised if specified invalid work format."""
 
     vacancy_data = get_add_vacancy_data(attachment=pdf_for_test, work_format=['Invalid', 'Formats'])
@@ -258,7 +282,7 @@ def test_create_vacancy_with_invalid_work_formats(
     count_tags_before_request = Tag.objects.all().count()
     count_cities_before_request = City.objects.all().count()
     with pytest.raises(WorkFormatNotExistError):
-        create_vacancy(vacancy_data, qr_adapter=qr_adapter_mock)
+        create_vacancy(vacancy_data)
     count_vacancies_after_request = Vacancy.objects.all().count()
     count_tags_after_request = Tag.objects.all().count()
     count_cities_after_request = City.objects.all().count()
@@ -267,6 +291,126 @@ def test_create_vacancy_with_invalid_work_formats(
     assert count_cities_before_request == count_cities_after_request
 
 
+def count_create_vacancy_queries(vacancy_data: AddVacancyDTO) -> dict[str, int]:
+    """Creates a vacancy and counts executed queries: all of them and the ones resolving tags and cities.
+
+    Levels are loaded by a query every time, so the counts do not depend on previously created vacancies.
+    """
+
+    levels.invalidate()
+    with CaptureQueriesContext(connection) as context:
+        create_vacancy(data=vacancy_data)
+    queries = [query['sql'] for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]
+    return {
+        'total': len(queries),
+        'tags': sum(1 for sql in queries if re.match(r'(SELECT .* FROM "tags" WHERE|INSERT INTO "tags" )', sql)),
+        'cities': sum(1 for sql in queries if re.match(r'(SELECT .* FROM "cities" WHERE|INSERT INTO "cities" )', sql)),
+        'refreshes': sum(
+            1
+            for sql in queries
+            if re.match(r'(UPDATE "vacancies" SET "search_vector"|INSERT INTO "vacancy_listings")', sql)
+        ),
+    }
+
+
+@pytest.mark.django_db
+def test_create_vacancy_resolves_relations_by_names(
+    populate_db: CreatedDBData, pdf_for_test: InMemoryUploadedFile
+) -> None:
+    """Checks that existing tags and cities are reused and missing ones are created once with the vacancy country."""
+
+    tags_count, minsk_count = Tag.objects.count(), City.objects.filter(name='Minsk').count()
+    vacancy_data = get_add_vacancy_data(attachment=pdf_for_test, tags='Python python NewTag', city='minsk gomel minsk')
+    vacancy = Vacancy.objects.get(pk=create_vacancy(data=vacancy_data))
+
+    assert set(vacancy.tags.values_list('name', flat=True)) == {'python', 'newtag'}
+    assert Tag.objects.count() == tags_count + 1
+    assert set(vacancy.city.values_list('name', 'country__name')) == {('Minsk', 'Belarus'), ('Gomel', 'Belarus')}
+    assert City.objects.filter(name='Minsk').count() == minsk_count
+
+
+@pytest.mark.django_db
+def test_create_vacancy_queries_do_not_depend_on_relations_count(pdf_for_test: InMemoryUploadedFile) -> None:
+    """Checks that tags and cities are resolved with at most three queries each regardless of their number."""
+
+    few_relations = get_add_vacancy_data(attachment=pdf_for_test, tags='few_1 python', city='Few_1 Minsk')
+    many_relations = get_add_vacancy_data(
+        attachment=pdf_for_test,
+        tags=' '.join([f'many_{i}' for i in range(10)] + ['python']),
+        city=' '.join([f'Many_{i}' for i in range(5)] + ['Minsk']),
+    )
+    few_queries = count_create_vacancy_queries(few_relations)
+    many_queries = count_create_vacancy_queries(many_relations)
+
+    assert few_queries == many_queries
+    assert many_queries['total'] == 28
+    assert many_queries['tags'] <= 3
+    assert many_queries['cities'] <= 3
+    assert many_queries['refreshes'] == 2
+
+
+@pytest.mark.django_db
+def test_create_vacancy_refreshes_search_document_and_listing(
+    populate_db: CreatedDBData, pdf_for_test: InMemoryUploadedFile
+) -> None:
+    """Checks that the vacancy refreshed once after all relations are set is found by its tags and cities."""
+
+    vacancy_data = get_add_vacancy_data(attachment=pdf_for_test, tags='kotlin', city='Grodno')
+    vacancy = Vacancy.objects.get(pk=create_vacancy(data=vacancy_data))
+
+    listing = VacancyListing.objects.get(pk=vacancy.pk)
+    assert listing.tag_ids == list(vacancy.tags.values_list('pk', flat=True))
+    assert listing.city_ids == list(vacancy.city.values_list('pk', flat=True))
+    assert sorted(listing.work_format_ids) == sorted(vacancy.work_format.values_list('pk', flat=True))
+    found = search_vacancies(get_search_vacancy_data(query='kotlin grodno', search_mode='fulltext'))
+    assert list(found) == [vacancy]
+
+
+@pytest.mark.django_db
+def test_batch_vacancies_refresh_refreshes_at_the_end(populate_db: CreatedDBData) -> None:
+    """Checks that vacancies changed in a batch are refreshed once at its end."""
+
+    vacancy = populate_db.vacancy_1
+    with batch_vacancies_refresh():
+        vacancy.name = 'renamed_vacancy'
+        vacancy.save()
+        vacancy.tags.clear()
+        assert VacancyListing.objects.get(pk=vacancy.pk).name != 'renamed_vacancy'
+    listing = VacancyListing.objects.get(pk=vacancy.pk)
+    assert listing.name == 'renamed_vacancy'
+    assert listing.tag_ids == []
+
+
+@pytest.mark.django_db
+def test_create_vacancy_moves_temporary_uploaded_attachment(tmp_path: Path) -> None:
+    """Checks that attachments streamed to temporary files pass the DTO conversion and are moved into the storage."""
+
+    content = b'%PDF-1.4\n' + b'0' * 300_000
+    attachment = TemporaryUploadedFile('cv.pdf', 'application/pdf', size=len(content), charset=None)
+    attachment.write(content)
+    attachment.seek(0)
+    temporary_path = attachment.temporary_file_path()
+    vacancy_data = convert_data_from_request_to_dto(
+        AddVacancyDTO, dataclasses.asdict(get_add_vacancy_data(attachment=None)) | {'attachment': attachment}
+    )
+
+    with override_settings(MEDIA_ROOT=str(tmp_path)):
+        vacancy = Vacancy.objects.get(pk=create_vacancy(data=vacancy_data))
+        with vacancy.attachment.open('rb') as file:
+            assert file.read() == content
+    assert not os.path.exists(temporary_path)
+    attachment.close()
+
+
+@pytest.mark.django_db
+def test_benchmark_uploads_command(capsys: pytest.CaptureFixture) -> None:
+    call_command('benchmark_uploads', size=500_000)
+
+    output = capsys.readouterr().out
+    assert 'In memory (InMemoryUploadedFile):' in output
+    assert 'Streamed to a temporary file (TemporaryUploadedFile):' in output
+
+
 @pytest.mark.django_db
 def test_get_vacancy_by_invalid_id() -> None:
     """Checks if an exception is raises if company with specified company_id doesn't exist in the database."""
@@ -742,3 +886,334 @@ def test_search_vacancies_by_city_filter(populate_db: CreatedDBData) -> None:
     vacancies_data = get_search_vacancy_data(city='Invalid city name')
     result_queryset = search_vacancies(vacancies_data)
     assert len(result_queryset) == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('query', ['python', 'Minsk', 'Erevan', 'description', 'test_company_2', 'nonexistent'])
+def test_search_vacancies_fulltext_matches_icontains(populate_db: CreatedDBData, query: str) -> None:
+    """Checks that full-text search mode finds the same vacancies as the substring search mode."""
+
+    icontains_result = search_vacancies(get_search_vacancy_data(query=query, search_mode='icontains'))
+    fulltext_result = search_vacancies(get_search_vacancy_data(query=query, search_mode='fulltext'))
+    assert set(fulltext_result) == set(icontains_result)
+
+
+@pytest.mark.django_db
+def test_search_vacancies_fulltext_ordered_by_rank(
+    populate_db: CreatedDBData, pdf_for_test: InMemoryUploadedFile
+) -> None:
+    """Checks that vacancies matching the query by name are ranked above vacancies matching it by tag."""
+
+    python_vacancy = create_test_vacancy_in_db(
+        vacancy_name='Python developer', company=populate_db.company_2, attachment_file=pdf_for_test, tags='django'
+    )
+    vacancies_data = get_search_vacancy_data(query='python', search_mode='fulltext')
+    result_queryset = search_vacancies(vacancies_data)
+    assert len(result_queryset) == 3
+    assert result_queryset[0] == python_vacancy
+    assert populate_db.vacancy_1 in result_queryset
+    assert populate_db.vacancy_4 in result_queryset
+
+
+@pytest.mark.django_db
+def test_search_vacancies_fulltext_vector_follows_updates(populate_db: CreatedDBData) -> None:
+    """Checks that the stored search vector is refreshed after changes of the vacancy and related entities."""
+
+    vacancies_data = get_search_vacancy_data(query='kotlin', search_mode='fulltext')
+    assert len(search_vacancies(vacancies_data)) == 0
+    populate_db.vacancy_2.tags.add(Tag.objects.create(name='kotlin'))
+    result_queryset = search_vacancies(vacancies_data)
+    assert len(result_queryset) == 1
+    assert populate_db.vacancy_2 in result_queryset
+
+    company = Company.objects.get(pk=populate_db.company_2.pk)
+    company.name = 'Acme'
+    company.save()
+    result_queryset = search_vacancies(get_search_vacancy_data(query='acme', search_mode='fulltext'))
+    assert len(result_queryset) == 1
+    assert populate_db.vacancy_3 in result_queryset
+
+    vacancy = Vacancy.objects.get(pk=populate_db.vacancy_3.pk)
+    vacancy.name = 'Golang engineer'
+    vacancy.save()
+    result_queryset = search_vacancies(get_search_vacancy_data(query='golang', search_mode='fulltext'))
+    assert len(result_queryset) == 1
+    assert populate_db.vacancy_3 in result_queryset
+
+
+@pytest.mark.django_db
+def test_search_vacancies_fuzzy_name_filter(populate_db: CreatedDBData, pdf_for_test: InMemoryUploadedFile) -> None:
+    """Checks that fuzzy search mode finds vacancies by misspelled name which substring search misses."""
+
+    python_vacancy = create_test_vacancy_in_db(
+        vacancy_name='Python developer', company=populate_db.company_2, attachment_file=pdf_for_test
+    )
+    result_queryset = search_vacancies(get_search_vacancy_data(name='pyhton dev'))
+    assert len(result_queryset) == 0
+    result_queryset = search_vacancies(get_search_vacancy_data(name='pyhton dev', search_mode='fuzzy'))
+    assert len(result_queryset) == 1
+    assert python_vacancy in result_queryset
+    with override_settings(TRIGRAM_SIMILARITY_THRESHOLD=0.9):
+        result_queryset = search_vacancies(get_search_vacancy_data(name='pyhton dev', search_mode='fuzzy'))
+        assert len(result_queryset) == 0
+
+
+@pytest.mark.django_db
+def test_search_vacancies_fuzzy_ordered_by_similarity(populate_db: CreatedDBData) -> None:
+    """Checks that fuzzy search mode orders vacancies by similarity of the company name."""
+
+    vacancies_data = get_search_vacancy_data(company_name='test_compny_2', search_mode='fuzzy')
+    result_queryset = search_vacancies(vacancies_data)
+    assert len(result_queryset) == 4
+    assert result_queryset[0] == populate_db.vacancy_3
+    vacancies_data = get_search_vacancy_data(name='vacancy_1', company_name='test_compny_3', search_mode='fuzzy')
+    result_queryset = search_vacancies(vacancies_data)
+    assert result_queryset[0] == populate_db.vacancy_4
+
+
+@pytest.mark.django_db
+def test_search_vacancies_fuzzy_keeps_connection_settings(populate_db: CreatedDBData) -> None:
+    """Checks that fuzzy search mode does not change the similarity threshold of the database connection."""
+
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW pg_trgm.word_similarity_threshold")
+        threshold = cursor.fetchone()[0]
+    list(search_vacancies(get_search_vacancy_data(company_name='test_compny_2', search_mode='fuzzy')))
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW pg_trgm.word_similarity_threshold")
+        assert cursor.fetchone()[0] == threshold
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'filters',
+    [
+        {},
+        {'tag': 'seed_tag_1'},
+        {'tag': 'python', 'level': 'Middle'},
+        {'employment_format': ['B2B', 'Employment contract']},
+        {'employment_format': ['B2B'], 'work_format': ['Remote work', 'Hybrid']},
+        {'country': 'seed_country_1'},
+        {'country': 'seed_country_2', 'city': 'Minsk', 'tag': 'seed_tag_3'},
+        {'country': 'Belarus', 'work_format': ['Freelance'], 'min_salary': 500},
+        {'query': 'python'},
+        {'query': 'seed_tag_1', 'employment_format': ['B2B']},
+        {'query': 'seed_city', 'max_salary': 3000, 'company_name': 'company'},
+    ],
+)
+def test_search_vacancies_exists_filters_match_joins(filters: dict) -> None:
+    """Checks that EXISTS filters return the same vacancies in the same order as JOIN + DISTINCT filters."""
+
+    seed_vacancies(SeedSize(vacancies=300, companies=10, tags=10, countries=3, cities_per_country=3), random_seed=4)
+    search_filters = get_search_vacancy_data(**filters)
+    result_ids = [vacancy.pk for vacancy in search_vacancies(search_filters)]
+    expected_ids = list(search_vacancies_with_joins(search_filters).values_list('pk', flat=True))
+    assert result_ids == expected_ids
+    assert len(result_ids) == len(set(result_ids))
+    if can_search_vacancy_listings(search_filters):
+        assert list(search_vacancy_listings(search_filters).values_list('pk', flat=True)) == expected_ids
+
+
+@pytest.mark.django_db
+def test_get_vacancy_facets(populate_db: CreatedDBData, django_assert_num_queries: Callable) -> None:
+    """Checks that facet counts equal the numbers of vacancies found with every option selected."""
+
+    vacancies_data = get_search_vacancy_data(tag='python')
+    with django_assert_num_queries(6):
+        facets = get_vacancy_facets(vacancies_data, use_cache=False)
+
+    assert facets['tag'] == [VacancyFacetDTO(name=name, count=2) for name in ('python', 'sql', 'tag1', 'tag2')]
+    assert facets['level'] == [VacancyFacetDTO(name='Junior', count=1), VacancyFacetDTO(name='Middle', count=1)]
+    assert facets['country'] == [VacancyFacetDTO(name='Armenia', count=1), VacancyFacetDTO(name='Belarus', count=1)]
+    for group in ('level', 'country', 'city'):
+        for option in facets[group]:
+            option_data = get_search_vacancy_data(tag='python', **{group: option.name})
+            assert len(search_vacancies(option_data)) == option.count
+    for group in ('employment_format', 'work_format'):
+        for option in facets[group]:
+            option_data = get_search_vacancy_data(tag='python', **{group: [option.name]})
+            assert len(search_vacancies(option_data)) == option.count
+
+
+@pytest.mark.django_db
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+def test_get_vacancy_facets_cached_by_normalized_filters(
+    populate_db: CreatedDBData, django_assert_num_queries: Callable
+) -> None:
+    """Checks that facet counts are cached by filters regardless of their order and empty values."""
+
+    facets = get_vacancy_facets(get_search_vacancy_data(employment_format=['B2B', 'Employment contract']))
+    with django_assert_num_queries(0):
+        cached_facets = get_vacancy_facets(
+            get_search_vacancy_data(employment_format=['Employment contract', 'B2B'], description=None)
+        )
+    assert cached_facets == facets
+    with django_assert_num_queries(6):
+        get_vacancy_facets(get_search_vacancy_data(employment_format=['B2B']))
+
+
+@pytest.mark.django_db
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+def test_search_vacancies_cached_by_normalized_filters(populate_db: CreatedDBData) -> None:
+    """Checks that search results are cached by filters regardless of their order and empty values."""
+
+    result = search_vacancies_cached(get_search_vacancy_data(work_format=['Remote work', 'Hybrid'], description=None))
+    assert result.count() == 2
+    assert [vacancy.pk for vacancy in result[0:2]] == [populate_db.vacancy_3.pk, populate_db.vacancy_2.pk]
+    hits, misses = search_cache_hits.get(), search_cache_misses.get()
+
+    result = search_vacancies_cached(get_search_vacancy_data(work_format=['Hybrid', 'Remote work']))
+    assert result.count() == 2
+    assert [vacancy.pk for vacancy in result[0:2]] == [populate_db.vacancy_3.pk, populate_db.vacancy_2.pk]
+    assert search_cache_hits.get() == hits + 2
+    assert search_cache_misses.get() == misses
+    assert result[1].pk == populate_db.vacancy_2.pk
+    assert search_cache_misses.get() == misses + 1
+
+
+@pytest.mark.django_db
+def test_search_vacancies_cached_without_cache(populate_db: CreatedDBData, caplog: pytest.LogCaptureFixture) -> None:
+    """Checks that search results are queried from the database when the cache is unavailable."""
+
+    vacancies_data = get_search_vacancy_data(work_format=['Remote work', 'Hybrid'])
+    with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+        result = search_vacancies_cached(vacancies_data)
+    with override_settings(CACHES=UNAVAILABLE_CACHES):
+        assert result.count() == 2
+        assert [vacancy.pk for vacancy in result[0:2]] == [populate_db.vacancy_3.pk, populate_db.vacancy_2.pk]
+        assert search_vacancies_cached(vacancies_data).count() == 2
+
+    assert 'Failed to get vacancies search results from cache.' in caplog.text
+    assert 'Vacancies search cache is unavailable.' in caplog.text
+
+
+@pytest.mark.django_db
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+def test_search_vacancies_cache_invalidated_on_change(
+    populate_db: CreatedDBData, pdf_for_test: InMemoryUploadedFile, django_capture_on_commit_callbacks: Callable
+) -> None:
+    """Checks that cached search results are invalidated on vacancy or tag change and after commit."""
+
+    vacancies_data = get_search_vacancy_data(tag='python')
+    assert search_vacancies_cached(vacancies_data).count() == 2
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        create_test_vacancy_in_db(
+            vacancy_name='Cached_vacancy', company=populate_db.company_2, attachment_file=pdf_for_test, tags='python'
+        )
+    assert callbacks
+    assert search_vacancies_cached(vacancies_data).count() == 3
+
+    Tag.objects.filter(name='python').update(name='python3')
+    assert search_vacancies_cached(vacancies_data).count() == 3
+    Tag.objects.get(name='python3').save()
+    assert search_vacancies_cached(vacancies_data).count() == 0
+
+
+@pytest.mark.django_db
+def test_vacancy_listings_follow_changes(populate_db: CreatedDBData) -> None:
+    """Checks that listing rows are kept in sync with vacancies and their relations."""
+
+    vacancy = populate_db.vacancy_1
+    listing = VacancyListing.objects.get(pk=vacancy.pk)
+    assert listing.name == vacancy.name
+    assert listing.company == (populate_db.company_1.pk, 'test_company_1')
+    assert listing.level.name == 'Junior'
+    assert sorted(listing.tag_ids) == sorted(vacancy.tags.values_list('pk', flat=True))
+    assert listing.employment_format_ids == [EmploymentFormat.objects.get(name='B2B').pk]
+
+    populate_db.company_1.name = 'renamed_company'
+    populate_db.company_1.save()
+    new_tag = Tag.objects.create(name='rust')
+    new_tag.vacancies.add(vacancy)
+    vacancy.city.clear()
+    listing.refresh_from_db()
+    assert listing.company_name == 'renamed_company'
+    assert new_tag.pk in listing.tag_ids
+    assert listing.city_ids == []
+
+    new_tag.delete()
+    listing.refresh_from_db()
+    assert new_tag.pk not in listing.tag_ids
+
+    vacancy.delete()
+    assert not VacancyListing.objects.filter(pk=listing.pk).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('shape, queries_number', [('list', 1), ('detail', 5), ('export', 5)])
+def test_search_vacancies_shape_queries_number(
+    populate_db: CreatedDBData, django_assert_num_queries: Callable, shape: str, queries_number: int
+) -> None:
+    """Checks the number of queries needed to render vacancies found with every result shape."""
+
+    with django_assert_num_queries(queries_number):
+        vacancies = list(search_vacancies(get_search_vacancy_data(), shape=shape))
+        for vacancy in vacancies:
+            assert vacancy.company.name and vacancy.level.name and vacancy.experience
+            if shape != 'list':
+                assert vacancy.description != ''
+                assert [tag.name for tag in vacancy.tags.all()]
+                assert [city.name for city in vacancy.city.all()]
+            if shape == 'export':
+                assert [city.country.name for city in vacancy.city.all()]
+    assert len(vacancies) == 4
+    assert ('description' in vacancies[0].get_deferred_fields()) == (shape == 'list')
+    assert 'search_vector' in vacancies[0].get_deferred_fields()
+
+
+@pytest.mark.django_db
+def test_search_vacancies_unknown_shape() -> None:
+    with pytest.raises(ValueError):
+        search_vacancies(get_search_vacancy_data(), shape='unknown')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('salary_filters', 'expected_vacancies'),
+    [
+        ({'min_salary': 900, 'max_salary': 3500}, []),
+        ({'min_salary': 900, 'max_salary': 3500, 'salary_range_mode': 'overlaps'}, ['vacancy_1', 'vacancy_4']),
+        ({'min_salary': 4000, 'salary_range_mode': 'overlaps'}, ['vacancy_4']),
+        ({'min_salary': 3500, 'max_salary': 4500, 'salary_range_mode': 'contains'}, ['vacancy_4']),
+        ({'min_salary': 3500, 'max_salary': 6000, 'salary_range_mode': 'contains'}, []),
+        ({'min_salary': 50, 'max_salary': 2000, 'salary_range_mode': 'within'}, ['vacancy_1']),
+        ({'min_salary': 50, 'salary_range_mode': 'within'}, ['vacancy_1', 'vacancy_4']),
+    ],
+)
+def test_search_vacancies_by_salary_range(
+    populate_db: CreatedDBData, salary_filters: dict, expected_vacancies: list[str]
+) -> None:
+    expected_ids = {getattr(populate_db, vacancy).pk for vacancy in expected_vacancies}
+    search_filters = get_search_vacancy_data(**salary_filters)
+
+    assert {vacancy.pk for vacancy in search_vacancies(search_filters)} == expected_ids
+    assert {listing.pk for listing in search_vacancy_listings(search_filters)} == expected_ids
+
+
+@pytest.mark.django_db
+def test_vacancy_salary_range_follows_salaries(populate_db: CreatedDBData) -> None:
+    vacancy = populate_db.vacancy_1
+    vacancy.min_salary, vacancy.max_salary = 2000, None
+    vacancy.save()
+
+    vacancy.refresh_from_db()
+    assert vacancy.salary_range.lower == 2000 and vacancy.salary_range.upper is None
+    assert VacancyListing.objects.get(pk=vacancy.pk).salary_range == vacancy.salary_range
+    search_filters = get_search_vacancy_data(min_salary=10000, salary_range_mode='overlaps')
+    assert vacancy in search_vacancies(search_filters)
+
+
+@pytest.mark.django_db
+def test_vacancy_salary_range_follows_bulk_salary_updates(populate_db: CreatedDBData) -> None:
+    """Checks that the salary range is kept in sync by updates that skip model signals."""
+
+    vacancy_1, vacancy_4 = populate_db.vacancy_1, populate_db.vacancy_4
+    Vacancy.objects.filter(pk=vacancy_1.pk).update(min_salary=7000, max_salary=5000)
+    vacancy_4.min_salary, vacancy_4.max_salary = None, None
+    Vacancy.objects.bulk_update([vacancy_4], ['min_salary', 'max_salary'])
+
+    vacancy_1.refresh_from_db()
+    vacancy_4.refresh_from_db()
+    assert (vacancy_1.salary_range.lower, vacancy_1.salary_range.upper) == (5000, 7001)
+    assert vacancy_4.salary_range is None
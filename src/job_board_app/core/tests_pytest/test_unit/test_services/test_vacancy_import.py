@@ -0,0 +1,186 @@
+import io
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from core.business_logic.dto import VacancyImportRowDTO
+from core.business_logic.services import get_vacancy_import_rows, import_vacancies
+from core.models import City, Tag, Vacancy, VacancyListing
+from core.presentation.api_v1.serializers import validate_add_vacancy_data
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+CSV_HEADER = (
+    'name,company_name,level,experience,min_salary,max_salary,description,'
+    'employment_format,work_format,country,city,tags\n'
+)
+
+
+def get_csv_row(
+    name: str = 'Imported vacancy',
+    company_name: str = 'test_company_1',
+    level: str = 'Junior',
+    min_salary: str = '1000',
+    employment_format: str = 'B2B;Employment contract',
+    city: str = 'minsk gomel',
+    tags: str = 'Python django',
+) -> str:
+    """Creates a CSV row of an imported vacancy with default values."""
+
+    return (
+        f'{name},{company_name},{level},1 year,{min_salary},,Imported description,'
+        f'{employment_format},Remote work,Belarus,{city},{tags}\n'
+    )
+
+
+def get_ndjson_row(**fields: object) -> str:
+    """Creates an NDJSON row of an imported vacancy with default values."""
+
+    vacancy = {
+        'name': 'Imported vacancy',
+        'company_name': 'test_company_2',
+        'level': 'Middle',
+        'experience': '2 years',
+        'description': 'Imported description',
+        'employment_format': ['B2B'],
+        'work_format': ['Hybrid'],
+        'country': 'Armenia',
+        'city': 'Erevan',
+        'tags': 'go',
+    }
+    vacancy.update(fields)
+    return json.dumps(vacancy) + '\n'
+
+
+def get_import_rows(content: str, file_format: str) -> Iterator[VacancyImportRowDTO]:
+    """Parses rows of the import file content validated by the vacancy creation API rules."""
+
+    return get_vacancy_import_rows(
+        io.BytesIO(content.encode()), file_format=file_format, validate_vacancy_data=validate_add_vacancy_data
+    )
+
+
+@pytest.mark.django_db
+def test_import_vacancies_from_csv() -> None:
+    """Checks that valid rows are imported with relations and derived data, invalid rows are reported."""
+
+    content = (
+        CSV_HEADER
+        + get_csv_row(name='Imported 1')
+        + get_csv_row(name='')
+        + get_csv_row(name='Imported 3', company_name='Unknown company', employment_format='Unknown')
+        + get_csv_row(name='Imported 4', min_salary='', tags='', city='Brest')
+    )
+    minsk_count = City.objects.filter(name='Minsk').count()
+
+    result = import_vacancies(get_import_rows(content, 'csv'))
+
+    assert result.created == 2
+    assert result.failed == 2
+    assert [error.row for error in result.errors] == [2, 3]
+    assert 'name' in result.errors[0].errors
+    assert set(result.errors[1].errors) == {'company_name', 'employment_format'}
+    vacancy = Vacancy.objects.get(name='Imported 1')
+    assert set(vacancy.tags.values_list('name', flat=True)) == {'python', 'django'}
+    assert set(vacancy.city.values_list('name', flat=True)) == {'Minsk', 'Gomel'}
+    assert set(vacancy.employment_format.values_list('name', flat=True)) == {'B2B', 'Employment contract'}
+    assert vacancy.salary_range.lower == 1000 and vacancy.salary_range.upper is None
+    assert vacancy.search_vector is not None
+    assert VacancyListing.objects.get(pk=vacancy.pk).tag_ids
+    assert City.objects.filter(name='Minsk').count() == minsk_count
+    assert not Vacancy.objects.get(name='Imported 4').tags.exists()
+
+
+@pytest.mark.django_db
+def test_import_vacancies_from_ndjson() -> None:
+    """Checks that invalid JSON lines are reported and blank lines are skipped."""
+
+    content = get_ndjson_row(name='Imported 1') + '\n' + '{"name": \n' + get_ndjson_row(name='Imported 4', level='Lead')
+
+    result = import_vacancies(get_import_rows(content, 'ndjson'))
+
+    assert result.created == 1
+    assert [(error.row, list(error.errors)) for error in result.errors] == [(3, ['non_field_errors']), (4, ['level'])]
+    assert Vacancy.objects.get(name='Imported 1').city.get().country.name == 'Armenia'
+
+
+@pytest.mark.django_db
+def test_get_vacancy_import_rows_validates_fields() -> None:
+    """Checks that rows are cleaned and invalid fields are reported with lists of messages."""
+
+    content = (
+        get_ndjson_row(name='  Imported 1 ', min_salary='1000', max_salary='2000.0')
+        + get_ndjson_row(name='n' * 31, min_salary=-1, employment_format='B2B', work_format=[''], tags=None)
+        + get_ndjson_row(experience=None, country=True)
+    )
+
+    rows = list(get_import_rows(content, 'ndjson'))
+
+    vacancy = rows[0].vacancy
+    assert vacancy is not None and not rows[0].errors
+    assert (vacancy.name, vacancy.min_salary, vacancy.max_salary, vacancy.attachment) == (
+        'Imported 1',
+        1000,
+        2000,
+        None,
+    )
+    assert rows[1].vacancy is None
+    assert rows[1].errors == {
+        'name': ['Ensure this field has no more than 30 characters.'],
+        'tags': ['This field may not be null.'],
+        'min_salary': ['Ensure this value is greater than or equal to 0.'],
+        'employment_format': ['Expected a list of items but got type "str".'],
+        'work_format': {0: ['This field may not be blank.']},
+    }
+    assert rows[2].errors == {'experience': ['This field may not be null.'], 'country': ['Not a valid string.']}
+
+
+@pytest.mark.django_db
+def test_import_vacancies_saves_rows_of_rejected_chunk_one_by_one() -> None:
+    """Checks that rows of a chunk rejected by the database are saved separately."""
+
+    content = CSV_HEADER + get_csv_row(name='Imported 1') + get_csv_row(name='Imported 2', tags='t' * 31)
+
+    result = import_vacancies(get_import_rows(content, 'csv'))
+
+    assert result.created == 1
+    assert [error.row for error in result.errors] == [2]
+    assert Vacancy.objects.filter(name='Imported 1').exists()
+    assert not Tag.objects.filter(name='t' * 31).exists()
+
+
+@pytest.mark.django_db
+def test_import_vacancies_queries_do_not_depend_on_rows_count() -> None:
+    """Checks that a chunk is imported with the same number of queries regardless of its size."""
+
+    def count_queries(rows_count: int) -> int:
+        content = CSV_HEADER + ''.join(
+            get_csv_row(name=f'Imported {rows_count} {i}', tags=f'tag_{rows_count}_{i} python', city=f'city{i}')
+            for i in range(rows_count)
+        )
+        with CaptureQueriesContext(connection) as context:
+            import_vacancies(get_import_rows(content, 'csv'))
+        return len([query for query in context.captured_queries if 'SAVEPOINT' not in query['sql']])
+
+    assert count_queries(2) == count_queries(20)
+
+
+@pytest.mark.django_db
+@override_settings(VACANCY_IMPORT_MAX_REPORTED_ERRORS=1)
+def test_import_vacancies_command(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Checks that the command imports the file in chunks and limits reported errors."""
+
+    path = tmp_path / 'vacancies.csv'
+    rows = [get_csv_row(name=f'Imported {i}') for i in range(5)] + [get_csv_row(name='')] * 3
+    path.write_text(CSV_HEADER + ''.join(rows))
+
+    call_command('import_vacancies', str(path), chunk_size=2)
+
+    output = capsys.readouterr()
+    assert Vacancy.objects.filter(name__startswith='Imported').count() == 5
+    assert 'Created 5 vacancies, 3 rows failed.' in output.out
+    assert 'Row 6:' in output.err
+    assert 'Errors of 2 more rows are not shown.' in output.err
@@ -0,0 +1,34 @@
+import pytest
+from core.management.startup import profile_startup
+from django.conf import settings
+from django.core.management import call_command
+from django.test import Client
+
+pytestmark = pytest.mark.django_db
+
+LAZILY_IMPORTED_MODULES = ('PIL', 'drf_yasg.views', 'core.business_logic.services.http_client')
+
+
+def test_loading_urls_does_not_query_database_or_import_heavy_modules() -> None:
+    profile = profile_startup(settings.ROOT_URLCONF)
+
+    assert profile.queries == []
+    imported = {item.module for item in profile.import_times}
+    assert 'core.presentation.api_v1.views' in imported
+    assert imported.isdisjoint(LAZILY_IMPORTED_MODULES)
+
+
+def test_profile_startup_command(capsys: pytest.CaptureFixture) -> None:
+    call_command('profile_startup', limit=5, prefix='core.')
+
+    output = capsys.readouterr().out
+    assert 'Startup with import of job_board_app.urls' in output
+    assert 'core.' in output
+    assert 'No queries are executed during imports.' in output
+
+
+def test_swagger_ui_is_served(client: Client) -> None:
+    response = client.get('/api/v1/docs/')
+
+    assert response.status_code == 200
+    assert b'swagger' in response.content.lower()
@@ -8,6 +8,7 @@ from core.presentation.common.validators import (
     validate_swear_words_in_company_name,
 )
 from core.tests_pytest.mocks import FileMock
+from django.core.files.uploadedfile import TemporaryUploadedFile
 
 
 @pytest.mark.django_db
@@ -38,7 +39,7 @@ def test_validate_file_extension_successfully() -> None:
     """Checks correctness of file extension validation when passed valid value."""
 
     validator = ValidateFileExtensions(available_extensions=["pdf"])
-    test_file = FileMock(name='test.pdf')
+    test_file = FileMock(name='test.pdf', content=b'%PDF-1.4')
 
     result = validator(value=test_file)
 
@@ -62,9 +63,9 @@ def test_validate_image_extension_successfully() -> None:
     """Checks correctness of image extension validation when passed valid value."""
 
     validator = ValidateImageExtensions(available_extensions=["jpg", "jpeg", "png"])
-    test_file_1 = FileMock(name="test.jpg")
-    test_file_2 = FileMock(name="test.jpeg")
-    test_file_3 = FileMock(name="test.png")
+    test_file_1 = FileMock(name="test.jpg", content=b'\xff\xd8\xff\xe0')
+    test_file_2 = FileMock(name="test.jpeg", content=b'\xff\xd8\xff\xe0')
+    test_file_3 = FileMock(name="test.png", content=b'\x89PNG\r\n\x1a\n')
     result_1 = validator(value=test_file_1)
     result_2 = validator(value=test_file_2)
     result_3 = validator(value=test_file_3)
@@ -83,6 +84,44 @@ def test_validate_image_extension_invalid_file_name() -> None:
     assert result, {"status": False, "message": "Accept only ['jpg', 'jpeg', 'png']"}
 
 
+@pytest.mark.django_db
+def test_validate_file_extension_content_mismatch() -> None:
+    """Checks that files whose leading bytes do not match the extension are rejected."""
+
+    validator = ValidateFileExtensions(available_extensions=["pdf"])
+    test_file = FileMock(name="test.pdf", content=b'\x89PNG\r\n\x1a\n')
+
+    result = validator(value=test_file)
+
+    assert result == {"status": False, "message": "File content does not match the pdf format"}
+
+
+@pytest.mark.django_db
+def test_validate_image_extension_content_mismatch() -> None:
+    """Checks that images whose leading bytes do not match the extension are rejected."""
+
+    validator = ValidateImageExtensions(available_extensions=["jpg", "jpeg", "png"])
+    test_file = FileMock(name="test.png", content=b'%PDF-1.4')
+
+    result = validator(value=test_file)
+
+    assert result == {"status": False, "message": "File content does not match the png format"}
+
+
+@pytest.mark.django_db
+def test_validate_temporary_uploaded_file() -> None:
+    """Checks that uploads streamed to temporary files are validated by their size and leading bytes only."""
+
+    test_file = TemporaryUploadedFile('test.pdf', 'application/pdf', size=0, charset=None)
+    test_file.write(b'%PDF-1.4\n' + b'0' * 1_000_000)
+    test_file.size = test_file.tell()
+
+    assert ValidateFileExtensions(available_extensions=["pdf"])(value=test_file) == {"status": True}
+    assert ValidateFileSize(max_size=10_000_000)(value=test_file) == {"status": True}
+    assert test_file.tell() == test_file.size
+    test_file.close()
+
+
 @pytest.mark.django_db
 def test_validate_max_tag_count_successfully() -> None:
     """Checks correctness of max tag count validation when passed valid value."""
@@ -1,5 +1,4 @@
 import re
-import sys
 import tempfile
 from io import BytesIO
 
@@ -35,7 +34,12 @@ def get_test_image() -> InMemoryUploadedFile:
     image = Image.new('RGB', (100, 100))
     image.save(output, format='PNG', quality=100)
     return InMemoryUploadedFile(
-        file=output, field_name=None, name="test.png", content_type="image/png", size=10, charset=None
+        file=output,
+        field_name=None,
+        name="test.png",
+        content_type="image/png",
+        size=output.getbuffer().nbytes,
+        charset=None,
     )
 
 
@@ -66,7 +70,7 @@ def get_test_pdf() -> InMemoryUploadedFile:
             field_name=None,
             name="test.pdf",
             content_type="application/pdf",
-            size=sys.getsizeof(file),
+            size=output.getbuffer().nbytes,
             charset=None,
         )
 
@@ -2,20 +2,67 @@
 Custom logging formatter.
 """
 
+from __future__ import annotations
+
+import json
 import logging
+from datetime import datetime, timezone
+from typing import Any
+
+# Attributes every log record has, the other ones are passed by `extra` and rendered as the record context.
+# The record of an empty message gets the same attributes as any other record of this Python version.
+RESERVED_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord('', 0, '', 0, None, None, None, None, None).__dict__
+) | frozenset(('message', 'asctime'))
 
 
 class ContextFormatter(logging.Formatter):
-    """Custom context logging formatter."""
+    """Custom context logging formatter.
+
+    Formats records by the format string and appends their context: `... Context: (key=value)| (key=value)| `.
+    With `json_lines=True` every record is a JSON object in one line with the context in the "context" key,
+    the format string is not used then.
+    """
+
+    def __init__(self, *args: Any, json_lines: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.json_lines = json_lines
 
     def format(self, record: logging.LogRecord) -> str:  # noqa
         """Formatted logging data."""
+        if self.json_lines:
+            return self.format_json_line(record)
+
         formatted_message: str = super().format(record=record)
-        default_log_record = logging.LogRecord('', 0, "", 0, None, None, None, None, None)
-        context_message = 'Context: '
-        for key, value in record.__dict__.items():
-            if key not in default_log_record.__dict__ and key not in ('message', 'asctime'):
-                context_message += f'({key}={value})| '
-        if context_message != 'Context: ':
-            formatted_message = formatted_message + ' ' + context_message
-        return formatted_message
+        context = [f'({key}={value})| ' for key, value in self.get_context(record).items()]
+        if not context:
+            return formatted_message
+        return ''.join((formatted_message, ' Context: ', *context))
+
+    def format_json_line(self, record: logging.LogRecord) -> str:
+        """Formats the record as a JSON object, values that are not serializable are converted to strings."""
+        data = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exception'] = record.exc_text
+        if record.stack_info:
+            data['stack'] = self.formatStack(record.stack_info)
+        context = self.get_context(record)
+        if context:
+            data['context'] = context
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+    @staticmethod
+    def get_context(record: logging.LogRecord) -> dict[str, Any]:
+        """Gets attributes of the record passed by `extra`."""
+        return {key: value for key, value in record.__dict__.items() if key not in RESERVED_RECORD_ATTRIBUTES}
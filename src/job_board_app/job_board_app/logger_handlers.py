@@ -0,0 +1,143 @@
+"""
+Custom logging handlers.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from typing import Sequence
+
+OVERFLOW_POLICIES = ('drop', 'block')
+
+
+class DrainingQueueListener(QueueListener):
+    """Queue listener that waits for a free place in the full queue to put the stop sentinel."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class ListenerQueueHandler(QueueHandler):
+    """Puts records to a bounded queue, a listener thread passes them to `handlers` that format and write them.
+
+    Logging threads do not wait for I/O of the handlers. When the queue of `maxsize` records is full, records
+    are dropped with the "drop" overflow policy or the logging thread waits up to `block_timeout` seconds for
+    a free place with the "block" policy and drops the record after it. The number of dropped records is logged
+    after the next record put to the queue. Records left in the queue are written when the handler is closed,
+    which `logging.shutdown` does at exit.
+    """
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        maxsize: int = 10000,
+        overflow: str = 'drop',
+        block_timeout: float = 1,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f'Unknown overflow policy {overflow!r}, expected one of {OVERFLOW_POLICIES}.')
+        # Items of lists passed by `logging.config.dictConfig` resolve "cfg://handlers.<name>" on indexing only.
+        self.handlers = [handlers[index] for index in range(len(handlers))]
+        for handler in self.handlers:
+            if not isinstance(handler, logging.Handler):
+                raise ValueError(f'{handler!r} is not a configured handler, list handlers configured before it.')
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.dropped_records = 0
+        super().__init__(queue.Queue(maxsize))
+        self._start_listener()
+        _listener_queue_handlers.add(self)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Puts the record to the queue, then the record about dropped ones if records have been dropped."""
+        try:
+            self._put(record)
+        except queue.Full:
+            self.dropped_records += 1
+            return
+        if self.dropped_records:
+            self._put_dropped_records_record()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copies the record with the merged message, the listener thread formats it.
+
+        Arguments are merged in the logging thread, so objects passed as them are not used by another thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def flush(self) -> None:
+        """Waits until the listener thread handles records put to the queue and flushes the handlers."""
+        if self.listening:
+            self.queue.join()
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Stops the listener thread after it handles records put to the queue."""
+        if self.listening:
+            if self.dropped_records:
+                self._put_dropped_records_record(block=True)
+            self.listener.stop()
+            self.listening = False
+        super().close()
+
+    def _put(self, record: logging.LogRecord) -> None:
+        if self.overflow == 'block':
+            self.queue.put(record, timeout=self.block_timeout)
+        else:
+            self.queue.put_nowait(record)
+
+    def _put_dropped_records_record(self, block: bool = False) -> None:
+        record = logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            '%s log records have been dropped, the logging queue is full.',
+            (self.dropped_records,),
+            None,
+        )
+        try:
+            if block:
+                self.queue.put(record)
+            else:
+                self._put(record)
+        except queue.Full:
+            return
+        self.dropped_records = 0
+
+    def _start_listener(self) -> None:
+        self.listener = DrainingQueueListener(self.queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+        self.listening = True
+
+    def _restart_after_fork(self) -> None:
+        """Starts a new listener thread in the child process, the thread of the parent process is not copied to it.
+
+        Records left in the queue of the parent process are written by it, the child process gets a new queue.
+        """
+        if self.listening:
+            self.queue = queue.Queue(self.maxsize)
+            self.dropped_records = 0
+            self._start_listener()
+
+
+_listener_queue_handlers: weakref.WeakSet[ListenerQueueHandler] = weakref.WeakSet()
+
+
+def _restart_listeners_after_fork() -> None:
+    for handler in list(_listener_queue_handlers):
+        handler._restart_after_fork()  # pylint: disable=protected-access
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
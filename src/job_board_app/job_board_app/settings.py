@@ -16,6 +16,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from job_board_app.logger_formatter import ContextFormatter
+from job_board_app.logger_handlers import ListenerQueueHandler
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -41,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.forms',
+    'django.contrib.postgres',
     "rest_framework",
     "rest_framework.authtoken",
     # internal
@@ -143,8 +145,23 @@ MEDIA_ROOT = os.path.join(BASE_DIR.parents[2], "media_files", "job_board_app")
 
 MEDIA_URL = "media/"
 
+# Uploaded files larger than FILE_UPLOAD_MAX_MEMORY_SIZE bytes are streamed to temporary files instead of memory
+# and moved into the media storage without reading them again
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024
 
-# Logging settings
+
+# Logging settings (LOG_FORMATTER is "main_format" for text lines or "json_lines_format" for JSON objects
+# in lines read by log shippers)
+
+LOG_FORMATTER = os.environ.get("LOG_FORMATTER", "main_format")
+
+# Loggers put records to a queue of LOG_QUEUE_SIZE records, the console and file handlers format and write them
+# in a listener thread. When the queue is full, records are dropped (LOG_QUEUE_OVERFLOW = "drop") or the logging
+# thread waits up to LOG_QUEUE_BLOCK_TIMEOUT seconds for a free place and drops the record after it ("block")
+
+LOG_QUEUE_SIZE = 10000
+LOG_QUEUE_OVERFLOW = "drop"
+LOG_QUEUE_BLOCK_TIMEOUT = 1
 
 LOGGING = {
     'version': 1,
@@ -156,34 +173,47 @@ LOGGING = {
             'datefmt': '%Y-%m-%d %H:%M:%S',
             'style': "{",
         },
+        'json_lines_format': {
+            '()': ContextFormatter,
+            'json_lines': True,
+        },
     },
     'handlers': {
         'console_handler': {
             'class': 'logging.StreamHandler',
-            'formatter': 'main_format',
+            'formatter': LOG_FORMATTER,
             'level': os.environ['LOG_LEVEL'],
         },
         'file_handler': {
             'class': 'logging.FileHandler',
-            'formatter': 'main_format',
+            'formatter': LOG_FORMATTER,
             'filename': 'inform.log',
             'level': os.environ["LOG_LEVEL"],
         },
+        # Configured after the handlers it refers to, handlers are configured in the order of their names
+        'queue_handler': {
+            '()': ListenerQueueHandler,
+            'handlers': ['cfg://handlers.console_handler', 'cfg://handlers.file_handler'],
+            'maxsize': LOG_QUEUE_SIZE,
+            'overflow': LOG_QUEUE_OVERFLOW,
+            'block_timeout': LOG_QUEUE_BLOCK_TIMEOUT,
+            'level': os.environ["LOG_LEVEL"],
+        },
     },
     'loggers': {
         'root': {
-            'handlers': ['console_handler', 'file_handler'],
+            'handlers': ['queue_handler'],
             'level': 'INFO' if not DEBUG else 'DEBUG',
             'propagate': False,
         },
         'django': {
             'level': os.environ["LOG_LEVEL"],
-            'handlers': ['console_handler', 'file_handler'],
+            'handlers': ['queue_handler'],
             'propagate': False,
         },
         "PIL": {
             "level": 'WARNING',
-            'handlers': ['console_handler', 'file_handler'],
+            'handlers': ['queue_handler'],
         },
     },
 }
@@ -194,6 +224,32 @@ LOG_LEVEL = os.environ["LOG_LEVEL"]
 
 CONFIRMATION_CODE_LIVETIME = 3600
 
+# Vacancy search settings (text search configuration of the vacancies search vector and
+# minimal trigram word similarity of the fuzzy search mode)
+
+FULL_TEXT_SEARCH_CONFIG = "english"
+TRIGRAM_SIMILARITY_THRESHOLD = 0.3
+
+# Vacancy facets settings (maximum number of options per facet group and cache lifetime of counts
+# in seconds, 0 disables the cache)
+
+VACANCY_FACET_SIZE = 20
+VACANCY_FACETS_CACHE_TIMEOUT = 30
+
+# Vacancies search cache settings (lifetime in seconds of cached counts and page ids of search results,
+# 0 disables the cache)
+
+VACANCY_SEARCH_CACHE_TIMEOUT = 300
+
+# Vacancies lists are served from the flattened VacancyListing read model when it supports the filters
+
+VACANCY_LISTINGS_ENABLED = True
+
+# Vacancies import settings (number of rows inserted by one transaction and maximum number of reported row errors)
+
+VACANCY_IMPORT_CHUNK_SIZE = 500
+VACANCY_IMPORT_MAX_REPORTED_ERRORS = 100
+
 # SMTP server settings
 
 EMAIL_HOST = os.environ['EMAIL_HOST']
@@ -207,6 +263,56 @@ EMAIL_FROM = os.environ['EMAIL_FROM']
 
 SERVER_HOST = os.environ['SERVER_HOST']
 
+# QR codes of vacancies are generated by the adapter implementing QRApiAdapterProtocol: QRLocalAdapter renders
+# them in process, QRApiAdapter requests them from the external QR API. To use the API, set BACKEND to
+# core.business_logic.services.common.QRApiAdapter and pass its URL as the "base_url" option.
+# Generated images of QR_CODE_SIZE pixels are stored once per encoded data in QR_CODES_DIRECTORY of the media storage.
+
+QR_API_ADAPTER = {
+    "BACKEND": "core.business_logic.services.common.QRLocalAdapter",
+    "OPTIONS": {},
+}
+QR_CODE_SIZE = 150
+QR_CODES_DIRECTORY = "vacancy_qr"
+
+# Resized image variants (fitting into (width, height)) in WebP or the source format, stored in
+# IMAGE_VARIANTS_DIRECTORY of the media storage and cached by clients for IMAGE_VARIANTS_CACHE_MAX_AGE seconds.
+# Variants of company logos are generated by background jobs in a pool of IMAGE_PROCESSING_WORKERS processes
+# (0 processes them in the worker itself), other variants on the first request. The COMPANY_LOGO_VARIANT variant
+# in the source format is used as the logo of the company profile.
+
+IMAGE_PROCESSING_WORKERS = 2
+COMPANY_LOGO_VARIANT = "medium"
+
+IMAGE_VARIANTS = {
+    "small": (64, 48),
+    "medium": (200, 150),
+    "large": (400, 300),
+}
+IMAGE_VARIANTS_QUALITY = 80
+IMAGE_VARIANTS_DIRECTORY = "image_variants"
+IMAGE_VARIANTS_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+
+# Outbound HTTP client settings (keep-alive connections per external service, timeouts in seconds, retries of
+# failed requests with jittered backoff starting from HTTP_CLIENT_RETRY_BACKOFF seconds, consecutive failed calls
+# that open the circuit breaker and seconds before it lets a trial call through)
+
+HTTP_CLIENT_POOL_SIZE = 10
+HTTP_CLIENT_CONNECT_TIMEOUT = 3.05
+HTTP_CLIENT_READ_TIMEOUT = 10
+HTTP_CLIENT_MAX_RETRIES = 2
+HTTP_CLIENT_RETRY_BACKOFF = 0.2
+HTTP_CLIENT_CIRCUIT_BREAKER_FAILURES = 5
+HTTP_CLIENT_CIRCUIT_BREAKER_RESET_TIMEOUT = 30
+
+# Background jobs settings (number of attempts, backoff in seconds before the first retry that is doubled
+# after every failed attempt, its maximum, and timeout in seconds after which jobs of crashed workers are retried)
+
+BACKGROUND_JOBS_MAX_ATTEMPTS = 5
+BACKGROUND_JOBS_RETRY_BACKOFF = 10
+BACKGROUND_JOBS_MAX_RETRY_BACKOFF = 600
+BACKGROUND_JOBS_LOCK_TIMEOUT = 300
+
 
 CACHES = {
     "default": {